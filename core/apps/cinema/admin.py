@@ -1,27 +1,100 @@
-from apps.cinema.models import CinemaHall, Movie, Reservation, ReservationSeat, Seat, Showtime
-from django.contrib import admin
+import io
+import re
+
+from apps.cinema.exports import RESERVATION_EXPORT_COLUMNS, reservation_csv_rows, reservation_export_rows
+from apps.cinema.forms.admin_forms import CinemaHallAdminForm, ShowtimeImportForm
+from apps.cinema.models import CinemaHall, Movie, Reservation, ReservationSeat, Seat, Showtime, ShowtimeTemplate
+from apps.cinema.pages import invalidate_showtime_pages
+from apps.cinema.scheduling import generate_template_showtimes, import_showtimes
+from django.contrib import admin, messages
+from django.core.exceptions import PermissionDenied
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.db.models.functions import Now
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.urls import path
+from django.utils.text import smart_split, unescape_string_literal
 from django.utils.translation import gettext_lazy as _
+from utils.admin.filters import AutocompleteFilter, AutocompleteFilterMixin
+from utils.streaming import streaming_csv_response, streaming_ndjson_response
 
+SEAT_LABEL_RE = re.compile(r"[A-Za-z]{1,3}\d+")
 
-class SeatInline(admin.TabularInline):
-    model = Seat
-    extra = 0
-    fields = ("row", "seat_number", "label")
-    readonly_fields = ("label",)
+
+class SeatLabelSearchMixin:
+    """
+    Also match search terms shaped like a seat label (e.g. "F12") exactly against the indexed
+    label column, on top of the regular ``search_fields`` (a hall may be called "VIP2").
+    """
+    seat_label_field = "label"
+
+    def get_search_results(self, request, queryset, search_term):
+        may_have_duplicates = False
+        # Terms are searched one at a time so the label match is ORed into that term only.
+        for term in smart_split(search_term):
+            matches, duplicates = super().get_search_results(request, queryset, term)  # type: ignore[misc]
+            may_have_duplicates |= duplicates
+            value = unescape_string_literal(term) if term.startswith(('"', "'")) and term[0] == term[-1] else term
+            if SEAT_LABEL_RE.fullmatch(value):
+                matches |= queryset.filter(**{self.seat_label_field: value.upper()})
+            queryset = matches
+        return queryset, may_have_duplicates
+
+
+class SeatCountersAdminMixin:
+    """
+    Recount the seat counters of the showtimes touched by admin edits, which bypass
+    ``ReservationService``.
+    """
+    # Lookup from Showtime to the administered model.
+    showtime_lookup: str
+
+    def get_showtime_ids(self, pks) -> set[int]:
+        return set(
+            Showtime.objects.filter(**{f"{self.showtime_lookup}__in": pks}).values_list("pk", flat=True)
+        )
+
+    def save_model(self, request, obj, form, change):
+        obj._counter_showtime_ids = self.get_showtime_ids([obj.pk]) if change else set()
+        super().save_model(request, obj, form, change)  # type: ignore[misc]
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)  # type: ignore[misc]
+        showtime_ids: set[int] = getattr(form.instance, "_counter_showtime_ids", set())
+        showtime_ids |= self.get_showtime_ids([form.instance.pk])
+        self.refresh_showtimes(showtime_ids)
+
+    def delete_model(self, request, obj):
+        showtime_ids = self.get_showtime_ids([obj.pk])
+        super().delete_model(request, obj)  # type: ignore[misc]
+        self.refresh_showtimes(showtime_ids)
+
+    def delete_queryset(self, request, queryset):
+        showtime_ids = self.get_showtime_ids(queryset.values("pk"))
+        super().delete_queryset(request, queryset)  # type: ignore[misc]
+        self.refresh_showtimes(showtime_ids)
+
+    @staticmethod
+    def refresh_showtimes(showtime_ids: set[int]) -> None:
+        showtimes = Showtime.objects.filter(pk__in=showtime_ids)
+        showtimes.refresh_seat_counters()
+        # Seats may have been swapped without changing any count.
+        showtimes.bump_occupancy_version()
+        invalidate_showtime_pages(showtimes.values_list("hall_id", "start_time"))
 
 
 @admin.register(CinemaHall)
 class CinemaHallAdmin(admin.ModelAdmin):
-    list_display = ("name", "rows", "seats_per_row", "total_seats")
+    form = CinemaHallAdminForm
+    list_display = ("name", "rows", "seats_per_row", "seat_count")
     search_fields = ("name",)
     ordering = ("name",)
-    inlines = [SeatInline]
     fieldsets = (
         (_("Basic Info"), {
             "fields": ("name",)
         }),
         (_("Seating Info"), {
-            "fields": ("rows", "seats_per_row")
+            "fields": ("rows", "seats_per_row", "seat_layout")
         }),
         (_("Media"), {
             "fields": ("image",)
@@ -33,12 +106,17 @@ class CinemaHallAdmin(admin.ModelAdmin):
     )
     readonly_fields = ("created_at", "updated_at")
 
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        form.save_seat_layout()
+
 
 @admin.register(Seat)
-class SeatAdmin(admin.ModelAdmin):
+class SeatAdmin(SeatCountersAdminMixin, SeatLabelSearchMixin, AutocompleteFilterMixin, admin.ModelAdmin):
+    showtime_lookup = "reservations__reserved_seats__seat"
     list_display = ("label", "hall", "row", "seat_number", "created_at")
-    list_filter = ("hall",)
-    search_fields = ("label", "hall__name")
+    list_filter = (("hall", AutocompleteFilter),)
+    search_fields = ("hall__name",)
     ordering = ("hall", "row", "seat_number")
     fieldsets = (
         (None, {
@@ -49,7 +127,11 @@ class SeatAdmin(admin.ModelAdmin):
             "classes": ("collapse",)
         }),
     )
-    readonly_fields = ("created_at", "updated_at")
+    readonly_fields = ("label", "created_at", "updated_at")
+
+    def get_queryset(self, request):
+        # Seat.__str__ renders the hall name, also in autocomplete results.
+        return super().get_queryset(request).select_related("hall")
 
 
 @admin.register(Movie)
@@ -69,22 +151,113 @@ class MovieAdmin(admin.ModelAdmin):
     readonly_fields = ("created_at", "updated_at")
 
 
+@admin.register(ShowtimeTemplate)
+class ShowtimeTemplateAdmin(AutocompleteFilterMixin, admin.ModelAdmin):
+    list_display = ("movie", "hall", "starts_on", "ends_on", "weekdays", "times")
+    list_select_related = ("movie", "hall")
+    list_filter = (("hall", AutocompleteFilter), ("movie", AutocompleteFilter))
+    search_fields = ("movie__title", "hall__name")
+    autocomplete_fields = ("movie", "hall")
+    ordering = ("-starts_on",)
+    actions = ("generate_showtimes",)
+    readonly_fields = ("created_at", "updated_at")
+
+    @admin.action(description=_("Generate showtimes from selected templates"))
+    def generate_showtimes(self, request, queryset):
+        for template in queryset.select_related("movie", "hall"):
+            result = generate_template_showtimes(template)
+            self.message_user(
+                request,
+                _("%(template)s: %(created)d created, %(deleted)d removed, %(unchanged)d unchanged.") % {
+                    "template": template,
+                    "created": len(result.created),
+                    "deleted": result.deleted,
+                    "unchanged": result.unchanged,
+                },
+                messages.SUCCESS
+            )
+            if result.kept_reserved or result.conflicts:
+                self.message_user(
+                    request,
+                    _("%(template)s: kept %(kept)d outdated showtime(s) with reservations, "
+                      "skipped %(skipped)d conflicting slot(s).") % {
+                        "template": template,
+                        "kept": len(result.kept_reserved),
+                        "skipped": len({conflict.planned.key for conflict in result.conflicts}),
+                    },
+                    messages.WARNING
+                )
+
+
 @admin.register(Showtime)
-class ShowtimeAdmin(admin.ModelAdmin):
-    list_display = ("movie", "hall", "start_time", "is_expired", "created_at")
-    list_filter = ("hall", "movie", "start_time")
+class ShowtimeAdmin(AutocompleteFilterMixin, admin.ModelAdmin):
+    list_display = ("movie", "hall", "start_time", "is_expired", "reserved_count", "created_at")
+    list_filter = (("hall", AutocompleteFilter), ("movie", AutocompleteFilter), "start_time")
     search_fields = ("movie__title", "hall__name")
+    autocomplete_fields = ("movie", "hall")
     ordering = ("-start_time",)
     fieldsets = (
         (_("Showtime Info"), {
             "fields": ("movie", "hall", "start_time")
         }),
+        (_("Occupancy"), {
+            "fields": ("reserved_count", "pending_count")
+        }),
         (_("Timestamps"), {
             "fields": ("created_at", "updated_at"),
             "classes": ("collapse",)
         }),
     )
-    readonly_fields = ("created_at", "updated_at", "is_expired")
+    readonly_fields = ("created_at", "updated_at", "is_expired", "reserved_count", "pending_count")
+    change_list_template = "admin/cinema/showtime/change_list.html"
+
+    def get_urls(self):
+        return [
+            path(
+                "import/",
+                self.admin_site.admin_view(self.import_view),
+                name="cinema_showtime_import"
+            ),
+            *super().get_urls(),
+        ]
+
+    def import_view(self, request):
+        if not self.has_add_permission(request):
+            raise PermissionDenied
+        result = None
+        form = ShowtimeImportForm(request.POST or None, request.FILES or None)
+        if form.is_valid():
+            dry_run = form.cleaned_data["dry_run"]
+            with io.TextIOWrapper(form.cleaned_data["file"].file, encoding="utf-8-sig", newline="") as csv_file:
+                try:
+                    result = import_showtimes(csv_file, dry_run=dry_run)
+                except UnicodeDecodeError:
+                    form.add_error("file", _("The file is not UTF-8 encoded CSV."))
+            if result is not None and not dry_run and not result.rejected:
+                self.message_user(request, _("Created %d showtime(s).") % len(result.created), messages.SUCCESS)
+                return redirect("admin:cinema_showtime_changelist")
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": self.model._meta,
+            "title": _("Import showtimes"),
+            "form": form,
+            "result": result,
+            "problems": [*result.errors, *result.conflict_messages()] if result else [],
+        }
+        return TemplateResponse(request, "admin/cinema/showtime/import.html", context)
+
+    def get_queryset(self, request):
+        # Showtime.__str__ renders the movie and hall, also in autocomplete results.
+        return (
+            super().get_queryset(request)
+            .select_related("movie", "hall")
+            .with_end_time()  # type: ignore[attr-defined]
+            .annotate(expired=ExpressionWrapper(Q(end_time__lt=Now()), output_field=BooleanField()))
+        )
+
+    @admin.display(description=_("is expired"), boolean=True, ordering="end_time")
+    def is_expired(self, obj: Showtime) -> bool | None:
+        return getattr(obj, "expired", None)
 
 
 class ReservationSeatInline(admin.TabularInline):
@@ -93,14 +266,21 @@ class ReservationSeatInline(admin.TabularInline):
     fields = ("seat",)
     autocomplete_fields = ("seat",)
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("seat__hall")
+
 
 @admin.register(Reservation)
-class ReservationAdmin(admin.ModelAdmin):
+class ReservationAdmin(SeatCountersAdminMixin, admin.ModelAdmin):
+    showtime_lookup = "reservations"
     list_display = ("user", "showtime", "status", "reserved_at")
+    list_select_related = ("user", "showtime__movie", "showtime__hall")
     list_filter = ("status", "reserved_at")
-    search_fields = ("user__username", "showtime__movie__title")
+    search_fields = ("user__email", "showtime__movie__title")
+    autocomplete_fields = ("user", "showtime")
     ordering = ("-reserved_at",)
     inlines = [ReservationSeatInline]
+    actions = ("export_csv", "export_ndjson")
     fieldsets = (
         (_("Reservation Info"), {
             "fields": ("user", "showtime", "status")
@@ -112,12 +292,31 @@ class ReservationAdmin(admin.ModelAdmin):
     )
     readonly_fields = ("reserved_at", "created_at", "updated_at")
 
+    @admin.action(description=_("Export selected reservations as CSV"))
+    def export_csv(self, request, queryset):
+        return streaming_csv_response(
+            "reservations.csv", RESERVATION_EXPORT_COLUMNS, reservation_csv_rows(reservation_export_rows(queryset))
+        )
+
+    @admin.action(description=_("Export selected reservations as NDJSON"))
+    def export_ndjson(self, request, queryset):
+        return streaming_ndjson_response("reservations.ndjson", reservation_export_rows(queryset))
+
 
 @admin.register(ReservationSeat)
-class ReservationSeatAdmin(admin.ModelAdmin):
+class ReservationSeatAdmin(SeatCountersAdminMixin, SeatLabelSearchMixin, AutocompleteFilterMixin, admin.ModelAdmin):
+    showtime_lookup = "reservations__reserved_seats"
     list_display = ("seat", "reservation", "created_at")
-    search_fields = ("seat__label", "reservation__user__username")
-    list_filter = ("seat__hall",)
+    list_select_related = (
+        "seat__hall",
+        "reservation__user",
+        "reservation__showtime__movie",
+        "reservation__showtime__hall",
+    )
+    search_fields = ("reservation__user__email",)
+    seat_label_field = "seat__label"
+    list_filter = (("seat__hall", AutocompleteFilter),)
+    autocomplete_fields = ("seat", "reservation")
     ordering = ("-created_at",)
     fieldsets = (
         (_("Reservation Seat Info"), {
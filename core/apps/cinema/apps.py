@@ -6,4 +6,6 @@ class CinemaConfig(AppConfig):
     name = 'apps.cinema'
 
     def ready(self):
+        import apps.cinema.notifications  # noqa
         import apps.cinema.receivers  # noqa
+        import apps.cinema.tasks  # noqa
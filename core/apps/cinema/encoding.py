@@ -0,0 +1,159 @@
+"""
+Compact wire format for a showtime's seat grid.
+
+Cells are numbered row-major from 0 (``(row - 1) * cols + seat_number - 1``) and labels are
+left to the client since they derive from the coordinates. A payload looks like::
+
+    {
+        "v": 1,
+        "rows": 40,
+        "cols": 50,
+        "seats": null,                             # every cell has a seat, else a cell mask
+        "ids": {"base": 811, "runs": [[1, 1999]]}, # id deltas in cell order, run-length encoded
+        "reserved": {"runs": [12, 3, 1985]},       # cell mask, see encode_mask()
+    }
+
+Labels number the seats of each row in order, so aisles and gaps are skipped. When the
+seats follow the hall's stored layout mask (see ``CinemaHall.layout``), ``seats`` carries that
+mask as is.
+
+A fully built 2,000-seat hall with a block of reserved seats encodes to ~130 bytes,
+against ~45 KB as per-seat JSON.
+"""
+import base64
+import json
+from collections.abc import Iterable
+from typing import Any
+
+FORMAT_VERSION = 1
+
+
+def pack_bits(cells: Iterable[int], size: int) -> bytes:
+    """
+    Pack cell indices into a bitmask of ``size`` bits, most significant bit first.
+    """
+    bits = bytearray((size + 7) // 8)
+    for cell in cells:
+        bits[cell // 8] |= 0x80 >> (cell % 8)
+    return bytes(bits)
+
+
+def unpack_bits(bits: bytes, size: int, start: int = 0) -> list[int]:
+    """
+    Reverse ``pack_bits``: the set cell indices from ``start`` up to ``size``, in order.
+    """
+    return [cell for cell in range(start, min(size, len(bits) * 8)) if bits[cell // 8] & (0x80 >> (cell % 8))]
+
+
+def encode_mask(cells: Iterable[int], size: int) -> dict[str, Any]:
+    """
+    Encode a set of cell indices as whichever is shorter: a base64 bitmask (``bits``, see
+    ``pack_bits()``) or alternating run lengths starting with unset cells (``runs``).
+    """
+    cells = sorted(set(cells))
+    bits = pack_bits(cells, size)
+
+    runs: list[int] = []
+    position = 0
+    for cell in cells:
+        if runs and cell == position:
+            # Adjacent to the previous set cell: the last run is a set run, extend it.
+            runs[-1] += 1
+        else:
+            runs.extend((cell - position, 1))
+        position = cell + 1
+    if position < size:
+        runs.append(size - position)
+
+    encoded_bits = base64.b64encode(bits).decode()
+    if len(json.dumps(runs, separators=(",", ":"))) < len(encoded_bits):
+        return {"runs": runs}
+    return {"bits": encoded_bits}
+
+
+def decode_mask(mask: dict[str, Any], size: int) -> set[int]:
+    if "runs" in mask:
+        cells: set[int] = set()
+        position = 0
+        for index, length in enumerate(mask["runs"]):
+            if index % 2:
+                cells.update(range(position, position + length))
+            position += length
+        return cells
+    return set(unpack_bits(base64.b64decode(mask["bits"]), size))
+
+
+def encode_ids(ids: list[int]) -> dict[str, Any]:
+    """
+    Encode seat ids (in cell order) as the first id plus run-length encoded deltas; seats
+    created in one bulk insert collapse to a single ``[1, count - 1]`` run.
+    """
+    runs: list[list[int]] = []
+    for previous, current in zip(ids, ids[1:]):
+        delta = current - previous
+        if runs and runs[-1][0] == delta:
+            runs[-1][1] += 1
+        else:
+            runs.append([delta, 1])
+    return {"base": ids[0] if ids else None, "runs": runs}
+
+
+def decode_ids(encoded: dict[str, Any]) -> list[int]:
+    if encoded["base"] is None:
+        return []
+    ids = [encoded["base"]]
+    for delta, count in encoded["runs"]:
+        for _ in range(count):
+            ids.append(ids[-1] + delta)
+    return ids
+
+
+def encode_seat_map(
+    rows: int,
+    cols: int,
+    seats: Iterable[tuple[int, int, int]],
+    reserved_ids: Iterable[int],
+    layout: bytes | None = None
+) -> dict[str, Any]:
+    """
+    Encode ``(id, row, seat_number)`` seats and the reserved seat ids of one showtime.
+
+    ``layout`` is the hall's packed layout mask; it is sent unchanged when the seats match it.
+    Seats left outside the grid by a hall resize are skipped.
+    """
+    size = rows * cols
+    cells = {
+        (row - 1) * cols + seat_number - 1: seat_id
+        for seat_id, row, seat_number in seats
+        if 1 <= row <= rows and 1 <= seat_number <= cols
+    }
+    ordered = sorted(cells)
+    reserved_ids = set(reserved_ids)
+    if len(ordered) == size:
+        seats_mask = None
+    elif layout is not None and pack_bits(ordered, size) == layout:
+        seats_mask = {"bits": base64.b64encode(layout).decode()}
+    else:
+        seats_mask = encode_mask(ordered, size)
+    return {
+        "v": FORMAT_VERSION,
+        "rows": rows,
+        "cols": cols,
+        "seats": seats_mask,
+        "ids": encode_ids([cells[cell] for cell in ordered]),
+        "reserved": encode_mask((cell for cell in ordered if cells[cell] in reserved_ids), size),
+    }
+
+
+def decode_seat_map(payload: dict[str, Any]) -> tuple[list[tuple[int, int, int]], set[int]]:
+    """
+    Reverse ``encode_seat_map``: return the ``(id, row, seat_number)`` seats and reserved ids.
+    """
+    rows, cols = payload["rows"], payload["cols"]
+    size = rows * cols
+    cells = sorted(decode_mask(payload["seats"], size)) if payload["seats"] else list(range(size))
+    ids = decode_ids(payload["ids"])
+    reserved_cells = decode_mask(payload["reserved"], size)
+    seats = [(seat_id, cell // cols + 1, cell % cols + 1) for seat_id, cell in zip(ids, cells, strict=True)]
+    reserved = {seat_id for seat_id, cell in zip(ids, cells, strict=True) if cell in reserved_cells}
+    return seats, reserved
@@ -0,0 +1,52 @@
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from apps.cinema.models import Reservation, ReservationSeat
+from django.db.models import Prefetch, QuerySet
+from django.utils import timezone
+
+RESERVATION_EXPORT_COLUMNS = [
+    "reservation_id", "reserved_at", "status", "email", "movie", "hall", "start_time", "seats"
+]
+
+
+def reservation_export_rows(queryset: QuerySet[Reservation], chunk_size: int = 2000) -> Iterator[dict[str, Any]]:
+    """
+    Yield one row per reservation of ``queryset`` with its user, showtime and seat labels.
+
+    Reservations are read through a server-side cursor ``chunk_size`` at a time, with the
+    related rows joined in and the seats prefetched per chunk, so memory stays flat however
+    many rows the queryset matches.
+    """
+    seats = ReservationSeat.objects.select_related("seat").only("reservation_id", "seat__label").order_by(
+        "seat__row", "seat__seat_number"
+    )
+    reservations = (
+        queryset
+        .select_related("user", "showtime__movie", "showtime__hall")
+        .prefetch_related(Prefetch("reserved_seats", queryset=seats))
+        .only(
+            "reserved_at", "status", "user__email", "showtime__start_time", "showtime__movie__title",
+            "showtime__hall__name"
+        )
+        .order_by("pk")
+    )
+    for reservation in reservations.iterator(chunk_size=chunk_size):
+        yield {
+            "reservation_id": reservation.pk,
+            "reserved_at": timezone.localtime(reservation.reserved_at).isoformat(),
+            "status": reservation.status,
+            "email": reservation.user.email,
+            "movie": reservation.showtime.movie.title,
+            "hall": reservation.showtime.hall.name,
+            "start_time": timezone.localtime(reservation.showtime.start_time).isoformat(),
+            "seats": [reserved_seat.seat.label for reserved_seat in reservation.reserved_seats.all()],
+        }
+
+
+def reservation_csv_rows(rows: Iterable[dict[str, Any]]) -> Iterator[list[Any]]:
+    """
+    Flatten export rows for ``csv_chunks()``, with the seat labels space-separated.
+    """
+    for row in rows:
+        yield [" ".join(row[column]) if column == "seats" else row[column] for column in RESERVATION_EXPORT_COLUMNS]
@@ -0,0 +1,186 @@
+import json
+from functools import reduce
+from operator import or_
+from typing import Any
+
+from apps.cinema.forms.widgets import SeatGridWidget
+from apps.cinema.models import ACTIVE_RESERVATION_STATUSES, CinemaHall, ReservationSeat, Seat
+from django import forms
+from django.core.exceptions import ValidationError
+from django.db.models import Exists, OuterRef, Q
+from django.utils.translation import gettext_lazy as _
+
+Cell = tuple[int, int]
+
+
+def cells_filter(cells: set[Cell]) -> Q:
+    """
+    Build a filter matching the given (row, seat_number) cells, one condition per row.
+    """
+    rows: dict[int, list[int]] = {}
+    for row, seat_number in cells:
+        rows.setdefault(row, []).append(seat_number)
+    return reduce(or_, (Q(row=row, seat_number__in=numbers) for row, numbers in rows.items()))
+
+
+class SeatLayoutField(forms.Field):
+    """
+    Parses the changed cells submitted by the seat grid editor.
+    """
+    widget = SeatGridWidget
+    default_error_messages = {
+        "invalid": _("The seat layout changes could not be read."),
+    }
+
+    def to_python(self, value: Any) -> dict[str, set[Cell]]:
+        changes: dict[str, set[Cell]] = {"added": set(), "removed": set()}
+        if not value:
+            return changes
+        try:
+            data = json.loads(value)
+            for key in changes:
+                changes[key] = {(int(row), int(seat_number)) for row, seat_number in data.get(key, [])}
+        except (TypeError, ValueError, AttributeError):
+            raise ValidationError(self.error_messages["invalid"], code="invalid")
+        if changes["added"] & changes["removed"]:
+            raise ValidationError(self.error_messages["invalid"], code="invalid")
+        return changes
+
+
+class CinemaHallAdminForm(forms.ModelForm):
+    seat_layout = SeatLayoutField(
+        label=_("Seat layout"),
+        required=False,
+        help_text=_("Click a cell to add or remove a seat. Reserved seats cannot be removed."),
+    )
+
+    class Meta:
+        model = CinemaHall
+        fields = "__all__"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # The stored grid of an existing hall, to tell a resize apart from a new hall.
+        self.stored_dimensions = (self.instance.rows, self.instance.seats_per_row) if self.instance.pk else None
+        if self.instance.pk:
+            self.fields["seat_layout"].widget.layout = self.get_seat_layout()
+
+    def get_seat_layout(self) -> list[str]:
+        """
+        Build the compact layout of the hall from a single query.
+        """
+        hall = self.instance
+        active_reservations = ReservationSeat.objects.filter(
+            seat=OuterRef("pk"),
+            reservation__status__in=ACTIVE_RESERVATION_STATUSES
+        )
+        cells = [["0"] * hall.seats_per_row for _ in range(hall.rows)]
+        seats = Seat.objects.filter(hall=hall).values_list("row", "seat_number", Exists(active_reservations))
+        for row, seat_number, reserved in seats:
+            if 1 <= row <= hall.rows and 1 <= seat_number <= hall.seats_per_row:
+                cells[row - 1][seat_number - 1] = "2" if reserved else "1"
+        return ["".join(row_cells) for row_cells in cells]
+
+    def clean(self) -> dict[str, Any]:
+        cleaned_data = super().clean()
+        if cleaned_data is None:
+            # A parent clean() that only validates may return nothing; the data is unchanged.
+            cleaned_data = self.cleaned_data
+        if not self.instance.pk:
+            return cleaned_data
+        rows = cleaned_data.get("rows") or self.instance.rows
+        seats_per_row = cleaned_data.get("seats_per_row") or self.instance.seats_per_row
+        if rows < self.instance.rows or seats_per_row < self.instance.seats_per_row:
+            # Seats outside the new dimensions are deleted; reserved ones must stay.
+            outside = sorted(
+                ReservationSeat.objects.filter(
+                    Q(seat__row__gt=rows) | Q(seat__seat_number__gt=seats_per_row),
+                    seat__hall=self.instance,
+                    reservation__status__in=ACTIVE_RESERVATION_STATUSES
+                ).values_list("seat__label", flat=True).distinct()
+            )
+            if outside:
+                self.add_error(
+                    None,
+                    _("Reserved seats are outside of the new hall dimensions: %(labels)s")
+                    % {"labels": ", ".join(outside)}
+                )
+
+        changes = cleaned_data.get("seat_layout")
+        if not changes or not (changes["added"] or changes["removed"]):
+            return cleaned_data
+        for row, seat_number in changes["added"] | changes["removed"]:
+            if not (1 <= row <= rows and 1 <= seat_number <= seats_per_row):
+                self.add_error("seat_layout", _("Seat layout changes are outside of the hall dimensions."))
+                return cleaned_data
+
+        # Seats after a change in their row are renumbered; reserved seats must keep their labels.
+        changed_rows = {row for row, _ in changes["added"] | changes["removed"]}
+        row_seats = Seat.objects.filter(hall=self.instance, row__in=changed_rows).annotate(
+            reserved=Exists(ReservationSeat.objects.filter(
+                seat=OuterRef("pk"),
+                reservation__status__in=ACTIVE_RESERVATION_STATUSES
+            ))
+        ).values_list("row", "seat_number", "label", "reserved")
+        seats = {(row, seat_number): (label, reserved) for row, seat_number, label, reserved in row_seats}
+        labels = CinemaHall.number_cells((seats.keys() - changes["removed"]) | changes["added"])
+
+        removed = sorted(label for cell, (label, reserved) in seats.items() if reserved and cell in changes["removed"])
+        if removed:
+            self.add_error(
+                "seat_layout",
+                _("Reserved seats cannot be removed: %(labels)s") % {"labels": ", ".join(removed)}
+            )
+        renumbered = sorted(
+            label for cell, (label, reserved) in seats.items() if reserved and labels.get(cell, label) != label
+        )
+        if renumbered:
+            self.add_error(
+                "seat_layout",
+                _("These changes would renumber reserved seats: %(labels)s") % {"labels": ", ".join(renumbered)}
+            )
+        return cleaned_data
+
+    def save_seat_layout(self) -> None:
+        """
+        Apply the changed cells to the hall's seats in bulk, then store the resulting layout
+        mask and renumber the changed rows. Resizing an existing hall drops the seats outside
+        the new grid and puts a seat on every cell it gained.
+        """
+        changes = self.cleaned_data.get("seat_layout") or {"added": set(), "removed": set()}
+        hall = self.instance
+        resized = self.stored_dimensions not in (None, (hall.rows, hall.seats_per_row))
+        if not (changes["added"] or changes["removed"] or resized):
+            return
+        if resized:
+            old_rows, old_seats_per_row = self.stored_dimensions  # type: ignore[misc]
+            Seat.objects.filter(Q(row__gt=hall.rows) | Q(seat_number__gt=hall.seats_per_row), hall=hall).delete()
+            changes = {
+                "added": changes["added"] | {
+                    (row, seat_number)
+                    for row in range(1, hall.rows + 1)
+                    for seat_number in range(1, hall.seats_per_row + 1)
+                    if row > old_rows or seat_number > old_seats_per_row
+                },
+                "removed": changes["removed"],
+            }
+        if changes["removed"]:
+            Seat.objects.filter(cells_filter(changes["removed"]), hall=hall).delete()
+        existing = set(Seat.objects.filter(hall=hall).values_list("row", "seat_number"))
+        hall.set_layout(existing | changes["added"])
+        hall.save(update_fields=["layout", "updated_at"])
+        changed_rows = {row for row, _ in changes["added"] | changes["removed"]}
+        Seat.objects.relabel_rows(hall, changed_rows)
+        Seat.objects.bulk_create_cells(hall, sorted(changes["added"] - existing))
+
+
+class ShowtimeImportForm(forms.Form):
+    file = forms.FileField(
+        label=_("CSV file"),
+        help_text=_("Columns: hall, movie, start_time (e.g. 2026-11-01 18:30, in the site time zone).")
+    )
+    dry_run = forms.BooleanField(
+        label=_("Dry run"),
+        required=False,
+        help_text=_("Only check the rows without creating showtimes.")
+    )
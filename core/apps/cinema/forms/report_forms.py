@@ -0,0 +1,21 @@
+from datetime import timedelta
+
+from apps.cinema.reports import BREAKDOWNS
+from django import forms
+from django.core.exceptions import ValidationError
+from django.utils.timezone import localdate
+from django.utils.translation import gettext_lazy as _
+
+
+class OccupancyReportForm(forms.Form):
+    by = forms.ChoiceField(choices=[(name, name) for name in BREAKDOWNS], initial="movie", label=_("Breakdown"))
+    start = forms.DateField(required=False, label=_("From"))
+    end = forms.DateField(required=False, label=_("To"))
+
+    def clean(self):
+        cleaned_data = super().clean() or {}
+        cleaned_data["end"] = cleaned_data.get("end") or localdate()
+        cleaned_data["start"] = cleaned_data.get("start") or cleaned_data["end"] - timedelta(days=30)
+        if cleaned_data["start"] > cleaned_data["end"]:
+            raise ValidationError(_("The start date must not be after the end date."))
+        return cleaned_data
@@ -0,0 +1,25 @@
+from typing import Any
+
+from django import forms
+
+
+class SeatGridWidget(forms.Widget):
+    """
+    Hall layout editor rendered from a compact per-row representation.
+
+    Each row of ``layout`` is a string with one character per cell: "0" for an empty cell,
+    "1" for a seat and "2" for a seat held by an active reservation. The browser only
+    submits the toggled cells, never the whole grid.
+    """
+    template_name = "admin/cinema/widgets/seat_grid.html"
+    layout: list[str] | None = None
+
+    class Media:
+        css = {"all": ("css/admin/seat_grid.css",)}
+        js = ("js/admin/seat_grid.js",)
+
+    def get_context(self, name: str, value: Any, attrs: dict[str, Any] | None) -> dict[str, Any]:
+        context = super().get_context(name, value, attrs)
+        context["widget"]["layout"] = self.layout
+        context["widget"]["layout_id"] = f"{context['widget']['attrs'].get('id', name)}_layout"
+        return context
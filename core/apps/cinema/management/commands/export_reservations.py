@@ -0,0 +1,70 @@
+from argparse import ArgumentTypeError
+from datetime import date
+
+from apps.cinema.exports import RESERVATION_EXPORT_COLUMNS, reservation_csv_rows, reservation_export_rows
+from apps.cinema.models import Reservation, ReservationStatus
+from django.core.management.base import BaseCommand
+from django.utils.dateparse import parse_date
+from utils.streaming import csv_chunks, ndjson_chunks
+
+
+def date_argument(value: str) -> date:
+    try:
+        day = parse_date(value)
+    except ValueError:
+        day = None
+    if day is None:
+        raise ArgumentTypeError(f"{value!r} is not a valid YYYY-MM-DD date.")
+    return day
+
+
+class Command(BaseCommand):
+    help = "Export reservations with their user, showtime and seats as CSV or NDJSON in constant memory."
+    exported = 0
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=("csv", "ndjson"), default="csv")
+        parser.add_argument("--output", default="-", help="File to write to; '-' writes to stdout.")
+        parser.add_argument("--status", action="append", choices=ReservationStatus.values, dest="statuses")
+        parser.add_argument("--showtime", type=int, action="append", dest="showtime_ids", help="Showtime ID to export.")
+        parser.add_argument("--since", type=date_argument, help="Only reservations made on or after this date.")
+        parser.add_argument("--until", type=date_argument, help="Only reservations made on or before this date.")
+        parser.add_argument("--chunk-size", type=int, default=2000)
+        parser.add_argument("--progress-every", type=int, default=10000, help="Report progress every N rows.")
+
+    def handle(self, *args, **options):
+        queryset = Reservation.objects.all()
+        if options["statuses"]:
+            queryset = queryset.filter(status__in=options["statuses"])
+        if options["showtime_ids"]:
+            queryset = queryset.filter(showtime_id__in=options["showtime_ids"])
+        if options["since"]:
+            queryset = queryset.filter(reserved_at__date__gte=options["since"])
+        if options["until"]:
+            queryset = queryset.filter(reserved_at__date__lte=options["until"])
+
+        total = queryset.count()
+        rows = self.track_progress(
+            reservation_export_rows(queryset, chunk_size=options["chunk_size"]), total, options["progress_every"]
+        )
+        if options["format"] == "csv":
+            chunks = csv_chunks(RESERVATION_EXPORT_COLUMNS, reservation_csv_rows(rows))
+        else:
+            chunks = ndjson_chunks(rows)
+
+        if options["output"] == "-":
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+        else:
+            with open(options["output"], "w", encoding="utf-8", newline="") as output:
+                for chunk in chunks:
+                    output.write(chunk)
+        self.stderr.write(self.style.SUCCESS(f"Exported {self.exported} reservation(s)."))
+
+    def track_progress(self, rows, total, every):
+        self.exported = 0
+        for row in rows:
+            yield row
+            self.exported += 1
+            if every and self.exported % every == 0:
+                self.stderr.write(f"Exported {self.exported}/{total} reservations...")
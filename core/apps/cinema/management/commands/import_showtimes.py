@@ -0,0 +1,30 @@
+from apps.cinema.scheduling import import_showtimes
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Bulk-create showtimes from a CSV file with hall, movie and start_time columns."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV file to import.")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report invalid and conflicting rows without creating showtimes."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["path"], encoding="utf-8-sig", newline="") as csv_file:
+                result = import_showtimes(csv_file, dry_run=options["dry_run"])
+        except OSError as error:
+            raise CommandError(f"Cannot read {options['path']}: {error}")
+
+        for message in [*result.errors, *result.conflict_messages()]:
+            self.stderr.write(message)
+        verb = "Would create" if options["dry_run"] else "Created"
+        summary = f"{verb} {len(result.created)} showtime(s)."
+        if result.rejected:
+            self.stdout.write(self.style.WARNING(f"{summary} {result.rejected} row(s) rejected."))
+        else:
+            self.stdout.write(self.style.SUCCESS(summary))
@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from utils.profiling import profile_files, top_functions
+
+
+class Command(BaseCommand):
+    help = "Aggregate the request profiles stored by the profiling middleware into a top-functions report."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--view", help="Only profiles of this view name, e.g. cinema:hall_showtimes.")
+        parser.add_argument("--hours", type=int, help="Only profiles from the last N hours.")
+        parser.add_argument("--sort", choices=("cumulative", "own"), default="cumulative")
+        parser.add_argument("--limit", type=int, default=30)
+        parser.add_argument("--dir", default=settings.PROFILING_DIR, help="Directory holding the profiles.")
+
+    def handle(self, *args, **options):
+        since = timezone.now() - timedelta(hours=options["hours"]) if options["hours"] else None
+        files = profile_files(options["dir"], view_name=options["view"], since=since)
+        if not files:
+            self.stdout.write(self.style.WARNING("No profiles found."))
+            return
+
+        views = sorted({file.view_name for file in files})
+        self.stdout.write(f"{len(files)} profile(s) of {', '.join(views)}")
+        self.stdout.write(f"{'calls':>10} {'own (s)':>10} {'cumul. (s)':>10} {'per req. (s)':>12}  function")
+        for row in top_functions((file.path for file in files), sort=options["sort"], limit=options["limit"]):
+            time = row.own_time if options["sort"] == "own" else row.cumulative_time
+            self.stdout.write(
+                f"{row.calls:>10} {row.own_time:>10.4f} {row.cumulative_time:>10.4f} "
+                f"{time / len(files):>12.4f}  {row.function}"
+            )
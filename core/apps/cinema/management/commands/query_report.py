@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+from utils.cache.shared import is_shared_cache
+from utils.db.queries import collect_query_stats, reset_query_stats
+
+
+class Command(BaseCommand):
+    help = "List the SQL fingerprints taking the most database time across workers, and the slowest statements."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sort", choices=("total", "count", "max"), default="total")
+        parser.add_argument("--limit", type=int, default=20)
+        parser.add_argument("--view", help="Only queries issued by this view name, e.g. cinema:hall_showtimes.")
+        parser.add_argument("--slow", type=int, default=5, help="Number of slow statements to show with their stack.")
+        parser.add_argument("--reset", action="store_true", help="Clear the collected stats after reporting.")
+
+    def handle(self, *args, **options):
+        if not is_shared_cache():
+            self.stdout.write(self.style.WARNING(
+                "The default cache is local to this process: the workers' stats cannot be collected."
+            ))
+        report = collect_query_stats()
+        stats = [stat for stat in report.stats if options["view"] in (None, stat.view)]
+        stats.sort(key=lambda stat: getattr(stat, options["sort"]), reverse=True)
+
+        self.stdout.write(f"{len(stats)} fingerprint(s) from {report.workers} worker(s)")
+        self.stdout.write(f"{'count':>8} {'total (ms)':>11} {'avg (ms)':>9} {'max (ms)':>9}  view / query")
+        for stat in stats[:options["limit"]]:
+            self.stdout.write(
+                f"{stat.count:>8} {stat.total * 1000:>11.1f} {stat.total * 1000 / stat.count:>9.2f} "
+                f"{stat.max * 1000:>9.1f}  {stat.view}\n{'':>41}{stat.fingerprint[:300]}"
+            )
+
+        slow_queries = [query for query in report.slow_queries if options["view"] in (None, query.view)]
+        for query in slow_queries[:options["slow"]]:
+            header = f"\n{query.duration * 1000:.1f} ms in {query.view}: {query.sql[:500]}"
+            self.stdout.write(self.style.WARNING(header))
+            for frame in query.stack:
+                self.stdout.write(f"    {frame}")
+
+        if options["reset"]:
+            reset_query_stats()
+            self.stdout.write(self.style.SUCCESS("Query stats cleared."))
@@ -0,0 +1,13 @@
+from apps.cinema.models import DailyScheduleRollup
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Recount the seat counters and rewrite the daily schedule rollup from the showtime and reservation rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        refreshed = DailyScheduleRollup.objects.rebuild(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {refreshed} schedule rollup row(s)."))
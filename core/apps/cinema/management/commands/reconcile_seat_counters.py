@@ -0,0 +1,34 @@
+from apps.cinema.models import Showtime
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Detect and repair drift between the showtime seat counters and the reservation rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report drifted showtimes without updating them."
+        )
+        parser.add_argument("--showtime", type=int, action="append", dest="showtime_ids", help="Showtime ID to check.")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        queryset = Showtime.objects.all()
+        if options["showtime_ids"]:
+            queryset = queryset.filter(pk__in=options["showtime_ids"])
+
+        drifted = queryset.refresh_seat_counters(dry_run=options["dry_run"], batch_size=options["batch_size"])
+
+        for drift in drifted:
+            self.stdout.write(
+                f"Showtime {drift.showtime_id}: reserved {drift.reserved_count} -> {drift.actual_reserved_count}, "
+                f"pending {drift.pending_count} -> {drift.actual_pending_count}"
+            )
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS("Seat counters are consistent."))
+        elif options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"{len(drifted)} showtime(s) drifted."))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Repaired {len(drifted)} showtime(s)."))
@@ -0,0 +1,37 @@
+from urllib.parse import urlsplit
+
+from apps.cinema.warmup import warm_up
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from utils.cache.shared import is_shared_cache
+
+
+class Command(BaseCommand):
+    help = "Warm the seat map and page caches for upcoming showtimes; run after each deploy."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=2, help="Warm the showtimes of the next N days.")
+        parser.add_argument(
+            "--host",
+            default=urlsplit(settings.DOMAIN_NAME).netloc,
+            help="Host the cached pages are served for, as the page cache is keyed by host."
+        )
+        parser.add_argument("--insecure", action="store_true", help="Request the pages over plain HTTP.")
+        parser.add_argument("--no-pages", action="store_false", dest="pages", help="Only warm the seat maps.")
+
+    def handle(self, *args, **options):
+        if not is_shared_cache():
+            # Whatever this process caches would be gone once the command exits.
+            self.stdout.write(self.style.WARNING("The default cache is local to this process, skipping the warm-up."))
+            return
+        result = warm_up(
+            days=options["days"], host=options["host"], secure=not options["insecure"], pages=options["pages"]
+        )
+        self.stdout.write(
+            f"Compiled {result.templates} template(s), cached {result.seat_maps} seat map(s) "
+            f"and {result.pages} page(s)."
+        )
+        if result.failed_pages:
+            self.stdout.write(self.style.WARNING(f"{result.failed_pages} page(s) did not render."))
+        else:
+            self.stdout.write(self.style.SUCCESS("Warm-up complete."))
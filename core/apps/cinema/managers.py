@@ -0,0 +1,224 @@
+from collections.abc import Iterable
+from datetime import timedelta
+from typing import TYPE_CHECKING, NamedTuple
+
+from django.db import models
+from django.db.models import Count, DateTimeField, ExpressionWrapper, F, Q
+from django.utils import timezone
+from utils.db.functions import MinutesToInterval
+
+if TYPE_CHECKING:
+    from apps.cinema.models import CinemaHall, DailyScheduleRollup, Seat, Showtime  # noqa: F401
+
+
+class SeatQuerySet(models.QuerySet["Seat"]):
+    def with_label(self, label: str) -> "SeatQuerySet":
+        """
+        Filter seats by label (e.g. "F12") using the indexed label column.
+        """
+        return self.filter(label=label.strip().upper())
+
+    def bulk_create_cells(
+        self, hall: "CinemaHall", cells: Iterable[tuple[int, int]], batch_size: int = 1000
+    ) -> list["Seat"]:
+        """
+        Create seats for the given (row, seat_number) cells with their labels populated from
+        the hall's layout.
+        """
+        labels = hall.seat_labels()
+        seats = [
+            self.model(
+                hall=hall,
+                row=row,
+                seat_number=seat_number,
+                label=labels.get((row, seat_number)) or self.model.build_label(row, seat_number)
+            )
+            for row, seat_number in cells
+        ]
+        return self.bulk_create(seats, batch_size=batch_size)
+
+    def create_missing_cells(self, hall: "CinemaHall") -> list["Seat"]:
+        """
+        Create a seat for every cell of the hall's layout that has none.
+        """
+        existing = set(self.filter(hall=hall).values_list("row", "seat_number"))
+        return self.bulk_create_cells(hall, (cell for cell in hall.layout_cells() if cell not in existing))
+
+    def relabel_rows(self, hall: "CinemaHall", rows: Iterable[int]) -> int:
+        """
+        Renumber the seats of these rows after the hall's layout changed.
+        """
+        labels = hall.seat_labels()
+        seats = list(self.filter(hall=hall, row__in=set(rows)).only("pk", "row", "seat_number", "label"))
+        changed = []
+        for seat in seats:
+            label = labels.get((seat.row, seat.seat_number))
+            if label and label != seat.label:
+                seat.label = label
+                changed.append(seat)
+        return self.bulk_update(changed, ["label"], batch_size=1000)
+
+
+SeatManager = models.Manager.from_queryset(SeatQuerySet)
+
+
+class SeatCountersDrift(NamedTuple):
+    showtime_id: int
+    reserved_count: int
+    pending_count: int
+    actual_reserved_count: int
+    actual_pending_count: int
+
+
+class ShowtimeQuerySet(models.QuerySet["Showtime"]):
+    def with_end_time(self) -> "ShowtimeQuerySet":
+        """
+        Annotate ``end_time``, the start time plus the movie duration.
+        """
+        return self.annotate(end_time=ExpressionWrapper(
+            F("start_time") + MinutesToInterval("movie__duration"),
+            output_field=DateTimeField()
+        ))
+
+    def adjust_seat_counters(self, reserved: int = 0, pending: int = 0) -> int:
+        """
+        Atomically shift the denormalized seat counters; call inside the reservation transaction.
+        """
+        from apps.cinema.models import DailyScheduleRollup
+
+        if not reserved and not pending:
+            return 0
+        DailyScheduleRollup.objects.filter(showtime__in=self).adjust_seat_counters(reserved, pending)
+        return self.update(
+            reserved_count=F("reserved_count") + reserved,
+            pending_count=F("pending_count") + pending,
+            occupancy_version=F("occupancy_version") + 1
+        )
+
+    def bump_occupancy_version(self) -> int:
+        """
+        Invalidate cached seat state after changes that bypass ``adjust_seat_counters``.
+        """
+        return self.update(occupancy_version=F("occupancy_version") + 1)
+
+    @staticmethod
+    def actual_seat_counts() -> dict[str, Count]:
+        """
+        Seat counter expressions computed from the reservation rows, for use in ``annotate()``.
+        """
+        from apps.cinema.models import ACTIVE_RESERVATION_STATUSES, ReservationStatus
+
+        return {
+            "actual_reserved_count": Count(
+                "reservations__reserved_seats",
+                filter=Q(reservations__status__in=ACTIVE_RESERVATION_STATUSES)
+            ),
+            "actual_pending_count": Count(
+                "reservations__reserved_seats",
+                filter=Q(reservations__status=ReservationStatus.PENDING)
+            ),
+        }
+
+    def refresh_seat_counters(self, dry_run: bool = False, batch_size: int = 1000) -> list[SeatCountersDrift]:
+        """
+        Recompute the seat counters from the reservation rows and store the drifted ones.
+        """
+        from apps.cinema.models import DailyScheduleRollup
+
+        rows = (
+            self.annotate(**self.actual_seat_counts())
+            .order_by("pk")
+            .values_list("pk", "reserved_count", "pending_count", "actual_reserved_count", "actual_pending_count")
+        )
+        drifted = [
+            SeatCountersDrift(*row)
+            for row in rows.iterator(chunk_size=batch_size)
+            if (row[1], row[2]) != (row[3], row[4])
+        ]
+        if not dry_run:
+            self.model.objects.bulk_update(
+                [
+                    self.model(
+                        pk=drift.showtime_id,
+                        reserved_count=drift.actual_reserved_count,
+                        pending_count=drift.actual_pending_count,
+                        occupancy_version=F("occupancy_version") + 1
+                    )
+                    for drift in drifted
+                ],
+                ["reserved_count", "pending_count", "occupancy_version"],
+                batch_size=batch_size
+            )
+            DailyScheduleRollup.objects.refresh_showtimes(
+                self.model.objects.filter(pk__in=[drift.showtime_id for drift in drifted]),
+                batch_size=batch_size
+            )
+        return drifted
+
+
+ShowtimeManager = models.Manager.from_queryset(ShowtimeQuerySet)
+
+
+class DailyScheduleRollupQuerySet(models.QuerySet["DailyScheduleRollup"]):
+    def adjust_seat_counters(self, reserved: int = 0, pending: int = 0) -> int:
+        """
+        Shift the rollup counters together with ``ShowtimeQuerySet.adjust_seat_counters()``.
+        """
+        return self.update(
+            reserved_count=F("reserved_count") + reserved,
+            pending_count=F("pending_count") + pending,
+            updated_at=timezone.now()
+        )
+
+    def refresh_showtimes(self, showtimes: models.QuerySet["Showtime"], batch_size: int = 1000) -> int:
+        """
+        Create or overwrite the rollup rows of these showtimes from their stored seat counters.
+        """
+        rows = showtimes.order_by("pk").values_list(
+            "pk", "hall_id", "movie_id", "start_time", "movie__duration", "hall__seat_count", "reserved_count",
+            "pending_count"
+        )
+        refreshed = 0
+        batch: list["DailyScheduleRollup"] = []
+        for row in rows.iterator(chunk_size=batch_size):
+            showtime_id, hall_id, movie_id, start_time, duration, capacity, reserved, pending = row
+            batch.append(self.model(
+                date=timezone.localdate(start_time),
+                hall_id=hall_id,
+                showtime_id=showtime_id,
+                movie_id=movie_id,
+                start_time=start_time,
+                end_time=start_time + timedelta(minutes=duration),
+                capacity=capacity,
+                reserved_count=reserved,
+                pending_count=pending
+            ))
+            if len(batch) >= batch_size:
+                refreshed += len(self._upsert(batch))
+                batch = []
+        if batch:
+            refreshed += len(self._upsert(batch))
+        return refreshed
+
+    def _upsert(self, rollups: list["DailyScheduleRollup"]) -> list["DailyScheduleRollup"]:
+        return self.bulk_create(
+            rollups,
+            update_conflicts=True,
+            unique_fields=["showtime"],
+            update_fields=[
+                "date", "hall", "movie", "start_time", "end_time", "capacity", "reserved_count", "pending_count",
+                "updated_at"
+            ]
+        )
+
+    def rebuild(self, batch_size: int = 1000) -> int:
+        """
+        Recount the showtime seat counters from the reservation rows and rewrite every rollup row.
+        """
+        from apps.cinema.models import Showtime
+
+        Showtime.objects.refresh_seat_counters(batch_size=batch_size)
+        return self.refresh_showtimes(Showtime.objects.all(), batch_size=batch_size)
+
+
+DailyScheduleRollupManager = models.Manager.from_queryset(DailyScheduleRollupQuerySet)
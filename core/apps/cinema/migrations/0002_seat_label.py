@@ -0,0 +1,48 @@
+# Generated by Django 5.1 on 2026-10-19 13:20
+
+from django.db import migrations, models
+
+BATCH_SIZE = 2000
+
+
+def row_to_label(row):
+    label = ""
+    while row > 0:
+        row -= 1
+        label = chr(row % 26 + 65) + label
+        row //= 26
+    return label
+
+
+def populate_seat_labels(apps, schema_editor):
+    Seat = apps.get_model("cinema", "Seat")
+    batch = []
+    for seat in Seat.objects.only("id", "row", "seat_number").iterator(chunk_size=BATCH_SIZE):
+        seat.label = f"{row_to_label(seat.row)}{seat.seat_number}"
+        batch.append(seat)
+        if len(batch) >= BATCH_SIZE:
+            Seat.objects.bulk_update(batch, ["label"])
+            batch = []
+    if batch:
+        Seat.objects.bulk_update(batch, ["label"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='seat',
+            name='label',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=16, verbose_name='label'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_seat_labels, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='seat',
+            index=models.Index(fields=['hall', 'label'], name='cinema_seat_hall_label_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.1 on 2026-10-19 14:05
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+BATCH_SIZE = 1000
+
+
+def populate_seat_counters(apps, schema_editor):
+    Showtime = apps.get_model("cinema", "Showtime")
+    showtimes = Showtime.objects.annotate(
+        actual_reserved_count=Count(
+            "reservations__reserved_seats",
+            filter=Q(reservations__status__in=["PENDING", "CONFIRMED"])
+        ),
+        actual_pending_count=Count(
+            "reservations__reserved_seats",
+            filter=Q(reservations__status="PENDING")
+        ),
+    ).filter(actual_reserved_count__gt=0)
+    batch = []
+    for showtime in showtimes.iterator(chunk_size=BATCH_SIZE):
+        showtime.reserved_count = showtime.actual_reserved_count
+        showtime.pending_count = showtime.actual_pending_count
+        batch.append(showtime)
+        if len(batch) >= BATCH_SIZE:
+            Showtime.objects.bulk_update(batch, ["reserved_count", "pending_count"])
+            batch = []
+    if batch:
+        Showtime.objects.bulk_update(batch, ["reserved_count", "pending_count"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0002_seat_label'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='showtime',
+            name='pending_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='pending seats'),
+        ),
+        migrations.AddField(
+            model_name='showtime',
+            name='reserved_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='reserved seats'),
+        ),
+        migrations.RunPython(populate_seat_counters, migrations.RunPython.noop),
+    ]
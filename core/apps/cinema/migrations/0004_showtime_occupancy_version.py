@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-10-19 13:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0003_showtime_seat_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='showtime',
+            name='occupancy_version',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='occupancy version'),
+        ),
+    ]
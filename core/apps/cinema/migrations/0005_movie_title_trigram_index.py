@@ -0,0 +1,34 @@
+# Generated by Django 5.1 on 2026-10-19 15:10
+
+from django.db import migrations
+
+# Matches the ``UPPER("title"::text) LIKE UPPER(...)`` that PostgreSQL ``icontains`` lookups
+# compile to, so admin title searches can use the index instead of a sequential scan.
+INDEX_SQL = (
+    'CREATE INDEX IF NOT EXISTS cinema_movie_title_trgm_idx '
+    'ON cinema_movie USING gin ((UPPER("title"::text)) gin_trgm_ops)'
+)
+
+
+def create_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(INDEX_SQL)
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS cinema_movie_title_trgm_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0004_showtime_occupancy_version'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
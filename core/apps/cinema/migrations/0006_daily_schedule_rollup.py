@@ -0,0 +1,65 @@
+# Generated by Django 5.1 on 2026-10-19 13:39
+
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+BATCH_SIZE = 1000
+
+
+def populate_schedule_rollups(apps, schema_editor):
+    Showtime = apps.get_model("cinema", "Showtime")
+    DailyScheduleRollup = apps.get_model("cinema", "DailyScheduleRollup")
+    batch = []
+    for showtime in Showtime.objects.select_related("movie", "hall").iterator(chunk_size=BATCH_SIZE):
+        batch.append(DailyScheduleRollup(
+            date=timezone.localdate(showtime.start_time),
+            hall_id=showtime.hall_id,
+            showtime_id=showtime.pk,
+            movie_id=showtime.movie_id,
+            start_time=showtime.start_time,
+            end_time=showtime.start_time + timedelta(minutes=showtime.movie.duration),
+            capacity=showtime.hall.rows * showtime.hall.seats_per_row,
+            reserved_count=showtime.reserved_count,
+            pending_count=showtime.pending_count
+        ))
+        if len(batch) >= BATCH_SIZE:
+            DailyScheduleRollup.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        DailyScheduleRollup.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0005_movie_title_trigram_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyScheduleRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('date', models.DateField(verbose_name='date')),
+                ('start_time', models.DateTimeField(verbose_name='start time')),
+                ('end_time', models.DateTimeField(verbose_name='end time')),
+                ('capacity', models.PositiveIntegerField(verbose_name='capacity')),
+                ('reserved_count', models.PositiveIntegerField(default=0, verbose_name='reserved seats')),
+                ('pending_count', models.PositiveIntegerField(default=0, verbose_name='pending seats')),
+                ('hall', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='schedule_rollups', to='cinema.cinemahall', verbose_name='cinema hall')),
+                ('movie', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='schedule_rollups', to='cinema.movie', verbose_name='movie')),
+                ('showtime', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='schedule_rollup', to='cinema.showtime', verbose_name='showtime')),
+            ],
+            options={
+                'verbose_name': 'Daily Schedule Rollup',
+                'verbose_name_plural': 'Daily Schedule Rollups',
+                'indexes': [models.Index(fields=['date', 'hall', 'start_time'], name='cinema_rollup_date_hall_idx')],
+            },
+        ),
+        migrations.RunPython(populate_schedule_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.1 on 2026-10-19 13:48
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0006_daily_schedule_rollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShowtimeTemplate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('starts_on', models.DateField(verbose_name='first day')),
+                ('ends_on', models.DateField(verbose_name='last day')),
+                ('weekdays', models.CharField(default='1234567', help_text='ISO weekday digits, 1 for Monday to 7 for Sunday, e.g. 12345 for weekdays.', max_length=7, validators=[django.core.validators.RegexValidator('^[1-7]{1,7}$', 'Use the ISO weekday digits 1 (Monday) to 7 (Sunday).')], verbose_name='weekdays')),
+                ('times', models.CharField(help_text='Comma-separated local start times, e.g. 14:00, 17:30, 21:00.', max_length=255, verbose_name='start times')),
+                ('hall', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='showtime_templates', to='cinema.cinemahall', verbose_name='cinema hall')),
+                ('movie', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='showtime_templates', to='cinema.movie', verbose_name='movie')),
+            ],
+            options={
+                'verbose_name': 'Showtime Template',
+                'verbose_name_plural': 'Showtime Templates',
+            },
+        ),
+        migrations.AddField(
+            model_name='showtime',
+            name='template',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='showtimes', to='cinema.showtimetemplate', verbose_name='template'),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.1 on 2026-10-19 13:55
+
+from apps.cinema.encoding import pack_bits
+from django.db import migrations, models
+
+
+def label(row, position):
+    letters = ""
+    while row > 0:
+        row -= 1
+        letters = chr(row % 26 + 65) + letters
+        row //= 26
+    return f"{letters}{position}"
+
+
+def populate_hall_layouts(apps, schema_editor):
+    """
+    Derive each hall's layout mask from its seats, renumber the seats of irregular halls and
+    refresh their rollup capacities. Halls without seats yet keep the full grid.
+    """
+    CinemaHall = apps.get_model("cinema", "CinemaHall")
+    Seat = apps.get_model("cinema", "Seat")
+    DailyScheduleRollup = apps.get_model("cinema", "DailyScheduleRollup")
+    for hall in CinemaHall.objects.iterator():
+        size = hall.rows * hall.seats_per_row
+        seats = [
+            seat for seat in Seat.objects.filter(hall=hall).order_by("row", "seat_number")
+            if 1 <= seat.row <= hall.rows and 1 <= seat.seat_number <= hall.seats_per_row
+        ]
+        if not seats or len(seats) == size:
+            CinemaHall.objects.filter(pk=hall.pk).update(seat_count=size)
+            continue
+
+        positions: dict[int, int] = {}
+        for seat in seats:
+            positions[seat.row] = positions.get(seat.row, 0) + 1
+            seat.label = label(seat.row, positions[seat.row])
+        Seat.objects.bulk_update(seats, ["label"], batch_size=1000)
+        layout = pack_bits(((seat.row - 1) * hall.seats_per_row + seat.seat_number - 1 for seat in seats), size)
+        CinemaHall.objects.filter(pk=hall.pk).update(layout=layout, seat_count=len(seats))
+        DailyScheduleRollup.objects.filter(hall=hall).update(capacity=len(seats))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0007_showtime_template'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cinemahall',
+            name='layout',
+            field=models.BinaryField(blank=True, null=True, verbose_name='seat layout mask'),
+        ),
+        migrations.AddField(
+            model_name='cinemahall',
+            name='seat_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='seats'),
+        ),
+        migrations.RunPython(populate_hall_layouts, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,11 @@
-from datetime import timedelta
+from collections.abc import Iterable
+from datetime import datetime, time, timedelta
 
+from apps.cinema.encoding import pack_bits, unpack_bits
+from apps.cinema.managers import DailyScheduleRollupManager, SeatManager, ShowtimeManager
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.core.validators import RegexValidator
 from django.db import models
 from django.db.models import Count
 from django.db.models.query import QuerySet
@@ -12,13 +16,22 @@ from utils.mixins.models import Timestampable
 User = get_user_model()
 
 
+Cell = tuple[int, int]
+
+
 class CinemaHall(Timestampable, models.Model):
     """
      Model representing a cinema hall in the CinemaHub application.
+
+     Seats sit on a ``rows x seats_per_row`` grid. Halls with aisles or gaps store which cells
+     hold a seat in ``layout``, a row-major bitmask (see ``apps.cinema.encoding.pack_bits``);
+     an empty layout means every cell holds a seat.
     """
     name = models.CharField(max_length=100, unique=True, verbose_name=_("room name"))
     rows = models.PositiveIntegerField(verbose_name=_("rows number"))
     seats_per_row = models.PositiveIntegerField(verbose_name=_("seats per row"))
+    layout = models.BinaryField(null=True, blank=True, editable=False, verbose_name=_("seat layout mask"))
+    seat_count = models.PositiveIntegerField(default=0, editable=False, verbose_name=_("seats"))
     image = models.ImageField(
         upload_to="cinema_hall/images/",
         blank=True,
@@ -33,9 +46,76 @@ class CinemaHall(Timestampable, models.Model):
     def __str__(self) -> str:
         return self.name
 
+    def save(self, *args, **kwargs):
+        self.seat_count = self.count_seats()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"layout", "rows", "seats_per_row"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "seat_count"}
+        super().save(*args, **kwargs)
+
     @property
     def total_seats(self) -> int:
-        return self.rows * self.seats_per_row
+        return self.seat_count
+
+    def count_seats(self) -> int:
+        """
+        Count the cells of the layout holding a seat; ``save()`` stores it as ``seat_count``.
+        """
+        size = self.rows * self.seats_per_row
+        if self.layout is None:
+            return size
+        return len(unpack_bits(bytes(self.layout), size))
+
+    def layout_cells(self) -> list[Cell]:
+        """
+        The (row, seat_number) cells holding a seat, in row-major order.
+        """
+        size = self.rows * self.seats_per_row
+        cells = range(size) if self.layout is None else unpack_bits(bytes(self.layout), size)
+        return [(cell // self.seats_per_row + 1, cell % self.seats_per_row + 1) for cell in cells]
+
+    def set_layout(self, cells: Iterable[Cell]) -> None:
+        """
+        Store the cells holding a seat; cells outside of the hall dimensions are ignored.
+        """
+        size = self.rows * self.seats_per_row
+        indices = {
+            (row - 1) * self.seats_per_row + seat_number - 1
+            for row, seat_number in cells
+            if 1 <= row <= self.rows and 1 <= seat_number <= self.seats_per_row
+        }
+        self.layout = None if len(indices) == size else pack_bits(indices, size)
+
+    @staticmethod
+    def number_cells(cells: Iterable[Cell]) -> dict[Cell, str]:
+        """
+        Label cells with their row letters and their position among the row's cells, so the
+        numbering skips aisles (e.g. A1, A2, A3 for the cells (1, 1), (1, 2) and (1, 5)).
+        """
+        labels = {}
+        positions: dict[int, int] = {}
+        for row, seat_number in sorted(cells):
+            positions[row] = positions.get(row, 0) + 1
+            labels[row, seat_number] = Seat.build_label(row, positions[row])
+        return labels
+
+    def seat_labels(self) -> dict[Cell, str]:
+        return self.number_cells(self.layout_cells())
+
+    def seat_label(self, row: int, seat_number: int) -> str | None:
+        """
+        The label of the seat on this cell, reading only its row of the layout; ``None`` when
+        the layout has no seat there.
+        """
+        if not (1 <= row <= self.rows and 1 <= seat_number <= self.seats_per_row):
+            return None
+        if self.layout is None:
+            return Seat.build_label(row, seat_number)
+        start = (row - 1) * self.seats_per_row
+        cells = unpack_bits(bytes(self.layout), start + seat_number, start=start)
+        if not cells or cells[-1] != start + seat_number - 1:
+            return None
+        return Seat.build_label(row, len(cells))
 
 
 class Seat(Timestampable, models.Model):
@@ -50,6 +130,9 @@ class Seat(Timestampable, models.Model):
     )
     row = models.PositiveIntegerField(verbose_name=_("row number"))
     seat_number = models.PositiveIntegerField(verbose_name=_("seat number"))
+    label = models.CharField(max_length=16, editable=False, db_index=True, verbose_name=_("label"))
+
+    objects = SeatManager()
 
     @staticmethod
     def row_to_label(row: int) -> str:
@@ -65,20 +148,26 @@ class Seat(Timestampable, models.Model):
             row //= 26
         return label
 
-    @property
-    def label(self) -> str:
+    @classmethod
+    def build_label(cls, row: int, seat_number: int) -> str:
         """
-        Generate the label for the seat, combining row letters and seat number.
+        Generate the label for a seat, combining row letters and seat number.
         """
-        row_letter = self.row_to_label(self.row)
-        return f"{row_letter}{self.seat_number}"
+        return f"{cls.row_to_label(row)}{seat_number}"
 
     def __str__(self) -> str:
         return f"{self.hall.name} - Seat {self.label}"
 
+    def save(self, *args, **kwargs):
+        self.label = self.hall.seat_label(self.row, self.seat_number) or self.build_label(self.row, self.seat_number)
+        super().save(*args, **kwargs)
+
     class Meta:
         verbose_name = _("Seat")
         verbose_name_plural = _("Seats")
+        indexes = [
+            models.Index(fields=["hall", "label"], name="cinema_seat_hall_label_idx"),
+        ]
 
 
 class Movie(Timestampable, models.Model):
@@ -102,6 +191,70 @@ class Movie(Timestampable, models.Model):
         return self.title
 
 
+class ShowtimeTemplate(Timestampable, models.Model):
+    """
+    Weekly pattern of showtimes of a movie in a hall over a date range, expanded into
+    concrete showtimes by ``apps.cinema.scheduling.generate_template_showtimes``.
+    """
+    movie = models.ForeignKey(
+        Movie,
+        on_delete=models.CASCADE,
+        related_name="showtime_templates",
+        verbose_name=_("movie")
+    )
+    hall = models.ForeignKey(
+        CinemaHall,
+        on_delete=models.CASCADE,
+        related_name="showtime_templates",
+        verbose_name=_("cinema hall")
+    )
+    starts_on = models.DateField(verbose_name=_("first day"))
+    ends_on = models.DateField(verbose_name=_("last day"))
+    weekdays = models.CharField(
+        max_length=7,
+        default="1234567",
+        validators=[RegexValidator(r"^[1-7]{1,7}$", _("Use the ISO weekday digits 1 (Monday) to 7 (Sunday)."))],
+        help_text=_("ISO weekday digits, 1 for Monday to 7 for Sunday, e.g. 12345 for weekdays."),
+        verbose_name=_("weekdays")
+    )
+    times = models.CharField(
+        max_length=255,
+        help_text=_("Comma-separated local start times, e.g. 14:00, 17:30, 21:00."),
+        verbose_name=_("start times")
+    )
+
+    class Meta:
+        verbose_name = _("Showtime Template")
+        verbose_name_plural = _("Showtime Templates")
+
+    def __str__(self) -> str:
+        return f"{self.movie.title} in {self.hall.name} ({self.starts_on} - {self.ends_on})"
+
+    def clean(self):
+        if self.starts_on and self.ends_on and self.starts_on > self.ends_on:
+            raise ValidationError(_("The first day must not be after the last day."))
+        try:
+            self.parse_times()
+        except ValueError:
+            raise ValidationError({"times": _("Enter start times as HH:MM separated by commas.")})
+
+    def parse_times(self) -> list[time]:
+        return sorted({time.fromisoformat(value.strip()) for value in self.times.split(",") if value.strip()})
+
+    def expand(self) -> list[datetime]:
+        """
+        Aware start times of every showtime the template describes, in order.
+        """
+        times = self.parse_times()
+        start_times: list[datetime] = []
+        day = self.starts_on
+        while day <= self.ends_on:
+            if str(day.isoweekday()) in self.weekdays:
+                start_times.extend(timezone.make_aware(datetime.combine(day, start)) for start in times)
+            day += timedelta(days=1)
+        return start_times
+
+
 class Showtime(Timestampable, models.Model):
     """
     Model representing a movie showtime in a specific cinema hall.
@@ -119,6 +272,21 @@ class Showtime(Timestampable, models.Model):
         verbose_name=_("cinema hall")
     )
     start_time = models.DateTimeField(verbose_name=_("start time"))
+    template = models.ForeignKey(
+        ShowtimeTemplate,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="showtimes",
+        verbose_name=_("template")
+    )
+    reserved_count = models.PositiveIntegerField(default=0, editable=False, verbose_name=_("reserved seats"))
+    pending_count = models.PositiveIntegerField(default=0, editable=False, verbose_name=_("pending seats"))
+    # Bumped whenever the showtime's set of reserved seats may have changed; drives the seat ETag.
+    occupancy_version = models.PositiveIntegerField(default=0, editable=False, verbose_name=_("occupancy version"))
+
+    objects = ShowtimeManager()
 
     class Meta:
         verbose_name = _("Showtime")
@@ -155,9 +323,12 @@ class Showtime(Timestampable, models.Model):
 
     @property
     def reserved_seats_count(self) -> int:
+        """
+        Count the reserved seats from the reservation rows; prefer ``reserved_count`` for reads.
+        """
         queryset = ReservationSeat.objects.filter(
             reservation__showtime=self,
-            reservation__status__in=["PENDING", "CONFIRMED"]
+            reservation__status__in=ACTIVE_RESERVATION_STATUSES
         )
         return queryset.aggregate(count=Count("id"))["count"]
 
@@ -165,12 +336,59 @@ class Showtime(Timestampable, models.Model):
     def reserved_seats_list(self) -> QuerySet["ReservationSeat"]:
         return ReservationSeat.objects.filter(
             reservation__showtime=self,
-            reservation__status__in=["PENDING", "CONFIRMED"]
+            reservation__status__in=ACTIVE_RESERVATION_STATUSES
         ).select_related("seat", "reservation")
 
     @property
     def remaining_capacity(self) -> int:
-        return self.total_capacity - self.reserved_seats_count
+        return self.total_capacity - self.reserved_count
+
+
+class DailyScheduleRollup(Timestampable, models.Model):
+    """
+    Per-showtime row of the daily schedule with its seat counters, kept in step with showtime
+    and reservation changes so schedule reads need no joins across reservations.
+    """
+    date = models.DateField(verbose_name=_("date"))
+    hall = models.ForeignKey(
+        CinemaHall,
+        on_delete=models.CASCADE,
+        related_name="schedule_rollups",
+        verbose_name=_("cinema hall")
+    )
+    showtime = models.OneToOneField(
+        Showtime,
+        on_delete=models.CASCADE,
+        related_name="schedule_rollup",
+        verbose_name=_("showtime")
+    )
+    movie = models.ForeignKey(
+        Movie,
+        on_delete=models.CASCADE,
+        related_name="schedule_rollups",
+        verbose_name=_("movie")
+    )
+    start_time = models.DateTimeField(verbose_name=_("start time"))
+    end_time = models.DateTimeField(verbose_name=_("end time"))
+    capacity = models.PositiveIntegerField(verbose_name=_("capacity"))
+    reserved_count = models.PositiveIntegerField(default=0, verbose_name=_("reserved seats"))
+    pending_count = models.PositiveIntegerField(default=0, verbose_name=_("pending seats"))
+
+    objects = DailyScheduleRollupManager()
+
+    class Meta:
+        verbose_name = _("Daily Schedule Rollup")
+        verbose_name_plural = _("Daily Schedule Rollups")
+        indexes = [
+            models.Index(fields=["date", "hall", "start_time"], name="cinema_rollup_date_hall_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.date} - {self.hall_id} - {self.showtime_id}"
+
+    @property
+    def remaining_capacity(self) -> int:
+        return max(self.capacity - self.reserved_count, 0)
 
 
 class ReservationStatus(models.TextChoices):
@@ -179,6 +397,10 @@ class ReservationStatus(models.TextChoices):
     CANCELED = "CANCELED", _("Canceled")
 
 
+# Reservations in these statuses hold their seats.
+ACTIVE_RESERVATION_STATUSES = [ReservationStatus.PENDING, ReservationStatus.CONFIRMED]
+
+
 class Reservation(Timestampable, models.Model):
     """
     Model representing a user's reservation for a showtime
@@ -249,7 +471,7 @@ class ReservationSeat(Timestampable, models.Model):
         existing_reservations = ReservationSeat.objects.filter(
             seat=self.seat,
             reservation__showtime=self.reservation.showtime,
-            reservation__status__in=["PENDING", "CONFIRMED"]
+            reservation__status__in=ACTIVE_RESERVATION_STATUSES
         ).exclude(reservation=self.reservation)
 
         if existing_reservations.exists():
@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Any
+
+from apps.cinema.models import Reservation, Seat
+from apps.outbox.models import OutboxMessage
+from apps.outbox.registry import register
+from django.conf import settings
+from django.core.mail import send_mail
+from django.template.loader import render_to_string
+
+RESERVATION_CONFIRMATION = "cinema.reservation_confirmation"
+
+
+def enqueue_reservation_confirmation(reservation: Reservation, seats: list[Seat]) -> None:
+    """
+    Queue the confirmation email; the payload carries everything the email needs so the
+    dispatcher does not have to query the reservation again.
+    """
+    user = reservation.user
+    if not user.email:
+        return
+    showtime = reservation.showtime
+    OutboxMessage.objects.enqueue(RESERVATION_CONFIRMATION, {
+        "reservation_id": reservation.pk,
+        "email": user.email,
+        "name": user.get_full_name(),
+        "movie": showtime.movie.title,
+        "hall": showtime.hall.name,
+        "start_time": showtime.start_time.isoformat(),
+        "seats": [seat.label for seat in seats],
+    })
+
+
+@register(RESERVATION_CONFIRMATION)
+def send_reservation_confirmation(payload: dict[str, Any]) -> None:
+    context = {**payload, "start_time": datetime.fromisoformat(payload["start_time"])}
+    send_mail(
+        subject=f"Your CinemaHub reservation #{payload['reservation_id']}",
+        message=render_to_string("emails/reservation_confirmation.txt", context),
+        from_email=settings.EMAIL_FROM,
+        recipient_list=[payload["email"]],
+    )
@@ -0,0 +1,44 @@
+from collections.abc import Iterable
+from datetime import date, datetime
+
+from django.utils import timezone
+from utils.cache.pages import bump_versions
+
+# Page cache namespaces: the hall list on the home page, each hall's showtime page and the
+# daily schedules (one namespace per date plus one shared by all dates).
+HALLS_NAMESPACE = "cinema:halls"
+SCHEDULES_NAMESPACE = "cinema:schedules"
+
+
+def hall_namespace(hall_id: int) -> str:
+    return f"cinema:hall:{hall_id}"
+
+
+def schedule_namespace(day: date) -> str:
+    return f"cinema:schedule:{day.isoformat()}"
+
+
+def invalidate_hall_pages(hall_ids: Iterable[int], listing: bool = False, schedules: bool = False) -> None:
+    """
+    Drop the cached showtime pages of these halls (and the hall list or every daily schedule)
+    after the current commit.
+    """
+    namespaces = [hall_namespace(hall_id) for hall_id in set(hall_ids)]
+    if listing:
+        namespaces.append(HALLS_NAMESPACE)
+    if schedules:
+        namespaces.append(SCHEDULES_NAMESPACE)
+    if namespaces:
+        bump_versions(*namespaces)
+
+
+def invalidate_showtime_pages(showtimes: Iterable[tuple[int, datetime]]) -> None:
+    """
+    Drop the cached pages listing these ``(hall_id, start_time)`` showtimes after the current commit.
+    """
+    namespaces = set()
+    for hall_id, start_time in showtimes:
+        namespaces.add(hall_namespace(hall_id))
+        namespaces.add(schedule_namespace(timezone.localdate(start_time)))
+    if namespaces:
+        bump_versions(*namespaces)
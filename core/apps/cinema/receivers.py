@@ -1,19 +1,87 @@
-from django.db.models.signals import post_save
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from .models import CinemaHall, Seat
+from .models import CinemaHall, DailyScheduleRollup, Movie, Seat, Showtime
+from .pages import invalidate_hall_pages, invalidate_showtime_pages
+from .search import invalidate_movie_index
+from .tasks import generate_hall_seats
 
 
 @receiver(post_save, sender=CinemaHall)
 def create_seats_for_hall(sender, instance, created, **kwargs):
     """
-    Create seats for a CinemaHall after it's created.
+    Create seats for a CinemaHall after it's created; big halls get them from a background job.
     """
-    if created:
-        for row in range(1, instance.rows + 1):
-            for seat_number in range(1, instance.seats_per_row + 1):
-                Seat.objects.create(
-                    hall=instance,
-                    row=row,
-                    seat_number=seat_number
-                )
+    if not created:
+        return
+    if instance.total_seats > settings.SEAT_GENERATION_SYNC_LIMIT:
+        generate_hall_seats.defer(hall_id=instance.pk, priority=10)
+    else:
+        Seat.objects.create_missing_cells(instance)
+
+
+@receiver([post_save, post_delete], sender=CinemaHall)
+def invalidate_hall_page_cache(sender, instance, **kwargs):
+    invalidate_hall_pages([instance.pk], listing=True, schedules=True)
+
+
+@receiver(pre_save, sender=Showtime)
+def remember_showtime_placement(sender, instance, **kwargs):
+    """
+    Keep the stored hall and start time of an edited showtime so the pages it moves away from
+    are invalidated too.
+    """
+    instance._stored_placement = (
+        Showtime.objects.filter(pk=instance.pk).values_list("hall_id", "start_time").first()
+        if instance.pk else None
+    )
+
+
+@receiver([post_save, post_delete], sender=Showtime)
+def invalidate_showtime_page_cache(sender, instance, **kwargs):
+    placements = [(instance.hall_id, instance.start_time)]
+    if stored_placement := getattr(instance, "_stored_placement", None):
+        placements.append(stored_placement)
+    invalidate_showtime_pages(placements)
+
+
+@receiver([post_save, post_delete], sender=Movie)
+def invalidate_movie_page_cache(sender, instance, **kwargs):
+    invalidate_hall_pages(
+        Showtime.objects.filter(movie=instance).values_list("hall_id", flat=True).distinct(),
+        schedules=True
+    )
+
+
+@receiver([post_save, post_delete], sender=CinemaHall)
+@receiver([post_save, post_delete], sender=Showtime)
+@receiver([post_save, post_delete], sender=Movie)
+def invalidate_movie_search_index(sender, instance, **kwargs):
+    """
+    Search results list movie titles with their upcoming showtimes and hall names.
+    """
+    invalidate_movie_index()
+
+
+@receiver(post_save, sender=Showtime)
+def refresh_showtime_schedule_rollup(sender, instance, **kwargs):
+    DailyScheduleRollup.objects.refresh_showtimes(Showtime.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=Movie)
+def refresh_movie_schedule_rollups(sender, instance, created, **kwargs):
+    """
+    The rollup end times follow the movie duration.
+    """
+    if not created:
+        DailyScheduleRollup.objects.refresh_showtimes(Showtime.objects.filter(movie=instance))
+
+
+@receiver(post_save, sender=CinemaHall)
+def refresh_hall_schedule_rollups(sender, instance, created, **kwargs):
+    """
+    The rollup capacities follow the hall dimensions.
+    """
+    if not created:
+        DailyScheduleRollup.objects.refresh_showtimes(Showtime.objects.filter(hall=instance))
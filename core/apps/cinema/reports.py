@@ -0,0 +1,117 @@
+from collections.abc import Iterator
+from datetime import date, datetime, time, timedelta
+from typing import Any, NamedTuple
+
+from apps.cinema.models import ACTIVE_RESERVATION_STATUSES, ReservationSeat, Showtime
+from django.db.models import Case, CharField, Count, F, IntegerField, OuterRef, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, ExtractHour, ExtractIsoWeekDay
+from django.utils import timezone
+
+# Local start hours [from, to) of the time slots used by the "slot" breakdown.
+TIME_SLOTS = [
+    ("morning", 0, 12),
+    ("afternoon", 12, 17),
+    ("evening", 17, 21),
+    ("night", 21, 24),
+]
+
+WEEKDAYS = ["", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+class Breakdown(NamedTuple):
+    # Columns identifying a group, as (CSV header, values() field) pairs.
+    columns: list[tuple[str, str]]
+    annotations: dict[str, Any]
+
+
+BREAKDOWNS = {
+    "movie": Breakdown([("movie_id", "movie_id"), ("movie", "movie__title")], {}),
+    "hall": Breakdown([("hall_id", "hall_id"), ("hall", "hall__name")], {}),
+    "weekday": Breakdown([("weekday", "weekday")], {"weekday": ExtractIsoWeekDay("start_time")}),
+    "slot": Breakdown(
+        [("slot", "slot")],
+        {
+            "start_hour": ExtractHour("start_time"),
+            "slot": Case(
+                *[
+                    When(start_hour__gte=start, start_hour__lt=end, then=Value(name))
+                    for name, start, end in TIME_SLOTS
+                ],
+                output_field=CharField()
+            ),
+        }
+    ),
+    "showtime": Breakdown(
+        [
+            ("showtime_id", "pk"),
+            ("start_time", "start_time"),
+            ("movie", "movie__title"),
+            ("hall", "hall__name"),
+        ],
+        {}
+    ),
+}
+
+TOTAL_COLUMNS = ["showtimes", "capacity", "reserved_seats", "fill_rate"]
+
+
+def reserved_seats_per_showtime() -> Coalesce:
+    """
+    Correlated count of the seats held by active reservations of the outer showtime.
+    """
+    seats = (
+        ReservationSeat.objects
+        .filter(reservation__showtime=OuterRef("pk"), reservation__status__in=ACTIVE_RESERVATION_STATUSES)
+        .order_by()
+        .values("reservation__showtime")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(seats, output_field=IntegerField()), 0)
+
+
+def occupancy_report(
+    breakdown: str, start: date, end: date, chunk_size: int = 2000
+) -> tuple[list[str], Iterator[list]]:
+    """
+    Fill rate of the showtimes starting between ``start`` and ``end`` (inclusive, local dates),
+    grouped by ``breakdown``.
+
+    Returns the CSV header and a lazy row iterator. The aggregation runs in one grouped
+    query whose rows are fetched through a server-side cursor in chunks, so a year of
+    per-showtime rows streams in constant memory. The queryset is pinned to the database
+    picked now, as streaming continues after the request's replica routing has ended.
+    """
+    columns, annotations = BREAKDOWNS[breakdown]
+    queryset = Showtime.objects.filter(
+        start_time__gte=timezone.make_aware(datetime.combine(start, time.min)),
+        start_time__lt=timezone.make_aware(datetime.combine(end + timedelta(days=1), time.min))
+    ).annotate(
+        seat_capacity=F("hall__seat_count"),
+        reserved_seats=reserved_seats_per_showtime(),
+        **annotations
+    )
+    fields = [field for _, field in columns]
+    if breakdown == "showtime":
+        rows = queryset.annotate(showtimes=Value(1)).values_list(
+            *fields, "showtimes", "seat_capacity", "reserved_seats"
+        ).order_by("start_time", "pk")
+    else:
+        rows = queryset.values(*fields).annotate(
+            showtimes=Count("pk"),
+            capacity=Sum("seat_capacity"),
+            reserved=Sum("reserved_seats")
+        ).values_list(*fields, "showtimes", "capacity", "reserved").order_by(*fields)
+    rows = rows.using(rows.db)
+    header = [name for name, _ in columns] + TOTAL_COLUMNS
+    return header, _format_rows(breakdown, rows.iterator(chunk_size=chunk_size))
+
+
+def _format_rows(breakdown: str, rows: Iterator[tuple]) -> Iterator[list]:
+    for *group, showtimes, capacity, reserved in rows:
+        if breakdown == "weekday":
+            group = [WEEKDAYS[group[0]]]
+        elif breakdown == "showtime":
+            group[1] = timezone.localtime(group[1]).isoformat()
+        fill_rate = round(reserved / capacity, 4) if capacity else 0
+        yield [*group, showtimes, capacity, reserved, fill_rate]
@@ -0,0 +1,265 @@
+import csv
+import heapq
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, NamedTuple
+
+from apps.cinema.models import CinemaHall, DailyScheduleRollup, Movie, Reservation, Showtime, ShowtimeTemplate
+from apps.cinema.pages import invalidate_showtime_pages
+from apps.cinema.search import invalidate_movie_index
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+IMPORT_COLUMNS = ("hall", "movie", "start_time")
+
+
+class Slot(NamedTuple):
+    hall_id: int
+    start_time: datetime
+    end_time: datetime
+    # Identifies the slot in reports: a CSV line number, or a showtime ID for existing slots.
+    key: Any
+
+
+class Conflict(NamedTuple):
+    planned: Slot
+    other: Slot
+    # Whether ``other`` is an existing showtime rather than another planned one.
+    existing: bool
+
+
+def find_conflicts(planned: Iterable[Slot], existing: Iterable[Slot]) -> list[Conflict]:
+    """
+    Report every overlap of a planned slot with an existing slot or another planned slot in
+    the same hall.
+
+    Each hall's slots are swept in start order while a heap keeps the ones still running,
+    so the cost is O(n log n) plus the number of conflicts instead of a query per slot.
+    Overlaps between two existing slots are not reported.
+    """
+    halls: dict[int, list[tuple[Slot, bool]]] = defaultdict(list)
+    for slot in planned:
+        halls[slot.hall_id].append((slot, True))
+    for slot in existing:
+        halls[slot.hall_id].append((slot, False))
+
+    conflicts = []
+    for slots in halls.values():
+        slots.sort(key=lambda item: (item[0].start_time, item[0].end_time))
+        running: list[tuple[datetime, int, Slot, bool]] = []
+        for position, (slot, is_planned) in enumerate(slots):
+            while running and running[0][0] <= slot.start_time:
+                heapq.heappop(running)
+            for _, _, other, other_planned in running:
+                if is_planned:
+                    conflicts.append(Conflict(slot, other, existing=not other_planned))
+                elif other_planned:
+                    conflicts.append(Conflict(other, slot, existing=True))
+            heapq.heappush(running, (slot.end_time, position, slot, is_planned))
+    return conflicts
+
+
+def existing_slots(hall_ids: Iterable[int], start: datetime, end: datetime) -> list[Slot]:
+    """
+    Load the showtimes of these halls running at any point between ``start`` and ``end`` in one query.
+    """
+    showtimes = (
+        Showtime.objects
+        .filter(hall_id__in=hall_ids, start_time__lt=end)
+        .with_end_time()
+        .filter(end_time__gt=start)
+        .values_list("pk", "hall_id", "start_time", "movie__duration")
+    )
+    return [
+        Slot(hall_id, start_time, start_time + timedelta(minutes=duration), pk)
+        for pk, hall_id, start_time, duration in showtimes
+    ]
+
+
+def showtimes_created(showtimes: list[Showtime]) -> None:
+    """
+    Do for bulk-created showtimes what the ``post_save`` receivers do for saved ones.
+    """
+    if not showtimes:
+        return
+    DailyScheduleRollup.objects.refresh_showtimes(
+        Showtime.objects.filter(pk__in=[showtime.pk for showtime in showtimes])
+    )
+    invalidate_showtime_pages((showtime.hall_id, showtime.start_time) for showtime in showtimes)
+    invalidate_movie_index()
+
+
+@dataclass
+class ShowtimeImportResult:
+    created: list[Showtime] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    conflicts: list[Conflict] = field(default_factory=list)
+    hall_names: dict[int, str] = field(default_factory=dict)
+
+    @property
+    def conflicting_lines(self) -> set[int]:
+        lines = {conflict.planned.key for conflict in self.conflicts}
+        return lines | {conflict.other.key for conflict in self.conflicts if not conflict.existing}
+
+    @property
+    def rejected(self) -> int:
+        return len(self.errors) + len(self.conflicting_lines)
+
+    def conflict_messages(self) -> list[str]:
+        messages = []
+        for conflict in self.conflicts:
+            other = f"showtime #{conflict.other.key}" if conflict.existing else f"line {conflict.other.key}"
+            messages.append(
+                f"Line {conflict.planned.key}: overlaps {other} in {self.hall_names[conflict.planned.hall_id]} "
+                f"({timezone.localtime(conflict.other.start_time):%Y-%m-%d %H:%M}"
+                f"-{timezone.localtime(conflict.other.end_time):%H:%M})."
+            )
+        return messages
+
+
+def import_showtimes(lines: Iterable[str], dry_run: bool = False) -> ShowtimeImportResult:
+    """
+    Create showtimes from CSV lines with ``hall``, ``movie`` and ``start_time`` columns.
+
+    Halls and movies are resolved by name in one query each and the halls' existing
+    showtimes are loaded in one more, so the cost does not grow with a query per row. Every
+    invalid or overlapping row is reported; the others are bulk-inserted. Naive start times
+    are read in the current time zone.
+    """
+    result = ShowtimeImportResult()
+    reader = csv.DictReader(lines)
+    missing = [column for column in IMPORT_COLUMNS if column not in (reader.fieldnames or [])]
+    if missing:
+        result.errors.append(f"Missing column(s): {', '.join(missing)}.")
+        return result
+
+    records = [
+        (line, {column: (record.get(column) or "").strip() for column in IMPORT_COLUMNS})
+        for line, record in enumerate(reader, start=2)
+    ]
+    halls = {
+        hall.name: hall for hall in CinemaHall.objects.filter(name__in={record["hall"] for _, record in records})
+    }
+    movies = {
+        movie.title: movie for movie in Movie.objects.filter(title__in={record["movie"] for _, record in records})
+    }
+    result.hall_names = {hall.pk: hall.name for hall in halls.values()}
+
+    now = timezone.now()
+    planned: list[Slot] = []
+    movie_ids: dict[int, int] = {}
+    for line, record in records:
+        hall, movie = halls.get(record["hall"]), movies.get(record["movie"])
+        try:
+            start_time = parse_datetime(record["start_time"])
+        except ValueError:
+            start_time = None
+        if hall is None:
+            result.errors.append(f"Line {line}: unknown hall {record['hall']!r}.")
+        elif movie is None:
+            result.errors.append(f"Line {line}: unknown movie {record['movie']!r}.")
+        elif start_time is None:
+            result.errors.append(f"Line {line}: invalid start time {record['start_time']!r}.")
+        else:
+            if timezone.is_naive(start_time):
+                start_time = timezone.make_aware(start_time)
+            if start_time < now:
+                result.errors.append(f"Line {line}: start time {record['start_time']} is in the past.")
+                continue
+            planned.append(Slot(hall.pk, start_time, start_time + timedelta(minutes=movie.duration), line))
+            movie_ids[line] = movie.pk
+    if not planned:
+        return result
+
+    with transaction.atomic():
+        hall_ids = {slot.hall_id for slot in planned}
+        # Serialize imports into the same halls so they cannot both pass the conflict check.
+        list(CinemaHall.objects.select_for_update().filter(pk__in=hall_ids).values_list("pk"))
+        existing = existing_slots(
+            hall_ids, min(slot.start_time for slot in planned), max(slot.end_time for slot in planned)
+        )
+        result.conflicts = find_conflicts(planned, existing)
+        conflicting = result.conflicting_lines
+
+        showtimes = [
+            Showtime(hall_id=slot.hall_id, movie_id=movie_ids[slot.key], start_time=slot.start_time)
+            for slot in planned
+            if slot.key not in conflicting
+        ]
+        if dry_run:
+            result.created = showtimes
+        else:
+            result.created = Showtime.objects.bulk_create(showtimes)
+            showtimes_created(result.created)
+    return result
+
+
+@dataclass
+class TemplateGenerationResult:
+    created: list[Showtime] = field(default_factory=list)
+    deleted: int = 0
+    unchanged: int = 0
+    # Outdated showtimes kept because they have reservations.
+    kept_reserved: list[int] = field(default_factory=list)
+    conflicts: list[Conflict] = field(default_factory=list)
+
+
+def generate_template_showtimes(template: ShowtimeTemplate, dry_run: bool = False) -> TemplateGenerationResult:
+    """
+    Bring the future showtimes of a template in line with its pattern.
+
+    Showtimes that already match are left untouched, outdated ones are deleted unless they
+    have reservations, and the missing ones are checked against the hall in one conflict
+    pass and bulk-inserted. Conflicting slots are reported and skipped, including a slot
+    overlapping an earlier slot of the same template.
+    """
+    result = TemplateGenerationResult()
+    now = timezone.now()
+    duration = timedelta(minutes=template.movie.duration)
+
+    with transaction.atomic():
+        list(CinemaHall.objects.select_for_update().filter(pk=template.hall_id).values_list("pk"))
+        wanted = {start_time for start_time in template.expand() if start_time > now}
+        current = (
+            template.showtimes
+            .filter(start_time__gt=now)
+            .annotate(has_reservations=Exists(Reservation.objects.filter(showtime=OuterRef("pk"))))
+            .values_list("pk", "hall_id", "movie_id", "start_time", "has_reservations")
+        )
+        outdated = []
+        for pk, hall_id, movie_id, start_time, has_reservations in current:
+            if (hall_id, movie_id) == (template.hall_id, template.movie_id) and start_time in wanted:
+                wanted.discard(start_time)
+                result.unchanged += 1
+            elif has_reservations:
+                result.kept_reserved.append(pk)
+            else:
+                outdated.append(pk)
+
+        planned = [Slot(template.hall_id, start_time, start_time + duration, start_time) for start_time in wanted]
+        existing = []
+        if planned:
+            existing = existing_slots(
+                [template.hall_id], min(slot.start_time for slot in planned), max(slot.end_time for slot in planned)
+            )
+        result.conflicts = find_conflicts(planned, [slot for slot in existing if slot.key not in outdated])
+        conflicting = {conflict.planned.key for conflict in result.conflicts}
+        showtimes = [
+            Showtime(
+                hall_id=template.hall_id, movie_id=template.movie_id, start_time=slot.start_time, template=template
+            )
+            for slot in sorted(planned)
+            if slot.key not in conflicting
+        ]
+        result.deleted = len(outdated)
+        if dry_run:
+            result.created = showtimes
+        else:
+            Showtime.objects.filter(pk__in=outdated).delete()
+            result.created = Showtime.objects.bulk_create(showtimes)
+            showtimes_created(result.created)
+    return result
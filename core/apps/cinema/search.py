@@ -0,0 +1,126 @@
+import time
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+
+from apps.cinema.models import Movie, Showtime
+from django.conf import settings
+from django.utils import timezone
+from utils.cache.pages import aget_versions, bump_versions
+from utils.cache.shared import is_shared_cache
+
+# Version namespace of the movie index; bumped whenever a movie, showtime or hall changes.
+SEARCH_NAMESPACE = "cinema:search"
+
+
+def normalize(text: str) -> str:
+    """
+    Fold case and accents and reduce punctuation to spaces ("Amélie!" -> "amelie").
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join("".join(char if char.isalnum() else " " for char in stripped.casefold()).split())
+
+
+@dataclass(frozen=True)
+class UpcomingShowtime:
+    id: int
+    start_time: datetime
+    hall_id: int
+    hall_name: str
+
+
+@dataclass(frozen=True)
+class MovieEntry:
+    id: int
+    title: str
+    normalized_title: str
+    showtimes: tuple[UpcomingShowtime, ...]
+
+    def upcoming(self, after: datetime, limit: int) -> list[UpcomingShowtime]:
+        return [showtime for showtime in self.showtimes if showtime.start_time > after][:limit]
+
+
+class MoviePrefixIndex:
+    """
+    In-memory prefix index over the words of every movie title.
+
+    Every query word has to be the prefix of some word in the title, so "dark kni" finds
+    "The Dark Knight". Titles starting with the query rank first, the rest alphabetically.
+    """
+    def __init__(self, entries: list[MovieEntry]):
+        self.entries = {entry.id: entry for entry in entries}
+        self.words = sorted(
+            (word, entry.id) for entry in entries for word in set(entry.normalized_title.split())
+        )
+
+    def _ids_with_prefix(self, prefix: str) -> set[int]:
+        ids = set()
+        position = bisect_left(self.words, (prefix,))
+        while position < len(self.words) and self.words[position][0].startswith(prefix):
+            ids.add(self.words[position][1])
+            position += 1
+        return ids
+
+    def search(self, query: str, limit: int = 10) -> list[MovieEntry]:
+        normalized_query = normalize(query)
+        prefixes = normalized_query.split()
+        if not prefixes:
+            return []
+        ids = self._ids_with_prefix(prefixes[0])
+        for prefix in prefixes[1:]:
+            ids &= self._ids_with_prefix(prefix)
+        matches = sorted(
+            (self.entries[movie_id] for movie_id in ids),
+            key=lambda entry: (not entry.normalized_title.startswith(normalized_query), entry.normalized_title)
+        )
+        return matches[:limit]
+
+
+async def build_movie_index() -> MoviePrefixIndex:
+    showtimes = (
+        Showtime.objects
+        .filter(start_time__gt=timezone.now())
+        .order_by("start_time")
+        .values_list("movie_id", "id", "start_time", "hall_id", "hall__name")
+    )
+    upcoming: defaultdict[int, list[UpcomingShowtime]] = defaultdict(list)
+    async for movie_id, showtime_id, start_time, hall_id, hall_name in showtimes:
+        upcoming[movie_id].append(UpcomingShowtime(showtime_id, start_time, hall_id, hall_name))
+    return MoviePrefixIndex([
+        MovieEntry(movie_id, title, normalize(title), tuple(upcoming[movie_id]))
+        async for movie_id, title in Movie.objects.values_list("id", "title")
+    ])
+
+
+# The index built by this process, the namespace version it was built from and when.
+_movie_index: tuple[int, float, MoviePrefixIndex] | None = None
+
+
+async def get_movie_index() -> MoviePrefixIndex:
+    """
+    Return this process' movie index, rebuilding it when another process bumped its version.
+
+    Up-to-date lookups cost a single cache read. Concurrent rebuilds after a bump are
+    harmless: they produce the same index and the last one wins. When the cache is local to
+    each process, other processes never see the bump, so the index is also rebuilt once it
+    is older than ``MOVIE_INDEX_LOCAL_TIMEOUT`` seconds.
+    """
+    global _movie_index
+    [version] = await aget_versions([SEARCH_NAMESPACE])
+    if (
+        _movie_index is None
+        or _movie_index[0] != version
+        or (not is_shared_cache() and time.monotonic() - _movie_index[1] > settings.MOVIE_INDEX_LOCAL_TIMEOUT)
+    ):
+        _movie_index = (version, time.monotonic(), await build_movie_index())
+    return _movie_index[2]
+
+
+def invalidate_movie_index() -> None:
+    """
+    Make every process rebuild its movie index after the current commit.
+    """
+    bump_versions(SEARCH_NAMESPACE)
@@ -0,0 +1,61 @@
+from apps.cinema.models import (
+    ACTIVE_RESERVATION_STATUSES, Reservation, ReservationSeat, ReservationStatus, Seat, Showtime
+)
+from apps.cinema.notifications import enqueue_reservation_confirmation
+from apps.cinema.pages import invalidate_showtime_pages
+from apps.user.models import User
+from django.shortcuts import get_object_or_404
+from utils.db.transactions import retry_atomic
+
+
+class ReservationService:
+    @staticmethod
+    @retry_atomic()
+    def create_reservation(user: User, showtime: Showtime, seat_ids: list[int]) -> Reservation:
+        reservation = Reservation.objects.create(user=user, showtime=showtime)
+        seats = []
+        for seat_id in seat_ids:
+            seat = get_object_or_404(Seat, pk=seat_id, hall=showtime.hall)
+            ReservationSeat.objects.create(reservation=reservation, seat=seat)
+            seats.append(seat)
+        Showtime.objects.filter(pk=showtime.pk).adjust_seat_counters(
+            reserved=len(seat_ids),
+            pending=len(seat_ids)
+        )
+        enqueue_reservation_confirmation(reservation, seats)
+        invalidate_showtime_pages([(showtime.hall_id, showtime.start_time)])
+        return reservation
+
+    @staticmethod
+    @retry_atomic()
+    def update_status(reservation: Reservation, status: str) -> Reservation:
+        """
+        Move a reservation to a new status and shift its showtime's seat counters accordingly.
+        """
+        reservation = Reservation.objects.select_for_update().get(pk=reservation.pk)
+        previous_status = reservation.status
+        if previous_status == status:
+            return reservation
+
+        reservation.status = status
+        reservation.save(update_fields=["status", "updated_at"])
+
+        seats_count = reservation.reserved_seats.count()
+        reserved_delta = (status in ACTIVE_RESERVATION_STATUSES) - (previous_status in ACTIVE_RESERVATION_STATUSES)
+        pending_delta = (status == ReservationStatus.PENDING) - (previous_status == ReservationStatus.PENDING)
+        showtimes = Showtime.objects.filter(pk=reservation.showtime_id)
+        showtimes.adjust_seat_counters(
+            reserved=seats_count * reserved_delta,
+            pending=seats_count * pending_delta
+        )
+        if reserved_delta:
+            invalidate_showtime_pages(showtimes.values_list("hall_id", "start_time"))
+        return reservation
+
+    @classmethod
+    def confirm_reservation(cls, reservation: Reservation) -> Reservation:
+        return cls.update_status(reservation, ReservationStatus.CONFIRMED)
+
+    @classmethod
+    def cancel_reservation(cls, reservation: Reservation) -> Reservation:
+        return cls.update_status(reservation, ReservationStatus.CANCELED)
@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from apps.cinema.models import CinemaHall, Reservation, ReservationStatus, Seat
+from apps.cinema.services import ReservationService
+from apps.jobs.registry import task
+from django.conf import settings
+from django.utils import timezone
+
+
+@task()
+def generate_hall_seats(hall_id: int) -> None:
+    """
+    Create the hall's missing seats; deferred by the post_save receiver for big halls.
+    """
+    hall = CinemaHall.objects.filter(pk=hall_id).first()
+    if hall is not None:
+        Seat.objects.create_missing_cells(hall)
+        # The hall's timestamp is part of the seat payload ETag.
+        CinemaHall.objects.filter(pk=hall_id).update(updated_at=timezone.now())
+
+
+@task(repeat=timedelta(minutes=1))
+def expire_reservation_holds(batch_size: int = 500) -> None:
+    """
+    Cancel pending reservations older than RESERVATION_HOLD_MINUTES, releasing their seats.
+    """
+    if not settings.RESERVATION_HOLD_MINUTES:
+        return
+    expired = Reservation.objects.filter(
+        status=ReservationStatus.PENDING,
+        created_at__lt=timezone.now() - timedelta(minutes=settings.RESERVATION_HOLD_MINUTES)
+    ).order_by("created_at")[:batch_size]
+    for reservation in expired:
+        ReservationService.cancel_reservation(reservation)
@@ -0,0 +1,178 @@
+import json
+from datetime import timedelta
+
+from apps.cinema.models import Reservation, Seat
+from apps.cinema.tests.factories import (
+    CinemaHallFactory, MovieFactory, ReservationFactory, ReservationSeatFactory, ShowtimeFactory
+)
+from apps.user.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+
+class ChangelistQueriesTest(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(email="admin@example.com", password="password123")  # noqa: S106
+        self.client.force_login(self.admin)
+
+    def create_reservation_seats(self, count):
+        for _ in range(count):
+            showtime = ShowtimeFactory()
+            seat = Seat.objects.filter(hall=showtime.hall).first()
+            ReservationSeatFactory(reservation=ReservationFactory(showtime=showtime), seat=seat)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def assert_bounded_queries(self, url_name):
+        url = reverse(url_name)
+        self.create_reservation_seats(2)
+        baseline = self.count_queries(url)
+        self.create_reservation_seats(5)
+        self.assertEqual(self.count_queries(url), baseline)
+
+    def test_seat_changelist(self):
+        self.assert_bounded_queries("admin:cinema_seat_changelist")
+
+    def test_showtime_changelist(self):
+        self.assert_bounded_queries("admin:cinema_showtime_changelist")
+
+    def test_reservation_changelist(self):
+        self.assert_bounded_queries("admin:cinema_reservation_changelist")
+
+    def test_reservation_seat_changelist(self):
+        self.assert_bounded_queries("admin:cinema_reservationseat_changelist")
+
+
+class ShowtimeAdminTest(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(email="admin@example.com", password="password123")  # noqa: S106
+        self.client.force_login(self.admin)
+        self.hall = CinemaHallFactory()
+        self.movie = MovieFactory(duration=90)
+
+    def test_is_expired_is_annotated(self):
+        upcoming = ShowtimeFactory(hall=self.hall, movie=self.movie, start_time=timezone.now() + timedelta(hours=3))
+        response = self.client.get(reverse("admin:cinema_showtime_changelist"))
+        showtime = next(obj for obj in response.context["cl"].result_list if obj.pk == upcoming.pk)
+        self.assertFalse(showtime.expired)
+        self.assertEqual(showtime.end_time, upcoming.start_time + timedelta(minutes=90))
+
+    def test_autocomplete_filter(self):
+        other_hall = CinemaHallFactory()
+        ShowtimeFactory(hall=self.hall, movie=self.movie)
+        ShowtimeFactory(hall=other_hall, movie=self.movie)
+
+        response = self.client.get(reverse("admin:cinema_showtime_changelist"), {"hall__id__exact": self.hall.id})
+
+        self.assertEqual(response.context["cl"].result_count, 1)
+        self.assertContains(response, 'data-lookup-kwarg="hall__id__exact"')
+        self.assertContains(response, "admin-autocomplete")
+
+
+class SeatLabelSearchTest(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(email="admin@example.com", password="password123")  # noqa: S106
+        self.client.force_login(self.admin)
+        self.hall = CinemaHallFactory(name="Grand", rows=6, seats_per_row=12)
+        CinemaHallFactory(name="Small", rows=6, seats_per_row=12)
+
+    def test_label_search_uses_label_column(self):
+        response = self.client.get(reverse("admin:cinema_seat_changelist"), {"q": "f12 Grand"})
+        seats = list(response.context["cl"].result_list)
+        self.assertEqual(len(seats), 1)
+        self.assertEqual(seats[0].label, "F12")
+        self.assertEqual(seats[0].hall, self.hall)
+
+    def test_label_shaped_terms_still_search_the_hall_name(self):
+        CinemaHallFactory(name="VIP2", rows=2, seats_per_row=2)
+
+        response = self.client.get(reverse("admin:cinema_seat_changelist"), {"q": "VIP2"})
+
+        self.assertEqual(response.context["cl"].result_count, 4)
+
+    def test_reservation_seat_label_search(self):
+        seat = Seat.objects.get(hall=self.hall, label="B3")
+        reservation_seat = ReservationSeatFactory(seat=seat)
+        ReservationSeatFactory(seat=Seat.objects.get(hall=self.hall, label="B4"))
+
+        response = self.client.get(reverse("admin:cinema_reservationseat_changelist"), {"q": "B3"})
+
+        self.assertEqual(list(response.context["cl"].result_list), [reservation_seat])
+
+
+class ReservationExportActionTest(TestCase):
+    def setUp(self):
+        admin = User.objects.create_superuser(email="admin@example.com", password="password123")  # noqa: S106
+        self.client.force_login(admin)
+        self.showtime = ShowtimeFactory(movie=MovieFactory(title="Alien"))
+        first, second = Seat.objects.filter(hall=self.showtime.hall).order_by("row", "seat_number")[:2]
+        self.reservation = ReservationFactory(showtime=self.showtime, user__email="viewer@example.com")
+        ReservationSeatFactory(reservation=self.reservation, seat=second)
+        ReservationSeatFactory(reservation=self.reservation, seat=first)
+        ReservationFactory()
+
+    def export(self, action):
+        return self.client.post(reverse("admin:cinema_reservation_changelist"), {
+            "action": action,
+            "_selected_action": [self.reservation.pk],
+        })
+
+    def test_csv_export(self):
+        response = self.export("export_csv")
+
+        self.assertTrue(response.streaming)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], "reservation_id,reserved_at,status,email,movie,hall,start_time,seats")
+        self.assertEqual(len(lines), 2)
+        self.assertIn("viewer@example.com,Alien", lines[1])
+        self.assertTrue(lines[1].endswith(",A1 A2"))
+
+    def test_ndjson_export_runs_a_fixed_number_of_queries(self):
+        ReservationSeatFactory(reservation=ReservationFactory(showtime=self.showtime))
+        response = self.export("export_ndjson")
+        with self.assertNumQueries(2):
+            rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual(rows[0]["seats"], ["A1", "A2"])
+        self.assertEqual(rows[0]["email"], "viewer@example.com")
+
+        response = self.client.post(reverse("admin:cinema_reservation_changelist"), {
+            "action": "export_ndjson",
+            "_selected_action": list(Reservation.objects.values_list("pk", flat=True)),
+        })
+        with self.assertNumQueries(2):
+            self.assertEqual(len(b"".join(response.streaming_content).splitlines()), 3)
+
+
+class ShowtimeImportViewTest(TestCase):
+    def setUp(self):
+        admin = User.objects.create_superuser(email="admin@example.com", password="password123")  # noqa: S106
+        self.client.force_login(admin)
+        self.url = reverse("admin:cinema_showtime_import")
+        self.hall = CinemaHallFactory(name="Hall 1")
+        MovieFactory(title="Alien", duration=120)
+        self.day = (timezone.localdate() + timedelta(days=1)).isoformat()
+
+    def upload(self, *start_times, dry_run=False):
+        content = "hall,movie,start_time\n" + "".join(f"Hall 1,Alien,{self.day} {start}\n" for start in start_times)
+        data = {"file": SimpleUploadedFile("showtimes.csv", content.encode(), content_type="text/csv")}
+        if dry_run:
+            data["dry_run"] = "on"
+        return self.client.post(self.url, data)
+
+    def test_import_redirects_to_the_changelist(self):
+        response = self.upload("10:00", "14:00")
+        self.assertRedirects(response, reverse("admin:cinema_showtime_changelist"))
+        self.assertEqual(self.hall.showtimes.count(), 2)
+
+    def test_conflicts_are_listed(self):
+        response = self.upload("10:00", "11:00", dry_run=True)
+        self.assertContains(response, "Line 3: overlaps line 2 in Hall 1")
+        self.assertEqual(self.hall.showtimes.count(), 0)
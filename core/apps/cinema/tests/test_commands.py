@@ -0,0 +1,134 @@
+import cProfile
+import json
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from apps.cinema.models import DailyScheduleRollup
+from apps.cinema.tests.factories import (
+    CinemaHallFactory, MovieFactory, ReservationFactory, ReservationSeatFactory, ShowtimeFactory
+)
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.utils import timezone
+
+
+class ReconcileSeatCountersCommandTest(TestCase):
+    def setUp(self):
+        self.showtime = ShowtimeFactory()
+        ReservationSeatFactory(reservation__showtime=self.showtime, reservation__status="CONFIRMED")
+
+    def test_dry_run_reports_without_fixing(self):
+        out = StringIO()
+        call_command("reconcile_seat_counters", "--dry-run", stdout=out)
+        self.showtime.refresh_from_db()
+        self.assertIn(f"Showtime {self.showtime.pk}: reserved 0 -> 1", out.getvalue())
+        self.assertEqual(self.showtime.reserved_count, 0)
+
+    def test_repairs_drift(self):
+        out = StringIO()
+        call_command("reconcile_seat_counters", stdout=out)
+        self.showtime.refresh_from_db()
+        self.assertEqual(self.showtime.reserved_count, 1)
+        self.assertIn("Repaired 1 showtime(s).", out.getvalue())
+
+
+class RebuildScheduleRollupCommandTest(TestCase):
+    def test_rebuilds_from_reservation_rows(self):
+        showtime = ShowtimeFactory()
+        ReservationSeatFactory(reservation__showtime=showtime, reservation__status="PENDING")
+        DailyScheduleRollup.objects.all().delete()
+
+        out = StringIO()
+        call_command("rebuild_schedule_rollup", stdout=out)
+
+        rollup = DailyScheduleRollup.objects.get(showtime=showtime)
+        self.assertEqual((rollup.reserved_count, rollup.pending_count), (1, 1))
+        self.assertIn("Rebuilt 1 schedule rollup row(s).", out.getvalue())
+
+
+class ExportReservationsCommandTest(TestCase):
+    def setUp(self):
+        self.confirmed = ReservationSeatFactory(reservation__status="CONFIRMED").reservation
+        ReservationSeatFactory(reservation__status="CANCELED")
+        ReservationFactory(status="CONFIRMED")
+
+    def test_exports_filtered_reservations_as_ndjson(self):
+        out, err = StringIO(), StringIO()
+        call_command(
+            "export_reservations", "--format", "ndjson", "--status", "CONFIRMED", "--progress-every", "1",
+            stdout=out, stderr=err
+        )
+
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([row["reservation_id"] for row in rows], [self.confirmed.pk, self.confirmed.pk + 2])
+        self.assertEqual(rows[1]["seats"], [])
+        self.assertIn("Exported 1/2 reservations...", err.getvalue())
+        self.assertIn("Exported 2 reservation(s).", err.getvalue())
+
+    def test_writes_csv_to_a_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "reservations.csv")
+            call_command("export_reservations", "--output", path, stderr=StringIO())
+            with open(path, encoding="utf-8") as output:
+                self.assertEqual(len(output.read().splitlines()), 4)
+
+    def test_invalid_dates_are_rejected(self):
+        for value in ("yesterday", "2026-02-30"):
+            with self.subTest(value), self.assertRaisesMessage(CommandError, "not a valid YYYY-MM-DD date"):
+                call_command("export_reservations", "--since", value, stdout=StringIO(), stderr=StringIO())
+
+
+class ImportShowtimesCommandTest(TestCase):
+    def test_imports_valid_rows_and_reports_the_rest(self):
+        CinemaHallFactory(name="Hall 1")
+        MovieFactory(title="Alien", duration=120)
+        day = (timezone.localdate() + timedelta(days=1)).isoformat()
+        out, err = StringIO(), StringIO()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "showtimes.csv")
+            with open(path, "w", encoding="utf-8") as csv_file:
+                csv_file.write(f"hall,movie,start_time\nHall 1,Alien,{day} 10:00\nHall 1,Gattaca,{day} 14:00\n")
+            call_command("import_showtimes", path, stdout=out, stderr=err)
+
+        self.assertIn("Created 1 showtime(s). 1 row(s) rejected.", out.getvalue())
+        self.assertIn("Line 3: unknown movie 'Gattaca'.", err.getvalue())
+
+
+class ProfileReportCommandTest(TestCase):
+    def test_reports_top_functions_of_stored_profiles(self):
+        with tempfile.TemporaryDirectory() as directory:
+            profiler = cProfile.Profile()
+            profiler.runcall(sorted, range(100))
+            profiler.dump_stats(os.path.join(directory, "20261019T120000-cinema+home-abcd1234.prof"))
+            output = StringIO()
+
+            call_command("profile_report", dir=directory, view="cinema:home", limit=3, stdout=output)
+            call_command("profile_report", dir=directory, view="cinema:schedule", stdout=output)
+
+        self.assertIn("1 profile(s) of cinema:home", output.getvalue())
+        self.assertIn("sorted", output.getvalue())
+        self.assertIn("No profiles found.", output.getvalue())
+
+
+class WarmUpCommandTest(TestCase):
+    @mock.patch("apps.cinema.management.commands.warm_up.is_shared_cache", return_value=True)
+    def test_reports_what_was_warmed(self, is_shared_cache):
+        ShowtimeFactory()
+        output = StringIO()
+
+        call_command("warm_up", host="testserver", insecure=True, stdout=output)
+
+        self.assertIn("cached 1 seat map(s) and 5 page(s)", output.getvalue())
+        self.assertIn("Warm-up complete.", output.getvalue())
+
+    def test_process_local_cache_is_not_warmed(self):
+        output = StringIO()
+
+        with mock.patch("apps.cinema.management.commands.warm_up.warm_up") as warm_up:
+            call_command("warm_up", stdout=output)
+
+        warm_up.assert_not_called()
+        self.assertIn("local to this process", output.getvalue())
@@ -0,0 +1,78 @@
+import json
+
+from apps.cinema.encoding import (
+    decode_mask, decode_seat_map, encode_ids, encode_mask, encode_seat_map, pack_bits, unpack_bits
+)
+from django.test import SimpleTestCase
+
+
+class SeatMapEncodingTest(SimpleTestCase):
+    def full_hall(self, rows, cols, first_id=1):
+        return [(first_id + index, index // cols + 1, index % cols + 1) for index in range(rows * cols)]
+
+    def test_full_hall_round_trip(self):
+        seats = self.full_hall(3, 4, first_id=50)
+        payload = encode_seat_map(3, 4, seats, [51, 60])
+
+        self.assertIsNone(payload["seats"])
+        self.assertEqual(payload["ids"], {"base": 50, "runs": [[1, 11]]})
+        self.assertEqual(decode_seat_map(payload), (seats, {51, 60}))
+
+    def test_gaps_and_scattered_ids_round_trip(self):
+        seats = [(7, 1, 1), (9, 1, 3), (10, 2, 2), (30, 3, 3), (31, 3, 1)]
+        payload = encode_seat_map(3, 3, seats, [9, 31])
+
+        decoded, reserved = decode_seat_map(json.loads(json.dumps(payload)))
+
+        self.assertEqual(decoded, sorted(seats, key=lambda seat: (seat[1], seat[2])))
+        self.assertEqual(reserved, {9, 31})
+
+    def test_seats_outside_fewer_rows_are_skipped(self):
+        seats = self.full_hall(3, 2)
+
+        payload = encode_seat_map(2, 2, seats, [6])
+
+        self.assertIsNone(payload["seats"])
+        self.assertEqual(decode_seat_map(payload), (seats[:4], set()))
+
+    def test_seats_outside_fewer_columns_do_not_collide(self):
+        seats = self.full_hall(2, 3)
+
+        payload = encode_seat_map(2, 2, seats, [3])
+
+        self.assertEqual(decode_seat_map(payload), ([(1, 1, 1), (2, 1, 2), (4, 2, 1), (5, 2, 2)], set()))
+
+    def test_mask_uses_the_shorter_encoding(self):
+        sparse = encode_mask([3, 4, 5], 400)
+        dense = encode_mask(range(0, 400, 2), 400)
+
+        self.assertEqual(sparse, {"runs": [3, 3, 394]})
+        self.assertIn("bits", dense)
+        self.assertEqual(decode_mask(dense, 400), set(range(0, 400, 2)))
+
+    def test_bits_round_trip(self):
+        self.assertEqual(pack_bits([0, 9], 10), bytes([0x80, 0x40]))
+        self.assertEqual(unpack_bits(bytes([0x80, 0x40]), 10), [0, 9])
+
+    def test_matching_layout_is_sent_as_is(self):
+        seats = [(1, 1, 1), (2, 1, 3), (3, 2, 2)]
+        layout = pack_bits([0, 2, 4], 6)
+
+        payload = encode_seat_map(2, 3, seats, [2], layout=layout)
+
+        self.assertEqual(decode_mask(payload["seats"], 6), {0, 2, 4})
+        self.assertEqual(decode_seat_map(payload), (seats, {2}))
+        self.assertEqual(decode_mask(encode_seat_map(2, 3, seats[:2], [], layout=layout)["seats"], 6), {0, 2})
+
+    def test_empty_ids(self):
+        self.assertEqual(encode_ids([]), {"base": None, "runs": []})
+        self.assertEqual(decode_seat_map(encode_seat_map(2, 2, [], [])), ([], set()))
+
+    def test_payload_is_orders_of_magnitude_smaller(self):
+        seats = self.full_hall(40, 50)
+        reserved = [seat_id for seat_id, row, _ in seats if row in (5, 6)]
+        per_seat = json.dumps({"seats": [[*seat, f"A{seat[2]}"] for seat in seats], "reserved": reserved})
+
+        compact = json.dumps(encode_seat_map(40, 50, seats, reserved))
+
+        self.assertLess(len(compact) * 100, len(per_seat))
@@ -0,0 +1,162 @@
+import json
+
+from apps.cinema.forms.admin_forms import CinemaHallAdminForm
+from apps.cinema.models import Seat
+from apps.cinema.tasks import generate_hall_seats
+from apps.cinema.tests.factories import CinemaHallFactory, ReservationFactory, ReservationSeatFactory
+from apps.jobs.models import Job
+from django.test import TestCase, override_settings
+
+
+class CinemaHallAdminFormTest(TestCase):
+    def setUp(self):
+        self.hall = CinemaHallFactory(rows=3, seats_per_row=4)
+
+    def get_form(self, added=(), removed=()):
+        data = {
+            "name": self.hall.name,
+            "rows": self.hall.rows,
+            "seats_per_row": self.hall.seats_per_row,
+            "seat_layout": json.dumps({"added": list(added), "removed": list(removed)}),
+        }
+        return CinemaHallAdminForm(data=data, instance=self.hall)
+
+    def test_layout_is_loaded_in_one_query(self):
+        Seat.objects.filter(hall=self.hall, row=2, seat_number=3).delete()
+        reserved_seat = Seat.objects.get(hall=self.hall, row=1, seat_number=1)
+        ReservationSeatFactory(seat=reserved_seat, reservation=ReservationFactory(status="CONFIRMED"))
+
+        with self.assertNumQueries(1):
+            form = CinemaHallAdminForm(instance=self.hall)
+
+        self.assertEqual(form.fields["seat_layout"].widget.layout, ["2111", "1101", "1111"])
+
+    def test_layout_is_not_rendered_for_new_halls(self):
+        form = CinemaHallAdminForm()
+        self.assertIsNone(form.fields["seat_layout"].widget.layout)
+
+    def test_save_applies_only_changed_cells(self):
+        Seat.objects.filter(hall=self.hall, row=3, seat_number=4).delete()
+        form = self.get_form(added=[[3, 4]], removed=[[1, 2], [2, 2]])
+        self.assertTrue(form.is_valid(), form.errors)
+
+        form.save()
+        form.save_seat_layout()
+
+        cells = set(Seat.objects.filter(hall=self.hall).values_list("row", "seat_number"))
+        self.assertEqual(len(cells), 10)
+        self.assertIn((3, 4), cells)
+        self.assertNotIn((1, 2), cells)
+        self.assertNotIn((2, 2), cells)
+
+    def test_save_stores_layout_and_renumbers_changed_rows(self):
+        form = self.get_form(removed=[[1, 2]])
+        self.assertTrue(form.is_valid(), form.errors)
+
+        form.save()
+        form.save_seat_layout()
+
+        self.hall.refresh_from_db()
+        self.assertEqual(self.hall.seat_count, 11)
+        self.assertNotIn((1, 2), self.hall.layout_cells())
+        labels = dict(Seat.objects.filter(hall=self.hall, row=1).values_list("seat_number", "label"))
+        self.assertEqual(labels, {1: "A1", 3: "A2", 4: "A3"})
+
+    def test_resizing_an_irregular_hall_keeps_its_seats(self):
+        Seat.objects.filter(hall=self.hall, row=1, seat_number=2).delete()
+        self.hall.set_layout(Seat.objects.filter(hall=self.hall).values_list("row", "seat_number"))
+        self.hall.save()
+        form = self.get_form()
+        form.data = {**form.data, "seats_per_row": 6}
+        self.assertTrue(form.is_valid(), form.errors)
+
+        form.save()
+        form.save_seat_layout()
+
+        self.hall.refresh_from_db()
+        self.assertEqual(set(self.hall.layout_cells()), set(Seat.objects.values_list("row", "seat_number")))
+
+    def test_shrinking_deletes_the_seats_outside_the_hall(self):
+        form = self.get_form()
+        form.data = {**form.data, "rows": 2, "seats_per_row": 3}
+        self.assertTrue(form.is_valid(), form.errors)
+
+        form.save()
+        form.save_seat_layout()
+
+        self.hall.refresh_from_db()
+        cells = set(Seat.objects.filter(hall=self.hall).values_list("row", "seat_number"))
+        self.assertEqual(cells, {(row, seat_number) for row in (1, 2) for seat_number in (1, 2, 3)})
+        self.assertEqual(self.hall.seat_count, 6)
+
+    def test_growing_puts_seats_on_the_new_cells(self):
+        Seat.objects.filter(hall=self.hall, row=1, seat_number=2).delete()
+        self.hall.set_layout(Seat.objects.filter(hall=self.hall).values_list("row", "seat_number"))
+        self.hall.save()
+        form = self.get_form()
+        form.data = {**form.data, "rows": 4, "seats_per_row": 5}
+        self.assertTrue(form.is_valid(), form.errors)
+
+        form.save()
+        form.save_seat_layout()
+
+        self.hall.refresh_from_db()
+        cells = set(Seat.objects.filter(hall=self.hall).values_list("row", "seat_number"))
+        self.assertEqual(len(cells), 19)
+        self.assertNotIn((1, 2), cells)
+        self.assertEqual(set(self.hall.layout_cells()), cells)
+        self.assertEqual(self.hall.seat_count, 19)
+        labels = dict(Seat.objects.filter(hall=self.hall, row=1).values_list("seat_number", "label"))
+        self.assertEqual(labels, {1: "A1", 3: "A2", 4: "A3", 5: "A4"})
+
+    @override_settings(SEAT_GENERATION_SYNC_LIMIT=10)
+    def test_creating_a_big_hall_keeps_a_full_layout(self):
+        form = CinemaHallAdminForm(data={"name": "Big", "rows": 4, "seats_per_row": 5, "seat_layout": ""})
+        self.assertTrue(form.is_valid(), form.errors)
+
+        hall = form.save()
+        form.save_seat_layout()
+        generate_hall_seats(**Job.objects.get(task=generate_hall_seats.name).kwargs)
+
+        hall.refresh_from_db()
+        self.assertIsNone(hall.layout)
+        self.assertEqual(hall.seat_count, 20)
+        self.assertEqual(Seat.objects.filter(hall=hall).count(), 20)
+
+    def test_shrinking_cannot_drop_reserved_seats(self):
+        reserved_seat = Seat.objects.get(hall=self.hall, row=3, seat_number=1)
+        ReservationSeatFactory(seat=reserved_seat, reservation=ReservationFactory(status="CONFIRMED"))
+        form = self.get_form()
+        form.data = {**form.data, "rows": 2}
+
+        self.assertFalse(form.is_valid())
+        self.assertIn("C1", str(form.non_field_errors()))
+
+    def test_reserved_seats_cannot_be_renumbered(self):
+        reserved_seat = Seat.objects.get(hall=self.hall, row=1, seat_number=3)
+        ReservationSeatFactory(seat=reserved_seat, reservation=ReservationFactory(status="CONFIRMED"))
+
+        form = self.get_form(removed=[[1, 2]])
+
+        self.assertFalse(form.is_valid())
+        self.assertIn("A3", str(form.errors["seat_layout"]))
+
+    def test_reserved_seats_cannot_be_removed(self):
+        reserved_seat = Seat.objects.get(hall=self.hall, row=1, seat_number=1)
+        ReservationSeatFactory(seat=reserved_seat, reservation=ReservationFactory(status="PENDING"))
+
+        form = self.get_form(removed=[[1, 1]])
+
+        self.assertFalse(form.is_valid())
+        self.assertIn("seat_layout", form.errors)
+
+    def test_changes_outside_hall_are_rejected(self):
+        form = self.get_form(added=[[4, 1]])
+        self.assertFalse(form.is_valid())
+        self.assertIn("seat_layout", form.errors)
+
+    def test_invalid_payload_is_rejected(self):
+        form = self.get_form()
+        form.data = {**form.data, "seat_layout": "not-json"}
+        self.assertFalse(form.is_valid())
+        self.assertIn("seat_layout", form.errors)
@@ -34,6 +34,48 @@ class CinemaHallModelTestCase(TestCase):
             )
 
 
+class CinemaHallLayoutTestCase(TestCase):
+    def setUp(self):
+        self.hall = CinemaHall(name="Aisle Hall", rows=2, seats_per_row=5)
+        # An aisle in the middle of both rows and a wheelchair bay at the start of row 2.
+        self.hall.set_layout([(1, 1), (1, 2), (1, 4), (1, 5), (2, 2), (2, 4), (2, 5)])
+        self.hall.save()
+
+    def test_layout_drives_seat_generation_and_numbering(self):
+        seats = Seat.objects.filter(hall=self.hall).order_by("row", "seat_number")
+
+        self.assertEqual(
+            [(seat.row, seat.seat_number, seat.label) for seat in seats],
+            [(1, 1, "A1"), (1, 2, "A2"), (1, 4, "A3"), (1, 5, "A4"), (2, 2, "B1"), (2, 4, "B2"), (2, 5, "B3")]
+        )
+        self.assertEqual(self.hall.total_seats, 7)
+        self.assertEqual(CinemaHall.objects.get(pk=self.hall.pk).seat_count, 7)
+
+    def test_seat_label_reads_one_row_of_the_layout(self):
+        labels = self.hall.seat_labels()
+        for row in (1, 2, 3):
+            for seat_number in range(1, 7):
+                with self.subTest(cell=(row, seat_number)):
+                    self.assertEqual(self.hall.seat_label(row, seat_number), labels.get((row, seat_number)))
+
+    def test_full_layout_is_not_stored(self):
+        self.hall.set_layout((row, seat_number) for row in (1, 2) for seat_number in range(1, 6))
+        self.hall.save()
+
+        self.assertIsNone(CinemaHall.objects.get(pk=self.hall.pk).layout)
+        self.assertEqual(CinemaHall.objects.get(pk=self.hall.pk).seat_count, 10)
+
+    def test_layout_survives_a_round_trip(self):
+        hall = CinemaHall.objects.get(pk=self.hall.pk)
+        self.assertEqual(hall.layout_cells(), self.hall.layout_cells())
+        self.assertEqual(len(bytes(hall.layout)), 2)
+
+    def test_showtime_capacity_follows_layout(self):
+        showtime = ShowtimeFactory(hall=self.hall)
+        self.assertEqual(showtime.total_capacity, 7)
+        self.assertEqual(showtime.schedule_rollup.capacity, 7)
+
+
 class SeatModelTestCase(TestCase):
     def setUp(self):
         self.hall = CinemaHallFactory(rows=8, seats_per_row=10, name="Test Hall")
@@ -47,14 +89,25 @@ class SeatModelTestCase(TestCase):
         with self.assertRaises(ValueError):
             seat.row_to_label(seat.row)
 
-    def test_label_property(self):
+    def test_label_is_stored_on_save(self):
         seat = Seat(hall=self.hall, row=2, seat_number=10)
-        self.assertEqual(seat.label, "B10")
+        seat.save()
+        self.assertEqual(Seat.objects.get(pk=seat.pk).label, "B10")
 
     def test_label_invalid_row(self):
         seat = Seat(hall=self.hall, row=0, seat_number=1)
         with self.assertRaises(ValueError):
-            _ = seat.label
+            seat.save()
+
+    def test_generated_seats_have_labels(self):
+        labels = set(Seat.objects.filter(hall=self.hall).values_list("label", flat=True))
+        self.assertEqual(len(labels), 80)
+        self.assertIn("A1", labels)
+        self.assertIn("H10", labels)
+
+    def test_with_label(self):
+        seat = Seat.objects.filter(hall=self.hall).with_label(" f7 ").get()
+        self.assertEqual((seat.row, seat.seat_number), (6, 7))
 
 
 class MovieModelTestCase(TestCase):
@@ -135,6 +188,8 @@ class ShowTimeModelTestCase(TestCase):
     def test_remaining_capacity(self):
         ReservationSeatFactory(reservation__showtime=self.showtime, reservation__status="PENDING")
         ReservationSeatFactory(reservation__showtime=self.showtime, reservation__status="CONFIRMED")
+        Showtime.objects.filter(pk=self.showtime.pk).refresh_seat_counters()
+        self.showtime.refresh_from_db()
         self.assertEqual(self.showtime.remaining_capacity, self.showtime.total_capacity - 2)
 
 
@@ -0,0 +1,81 @@
+import csv
+from datetime import datetime, time, timedelta
+
+from apps.cinema.models import Seat
+from apps.cinema.reports import occupancy_report
+from apps.cinema.services import ReservationService
+from apps.cinema.tests.factories import CinemaHallFactory, MovieFactory, ShowtimeFactory
+from apps.user.tests.factories import UserFactory
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+
+class OccupancyReportTest(TestCase):
+    def setUp(self):
+        self.day = timezone.localdate() + timedelta(days=1)
+        self.hall_a = CinemaHallFactory(name="A", rows=2, seats_per_row=2)
+        self.hall_b = CinemaHallFactory(name="B", rows=2, seats_per_row=3)
+        self.alien = MovieFactory(title="Alien")
+        self.morning = ShowtimeFactory(movie=self.alien, hall=self.hall_a, start_time=self.at(10))
+        self.evening = ShowtimeFactory(movie=MovieFactory(title="Brazil"), hall=self.hall_b, start_time=self.at(18))
+        ShowtimeFactory(movie=self.alien, hall=self.hall_a, start_time=self.at(10, days=1))
+
+        seats = list(Seat.objects.filter(hall=self.hall_a).order_by("pk"))
+        ReservationService.confirm_reservation(
+            ReservationService.create_reservation(UserFactory(), self.morning, [seats[0].pk])
+        )
+        ReservationService.create_reservation(UserFactory(), self.morning, [seats[1].pk])
+        ReservationService.cancel_reservation(
+            ReservationService.create_reservation(UserFactory(), self.morning, [seats[2].pk])
+        )
+
+    def at(self, hour, days=0):
+        return timezone.make_aware(datetime.combine(self.day + timedelta(days=days), time(hour)))
+
+    def report(self, breakdown):
+        header, rows = occupancy_report(breakdown, self.day, self.day)
+        return header, list(rows)
+
+    def test_by_movie(self):
+        header, rows = self.report("movie")
+        self.assertEqual(header, ["movie_id", "movie", "showtimes", "capacity", "reserved_seats", "fill_rate"])
+        self.assertEqual(rows, [
+            [self.alien.pk, "Alien", 1, 4, 2, 0.5],
+            [self.evening.movie_id, "Brazil", 1, 6, 0, 0],
+        ])
+
+    def test_by_weekday_and_slot(self):
+        self.assertEqual(self.report("weekday")[1], [[self.day.strftime("%A"), 2, 10, 2, 0.2]])
+        self.assertEqual(self.report("slot")[1], [["evening", 1, 6, 0, 0], ["morning", 1, 4, 2, 0.5]])
+
+    def test_by_showtime(self):
+        rows = self.report("showtime")[1]
+        self.assertEqual(rows[0], [self.morning.pk, self.morning.start_time.isoformat(), "Alien", "A", 1, 4, 2, 0.5])
+        self.assertEqual(len(rows), 2)
+
+
+class OccupancyReportViewTest(TestCase):
+    def setUp(self):
+        self.url = reverse("cinema:occupancy_report")
+        ShowtimeFactory(movie=MovieFactory(title="Alien"), start_time=timezone.now() + timedelta(minutes=5))
+
+    def test_streams_csv_to_staff(self):
+        self.client.force_login(UserFactory(is_staff=True))
+
+        response = self.client.get(self.url, {"by": "hall"})
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        rows = list(csv.reader(b"".join(response.streaming_content).decode().splitlines()))
+        self.assertEqual(rows[0][:2], ["hall_id", "hall"])
+        self.assertEqual(len(rows), 2)
+
+    def test_rejects_other_users(self):
+        self.client.force_login(UserFactory())
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_invalid_range(self):
+        self.client.force_login(UserFactory(is_staff=True))
+        response = self.client.get(self.url, {"start": "2026-02-01", "end": "2026-01-01"})
+        self.assertEqual(response.status_code, 400)
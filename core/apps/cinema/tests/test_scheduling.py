@@ -0,0 +1,129 @@
+from datetime import datetime, time, timedelta
+
+from apps.cinema.models import DailyScheduleRollup, Showtime, ShowtimeTemplate
+from apps.cinema.scheduling import Slot, find_conflicts, generate_template_showtimes, import_showtimes
+from apps.cinema.tests.factories import CinemaHallFactory, MovieFactory, ReservationFactory, ShowtimeFactory
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+
+def slot(hall_id, start_hour, end_hour, key):
+    day = datetime(2030, 1, 1)
+    return Slot(hall_id, day + timedelta(hours=start_hour), day + timedelta(hours=end_hour), key)
+
+
+class FindConflictsTest(SimpleTestCase):
+    def test_reports_overlaps_with_existing_and_planned_slots(self):
+        planned = [slot(1, 10, 12, "a"), slot(1, 11, 13, "b"), slot(1, 13, 14, "c"), slot(2, 10, 12, "d")]
+        existing = [slot(1, 9, 10.5, 7), slot(2, 12, 14, 8)]
+
+        conflicts = {(conflict.planned.key, conflict.other.key, conflict.existing) for conflict in find_conflicts(
+            planned, existing
+        )}
+
+        self.assertEqual(conflicts, {("a", 7, True), ("b", "a", False)})
+
+    def test_existing_overlaps_are_ignored(self):
+        self.assertEqual(find_conflicts([], [slot(1, 10, 12, 1), slot(1, 11, 13, 2)]), [])
+
+
+class ImportShowtimesTest(TestCase):
+    def setUp(self):
+        self.day = timezone.localdate() + timedelta(days=1)
+        self.hall = CinemaHallFactory(name="Hall 1")
+        self.movie = MovieFactory(title="Alien", duration=120)
+        self.existing = ShowtimeFactory(hall=self.hall, movie=self.movie, start_time=self.at(10))
+
+    def at(self, hour):
+        return timezone.make_aware(datetime.combine(self.day, time(hour)))
+
+    def lines(self, *rows):
+        return ["hall,movie,start_time", *(",".join(row) for row in rows)]
+
+    def test_creates_valid_rows_and_reports_every_problem(self):
+        day = self.day.isoformat()
+        lines = self.lines(
+            ("Hall 1", "Alien", f"{day} 13:00"),
+            ("Hall 1", "Alien", f"{day} 11:00"),
+            ("Hall 1", "Alien", f"{day} 16:00"),
+            ("Hall 1", "Alien", f"{day} 17:00"),
+            ("Hall 9", "Alien", f"{day} 20:00"),
+            ("Hall 1", "Alien", "tomorrow"),
+        )
+
+        with self.assertNumQueries(9):
+            result = import_showtimes(lines)
+
+        self.assertEqual([showtime.start_time for showtime in result.created], [self.at(13)])
+        self.assertEqual(result.errors, ["Line 6: unknown hall 'Hall 9'.", "Line 7: invalid start time 'tomorrow'."])
+        self.assertEqual(result.conflicting_lines, {3, 4, 5})
+        self.assertEqual(len(result.conflict_messages()), 2)
+        self.assertTrue(DailyScheduleRollup.objects.filter(showtime=result.created[0]).exists())
+
+    def test_dry_run_creates_nothing(self):
+        result = import_showtimes(self.lines(("Hall 1", "Alien", f"{self.day.isoformat()} 20:00")), dry_run=True)
+        self.assertEqual(len(result.created), 1)
+        self.assertEqual(Showtime.objects.count(), 1)
+
+    def test_missing_columns(self):
+        result = import_showtimes(["hall,start_time"])
+        self.assertEqual(result.errors, ["Missing column(s): movie."])
+
+
+class ShowtimeTemplateTest(TestCase):
+    def setUp(self):
+        # A Monday at least a day ahead, so every generated showtime is in the future.
+        self.monday = timezone.localdate() + timedelta(days=1)
+        self.monday += timedelta(days=(7 - self.monday.weekday()) % 7)
+        self.template = ShowtimeTemplate.objects.create(
+            movie=MovieFactory(duration=120),
+            hall=CinemaHallFactory(),
+            starts_on=self.monday,
+            ends_on=self.monday + timedelta(days=6),
+            weekdays="135",
+            times="21:00, 14:00"
+        )
+
+    def at(self, days, hour, minute=0):
+        return timezone.make_aware(datetime.combine(self.monday + timedelta(days=days), time(hour, minute)))
+
+    def start_times(self):
+        return list(self.template.showtimes.order_by("start_time").values_list("start_time", flat=True))
+
+    def test_expand(self):
+        self.assertEqual(self.template.expand(), [
+            self.at(0, 14), self.at(0, 21), self.at(2, 14), self.at(2, 21), self.at(4, 14), self.at(4, 21),
+        ])
+
+    def test_generation_is_idempotent(self):
+        self.assertEqual(len(generate_template_showtimes(self.template).created), 6)
+
+        result = generate_template_showtimes(self.template)
+
+        self.assertEqual((len(result.created), result.deleted, result.unchanged), (0, 0, 6))
+
+    def test_regeneration_only_touches_changed_showtimes(self):
+        generate_template_showtimes(self.template)
+        reserved = self.template.showtimes.get(start_time=self.at(2, 21))
+        ReservationFactory(showtime=reserved)
+        untouched_ids = set(self.template.showtimes.filter(start_time__hour__lt=20).values_list("pk", flat=True))
+
+        self.template.times = "14:00, 18:00"
+        self.template.save()
+        result = generate_template_showtimes(self.template)
+
+        self.assertEqual((len(result.created), result.deleted, result.unchanged), (3, 2, 3))
+        self.assertEqual(result.kept_reserved, [reserved.pk])
+        self.assertTrue(untouched_ids <= set(self.template.showtimes.values_list("pk", flat=True)))
+        self.assertEqual(self.start_times(), [
+            self.at(0, 14), self.at(0, 18), self.at(2, 14), self.at(2, 18), self.at(2, 21), self.at(4, 14),
+            self.at(4, 18),
+        ])
+
+    def test_conflicting_slots_are_skipped(self):
+        ShowtimeFactory(hall=self.template.hall, start_time=self.at(2, 20))
+
+        result = generate_template_showtimes(self.template)
+
+        self.assertEqual([conflict.planned.start_time for conflict in result.conflicts], [self.at(2, 21)])
+        self.assertEqual(len(self.start_times()), 5)
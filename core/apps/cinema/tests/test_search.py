@@ -0,0 +1,82 @@
+from datetime import timedelta
+
+from apps.cinema.models import Showtime
+from apps.cinema.search import MovieEntry, MoviePrefixIndex, normalize
+from apps.cinema.tests.factories import MovieFactory, ShowtimeFactory
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+
+def build_index(*titles):
+    return MoviePrefixIndex([
+        MovieEntry(movie_id, title, normalize(title), ()) for movie_id, title in enumerate(titles, start=1)
+    ])
+
+
+class MoviePrefixIndexTest(TestCase):
+    def setUp(self):
+        self.index = build_index("The Dark Knight", "Dark Waters", "Amélie", "Darkman", "Inception")
+
+    def search(self, query):
+        return [entry.title for entry in self.index.search(query)]
+
+    def test_matches_word_prefixes(self):
+        self.assertEqual(self.search("dark"), ["Dark Waters", "Darkman", "The Dark Knight"])
+        self.assertEqual(self.search("kni"), ["The Dark Knight"])
+
+    def test_every_query_word_must_match(self):
+        self.assertEqual(self.search("dark kn"), ["The Dark Knight"])
+        self.assertEqual(self.search("dark inc"), [])
+
+    def test_ignores_case_accents_and_punctuation(self):
+        self.assertEqual(self.search("AMELIE!"), ["Amélie"])
+        self.assertEqual(self.search("  "), [])
+
+    def test_limit(self):
+        self.assertEqual(len(self.index.search("d", limit=2)), 2)
+
+
+class MovieAutocompleteViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("cinema:movie_autocomplete")
+        self.showtime = ShowtimeFactory(movie=MovieFactory(title="Interstellar"))
+        past = ShowtimeFactory(movie=self.showtime.movie, start_time=timezone.now() + timedelta(days=1))
+        Showtime.objects.filter(pk=past.pk).update(start_time=timezone.now() - timedelta(days=1))
+        MovieFactory(title="Inside Out")
+
+    def test_returns_matching_movies_with_upcoming_showtimes(self):
+        results = self.client.get(self.url, {"q": "inter"}).json()["results"]
+
+        self.assertEqual([movie["title"] for movie in results], ["Interstellar"])
+        self.assertEqual([showtime["id"] for showtime in results[0]["showtimes"]], [self.showtime.pk])
+        self.assertEqual(
+            results[0]["showtimes"][0]["url"], reverse("cinema:hall_showtimes", args=[self.showtime.hall_id])
+        )
+
+    def test_keystrokes_are_served_without_queries(self):
+        self.client.get(self.url, {"q": "i"})
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {"q": "ins"})
+        self.assertEqual([movie["title"] for movie in response.json()["results"]], ["Inside Out"])
+
+    def test_movie_changes_rebuild_the_index(self):
+        self.client.get(self.url, {"q": "i"})
+        with self.captureOnCommitCallbacks(execute=True):
+            MovieFactory(title="Into the Wild")
+
+        results = self.client.get(self.url, {"q": "into"}).json()["results"]
+
+        self.assertEqual([movie["title"] for movie in results], ["Into the Wild"])
+
+    @override_settings(MOVIE_INDEX_LOCAL_TIMEOUT=0)
+    def test_index_expires_when_the_cache_is_local(self):
+        self.client.get(self.url, {"q": "i"})
+        # Saved by another process: this one's local cache never sees the version bump.
+        MovieFactory(title="Into the Wild")
+
+        results = self.client.get(self.url, {"q": "into"}).json()["results"]
+
+        self.assertEqual([movie["title"] for movie in results], ["Into the Wild"])
@@ -0,0 +1,154 @@
+from datetime import timedelta
+
+from apps.cinema.models import DailyScheduleRollup, Reservation, ReservationStatus, Seat, Showtime
+from apps.cinema.notifications import RESERVATION_CONFIRMATION
+from apps.cinema.services import ReservationService
+from apps.cinema.tasks import expire_reservation_holds, generate_hall_seats
+from apps.cinema.tests.factories import CinemaHallFactory, ReservationSeatFactory, ShowtimeFactory
+from apps.jobs.models import Job
+from apps.outbox.dispatcher import OutboxDispatcher
+from apps.outbox.models import OutboxMessage
+from apps.user.tests.factories import UserFactory
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+
+class ReservationServiceCountersTest(TestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.hall = CinemaHallFactory(rows=5, seats_per_row=5)
+        self.showtime = ShowtimeFactory(hall=self.hall)
+        self.seat_ids = list(Seat.objects.filter(hall=self.hall, row=1).values_list("id", flat=True)[:3])
+
+    def assert_counters(self, reserved, pending):
+        self.showtime.refresh_from_db()
+        self.assertEqual((self.showtime.reserved_count, self.showtime.pending_count), (reserved, pending))
+
+    def test_create_reservation_increments_counters(self):
+        ReservationService.create_reservation(self.user, self.showtime, self.seat_ids)
+        self.assert_counters(reserved=3, pending=3)
+        self.assertEqual(self.showtime.remaining_capacity, 22)
+
+    def test_confirm_reservation_clears_pending(self):
+        reservation = ReservationService.create_reservation(self.user, self.showtime, self.seat_ids)
+        ReservationService.confirm_reservation(reservation)
+        self.assert_counters(reserved=3, pending=0)
+
+    def test_cancel_reservation_releases_seats(self):
+        reservation = ReservationService.create_reservation(self.user, self.showtime, self.seat_ids)
+        ReservationService.confirm_reservation(reservation)
+        ReservationService.cancel_reservation(reservation)
+        self.assert_counters(reserved=0, pending=0)
+
+    def test_repeated_status_update_is_a_noop(self):
+        reservation = ReservationService.create_reservation(self.user, self.showtime, self.seat_ids)
+        ReservationService.cancel_reservation(reservation)
+        ReservationService.cancel_reservation(reservation)
+        self.assert_counters(reserved=0, pending=0)
+
+    def test_refresh_seat_counters_repairs_drift(self):
+        ReservationSeatFactory(reservation__showtime=self.showtime, reservation__status="PENDING")
+        ReservationSeatFactory(reservation__showtime=self.showtime, reservation__status="CONFIRMED")
+
+        drifted = Showtime.objects.refresh_seat_counters()
+
+        self.assertEqual([drift.showtime_id for drift in drifted], [self.showtime.pk])
+        self.assert_counters(reserved=2, pending=1)
+        self.assertEqual(Showtime.objects.refresh_seat_counters(), [])
+
+
+class DailyScheduleRollupTest(TestCase):
+    def setUp(self):
+        self.hall = CinemaHallFactory(rows=5, seats_per_row=5)
+        self.showtime = ShowtimeFactory(hall=self.hall, movie__duration=90)
+        self.seat_ids = list(Seat.objects.filter(hall=self.hall, row=1).values_list("id", flat=True)[:3])
+
+    def get_rollup(self):
+        return DailyScheduleRollup.objects.get(showtime=self.showtime)
+
+    def test_showtime_gets_a_rollup_row(self):
+        rollup = self.get_rollup()
+        self.assertEqual(rollup.date, timezone.localdate(self.showtime.start_time))
+        self.assertEqual(rollup.end_time, self.showtime.start_time + timedelta(minutes=90))
+        self.assertEqual(rollup.capacity, 25)
+
+    def test_reservations_shift_the_counters(self):
+        reservation = ReservationService.create_reservation(UserFactory(), self.showtime, self.seat_ids)
+        self.assertEqual((self.get_rollup().reserved_count, self.get_rollup().pending_count), (3, 3))
+
+        ReservationService.cancel_reservation(reservation)
+        self.assertEqual((self.get_rollup().reserved_count, self.get_rollup().pending_count), (0, 0))
+
+    def test_movie_and_hall_edits_refresh_the_row(self):
+        self.showtime.movie.duration = 120
+        self.showtime.movie.save()
+        self.hall.rows = 6
+        self.hall.save()
+
+        rollup = self.get_rollup()
+        self.assertEqual(rollup.end_time, self.showtime.start_time + timedelta(minutes=120))
+        self.assertEqual(rollup.capacity, 30)
+
+    def test_counter_repair_refreshes_the_row(self):
+        ReservationSeatFactory(reservation__showtime=self.showtime, reservation__status="CONFIRMED")
+
+        Showtime.objects.refresh_seat_counters()
+
+        self.assertEqual(self.get_rollup().reserved_count, 1)
+
+
+class ReservationConfirmationTest(TestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.hall = CinemaHallFactory(rows=5, seats_per_row=5)
+        self.showtime = ShowtimeFactory(hall=self.hall)
+        self.seat_ids = list(Seat.objects.filter(hall=self.hall, row=1).values_list("id", flat=True)[:2])
+
+    def test_confirmation_is_queued_with_the_reservation(self):
+        reservation = ReservationService.create_reservation(self.user, self.showtime, self.seat_ids)
+
+        message = OutboxMessage.objects.get(topic=RESERVATION_CONFIRMATION)
+        self.assertEqual(message.payload["reservation_id"], reservation.pk)
+        self.assertEqual(message.payload["email"], self.user.email)
+        self.assertEqual(message.payload["seats"], ["A1", "A2"])
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_dispatcher_sends_the_email(self):
+        ReservationService.create_reservation(self.user, self.showtime, self.seat_ids)
+
+        OutboxDispatcher().run_once()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [self.user.email])
+        self.assertIn(self.showtime.movie.title, mail.outbox[0].body)
+        self.assertIn("A1, A2", mail.outbox[0].body)
+
+
+class CinemaTasksTest(TestCase):
+    @override_settings(SEAT_GENERATION_SYNC_LIMIT=10)
+    def test_big_hall_seats_are_generated_by_a_job(self):
+        hall = CinemaHallFactory(rows=4, seats_per_row=4)
+        self.assertFalse(Seat.objects.filter(hall=hall).exists())
+        job = Job.objects.get(task=generate_hall_seats.name)
+
+        generate_hall_seats(**job.kwargs)
+
+        self.assertEqual(Seat.objects.filter(hall=hall).count(), 16)
+
+    @override_settings(RESERVATION_HOLD_MINUTES=15)
+    def test_expired_holds_are_canceled(self):
+        showtime = ShowtimeFactory()
+        first_seat, second_seat = Seat.objects.filter(hall=showtime.hall)[:2]
+        stale = ReservationService.create_reservation(UserFactory(), showtime, [first_seat.id])
+        fresh = ReservationService.create_reservation(UserFactory(), showtime, [second_seat.id])
+        Reservation.objects.filter(pk=stale.pk).update(created_at=timezone.now() - timedelta(minutes=20))
+
+        expire_reservation_holds()
+
+        stale.refresh_from_db()
+        fresh.refresh_from_db()
+        self.assertEqual(stale.status, ReservationStatus.CANCELED)
+        self.assertEqual(fresh.status, ReservationStatus.PENDING)
+        showtime.refresh_from_db()
+        self.assertEqual(showtime.reserved_count, 1)
@@ -1,12 +1,15 @@
-from datetime import timedelta
+from datetime import datetime, time, timedelta
 
-from apps.cinema.models import CinemaHall, Reservation, ReservationSeat
+from apps.cinema.encoding import decode_seat_map
+from apps.cinema.models import CinemaHall, Reservation, ReservationSeat, Seat
+from apps.cinema.services import ReservationService
 from apps.cinema.tests.factories import (
     CinemaHallFactory, MovieFactory, ReservationFactory, ReservationSeatFactory, SeatFactory, ShowtimeFactory
 )
 from apps.user.tests.factories import UserFactory
 from django.conf import settings
 from django.contrib.messages import get_messages
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
 from django.utils import timezone
@@ -14,6 +17,7 @@ from django.utils import timezone
 
 class HomeViewTest(TestCase):
     def setUp(self):
+        cache.clear()
         self.hall1 = CinemaHall.objects.create(name="Hall 1", rows=5, seats_per_row=5)
         self.hall2 = CinemaHall.objects.create(name="Hall 2", rows=6, seats_per_row=6)
 
@@ -35,6 +39,7 @@ class HomeViewTest(TestCase):
 
 class ShowtimeListViewTest(TestCase):
     def setUp(self):
+        cache.clear()
         self.hall = CinemaHallFactory()
         self.movie = MovieFactory()
         self.showtime1 = ShowtimeFactory(
@@ -76,20 +81,123 @@ class ShowtimeListViewTest(TestCase):
         response = self.client.get(url)
         self.assertEqual(response.context["hall"], self.hall)
 
-    def test_reserved_map(self):
+    async def test_async_request(self):
         url = reverse("cinema:hall_showtimes", args=[self.hall.id])
-        response = self.client.get(url)
-        reserved_map = response.context["reserved_map"]
-        self.assertIn(self.showtime1.id, reserved_map)
-        self.assertIn(self.seat1.id, reserved_map[self.showtime1.id])
-        self.assertNotIn(self.seat2.id, reserved_map[self.showtime1.id])
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["showtimes"]), 2)
 
-    def test_seats_map(self):
+    def test_seat_maps_are_not_inlined(self):
         url = reverse("cinema:hall_showtimes", args=[self.hall.id])
         response = self.client.get(url)
-        seats_map = response.context["seats_map"]
-        self.assertIn(self.hall.id, seats_map)
-        self.assertGreaterEqual(len(seats_map[self.hall.id]), 2)
+        self.assertNotIn("reserved_map", response.context)
+        self.assertNotIn("seats_map", response.context)
+        self.assertContains(response, reverse("cinema:showtime_seats", args=[0]))
+
+
+class ScheduleViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.day = timezone.localdate() + timedelta(days=1)
+        self.url = f"{reverse('cinema:schedule')}?date={self.day.isoformat()}"
+        self.hall_a = CinemaHallFactory(name="A", rows=2, seats_per_row=2)
+        self.hall_b = CinemaHallFactory(name="B", rows=2, seats_per_row=2)
+        self.movie = MovieFactory(title="Alien", duration=120)
+        self.evening = ShowtimeFactory(movie=self.movie, hall=self.hall_a, start_time=self.at(20))
+        self.noon = ShowtimeFactory(movie=self.movie, hall=self.hall_a, start_time=self.at(12))
+        self.other_hall = ShowtimeFactory(movie=self.movie, hall=self.hall_b, start_time=self.at(15))
+        self.other_movie = ShowtimeFactory(movie=MovieFactory(title="Brazil"), hall=self.hall_b, start_time=self.at(9))
+        self.next_day = ShowtimeFactory(hall=self.hall_a, start_time=self.at(12, days=1))
+
+    def at(self, hour, days=0):
+        return timezone.make_aware(datetime.combine(self.day + timedelta(days=days), time(hour)))
+
+    def test_groups_the_day_by_movie_and_hall_in_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+
+        grouped = [
+            (
+                entry["movie"].title,
+                [(group["hall"].name, [row.showtime_id for row in group["showtimes"]]) for group in entry["halls"]]
+            )
+            for entry in response.context["schedule"]
+        ]
+        self.assertEqual(grouped, [
+            ("Alien", [("A", [self.noon.pk, self.evening.pk]), ("B", [self.other_hall.pk])]),
+            ("Brazil", [("B", [self.other_movie.pk])]),
+        ])
+        self.assertContains(response, "4/4 left")
+
+    def test_moved_showtime_invalidates_both_dates(self):
+        next_url = f"{reverse('cinema:schedule')}?date={(self.day + timedelta(days=1)).isoformat()}"
+        self.client.get(self.url)
+        self.client.get(next_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other_movie.start_time = self.at(9, days=1)
+            self.other_movie.save()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Page-Cache"], "MISS")
+        self.assertNotContains(response, "Brazil")
+        self.assertContains(self.client.get(next_url), "Brazil")
+
+    def test_defaults_to_today(self):
+        response = self.client.get(reverse("cinema:schedule"))
+        self.assertEqual(response.context["day"], timezone.localdate())
+
+    def test_invalid_date(self):
+        response = self.client.get(reverse("cinema:schedule"), {"date": "2026-02-30"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_dates_outside_the_window(self):
+        for value in ("0001-01-01", "9999-12-31", (timezone.localdate() + timedelta(days=366)).isoformat()):
+            with self.subTest(value):
+                response = self.client.get(reverse("cinema:schedule"), {"date": value})
+                self.assertEqual(response.status_code, 404)
+
+
+class ShowtimeSeatsViewTest(TestCase):
+    def setUp(self):
+        self.hall = CinemaHallFactory(rows=2, seats_per_row=2)
+        self.showtime = ShowtimeFactory(hall=self.hall, start_time=timezone.now() + timedelta(days=1))
+        self.seat = Seat.objects.get(hall=self.hall, row=1, seat_number=2)
+        self.url = reverse("cinema:showtime_seats", args=[self.showtime.id])
+        cache.clear()
+
+    def reserve(self, seat):
+        return ReservationService.create_reservation(UserFactory(), self.showtime, [seat.id])
+
+    def test_payload(self):
+        self.reserve(self.seat)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        seats, reserved = decode_seat_map(response.json())
+        self.assertEqual([seat[1:] for seat in seats], [(1, 1), (1, 2), (2, 1), (2, 2)])
+        self.assertEqual(reserved, {self.seat.id})
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_unchanged_seats_return_not_modified(self):
+        etag = self.client.get(self.url)["ETag"]
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+
+    def test_reservation_changes_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        reservation = self.reserve(self.seat)
+        response = self.client.get(self.url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(decode_seat_map(response.json())[1], {self.seat.id})
+
+        ReservationService.cancel_reservation(reservation)
+        response = self.client.get(self.url, headers={"if-none-match": response["ETag"]})
+        self.assertEqual(decode_seat_map(response.json())[1], set())
+
+    def test_unknown_showtime(self):
+        response = self.client.get(reverse("cinema:showtime_seats", args=[0]))
+        self.assertEqual(response.status_code, 404)
 
 
 class ReserveSeatsViewTest(TestCase):
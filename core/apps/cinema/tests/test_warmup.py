@@ -0,0 +1,29 @@
+from apps.cinema.tests.factories import ReservationFactory, ReservationSeatFactory, ShowtimeFactory
+from apps.cinema.views import ShowtimeSeatsView
+from apps.cinema.warmup import warm_up
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+
+class WarmUpTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.showtime = ShowtimeFactory()
+        seat = self.showtime.hall.seats.first()
+        ReservationSeatFactory(seat=seat, reservation=ReservationFactory(showtime=self.showtime, status="CONFIRMED"))
+
+    def test_seat_maps_match_the_view(self):
+        result = warm_up(pages=False)
+
+        self.assertEqual(result.seat_maps, 1)
+        self.assertGreater(result.templates, 0)
+        key = ShowtimeSeatsView.get_cache_key(ShowtimeSeatsView.get_etag(self.showtime))
+        self.assertEqual(cache.get(key), ShowtimeSeatsView.get_payload(self.showtime))
+
+    def test_pages_are_cached_for_the_host(self):
+        result = warm_up(host="testserver", secure=False)
+
+        self.assertEqual((result.pages, result.failed_pages), (5, 0))
+        for url in (reverse("cinema:home"), reverse("cinema:hall_showtimes", args=[self.showtime.hall_id])):
+            self.assertEqual(self.client.get(url)["X-Page-Cache"], "HIT")
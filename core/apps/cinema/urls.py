@@ -1,10 +1,17 @@
-from apps.cinema.views import HomeView, ReserveSeatsView, ShowtimeListView
+from apps.cinema.views import (
+    HomeView, MovieAutocompleteView, OccupancyReportView, ReserveSeatsView, ScheduleView, ShowtimeListView,
+    ShowtimeSeatsView
+)
 from django.urls import path
 
 app_name = "cinema"
 
 urlpatterns = [
     path("home/", HomeView.as_view(), name="home"),
+    path("schedule/", ScheduleView.as_view(), name="schedule"),
     path("hall/<int:hall_id>/showtimes/", ShowtimeListView.as_view(), name="hall_showtimes"),
+    path("showtime/<int:showtime_id>/seats/", ShowtimeSeatsView.as_view(), name="showtime_seats"),
+    path("search/autocomplete/", MovieAutocompleteView.as_view(), name="movie_autocomplete"),
+    path("reports/occupancy/", OccupancyReportView.as_view(), name="occupancy_report"),
     path("reserve/<int:showtime_id>/", ReserveSeatsView.as_view(), name="reserve_seats"),
 ]
@@ -1,35 +1,55 @@
+from datetime import date, timedelta
 from typing import Any
 
-from apps.cinema.models import CinemaHall, Reservation, ReservationSeat, Seat, Showtime
-from apps.user.models import User
+from apps.cinema.encoding import encode_seat_map
+from apps.cinema.forms.report_forms import OccupancyReportForm
+from apps.cinema.models import (
+    ACTIVE_RESERVATION_STATUSES, CinemaHall, DailyScheduleRollup, ReservationSeat, Seat, Showtime
+)
+from apps.cinema.pages import HALLS_NAMESPACE, SCHEDULES_NAMESPACE, hall_namespace, schedule_namespace
+from apps.cinema.reports import occupancy_report
+from apps.cinema.search import get_movie_index
+from apps.cinema.services import ReservationService
 from django.contrib import messages
-from django.contrib.auth.mixins import LoginRequiredMixin
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib.auth.models import AnonymousUser
-from django.db import transaction
-from django.http import HttpRequest, HttpResponseRedirect, response
+from django.core.cache import cache
+from django.http import Http404, HttpRequest, HttpResponse, HttpResponseRedirect, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect
-from django.utils.timezone import now
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.dateparse import parse_date
+from django.utils.http import quote_etag
+from django.utils.timezone import localdate, now
 from django.views import View
 from django.views.generic import ListView, TemplateView
+from utils.mixins.views import AnonymousPageCacheMixin, ReplicaReadMixin
+from utils.streaming import streaming_csv_response
 
 
-class HomeView(TemplateView):
+class HomeView(AnonymousPageCacheMixin, ReplicaReadMixin, TemplateView):
     template_name = "pages/cinema/index.html"
 
+    def get_page_cache_namespaces(self) -> list[str]:
+        return [HALLS_NAMESPACE]
+
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
         context["halls"] = CinemaHall.objects.all()
         return context
 
 
-class ShowtimeListView(ListView):
+class ShowtimeListView(AnonymousPageCacheMixin, ReplicaReadMixin, ListView):
     model = Showtime
     template_name = "pages/cinema/hall_showtimes.html"
     context_object_name = "showtimes"
 
-    def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> response.HttpResponseBase:
-        self.hall = get_object_or_404(CinemaHall, id=self.kwargs["hall_id"])
-        return super().dispatch(request, *args, **kwargs)
+    def get_page_cache_namespaces(self) -> list[str]:
+        return [hall_namespace(self.kwargs["hall_id"])]
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        self.hall = get_object_or_404(CinemaHall, id=kwargs["hall_id"])
+        return super().get(request, *args, **kwargs)
 
     def get_queryset(self):
         return (
@@ -42,54 +62,153 @@ class ShowtimeListView(ListView):
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
         context["hall"] = self.hall
-        context["reserved_map"] = self.get_reserved_map(context["showtimes"])
-        context["seats_map"] = self.get_seats_map(self.hall)
         context["now"] = now()
         return context
 
+
+class ScheduleView(AnonymousPageCacheMixin, ReplicaReadMixin, TemplateView):
+    """
+    Everything showing on one day (``?date=YYYY-MM-DD``, default today) across all halls,
+    grouped by movie and hall, loaded from the schedule rollup in a single query.
+    """
+    template_name = "pages/cinema/schedule.html"
+    # Days before and after today a schedule can be requested for.
+    max_days_past = 31
+    max_days_ahead = 365
+
+    def get_day(self) -> date:
+        today = localdate()
+        value = self.request.GET.get("date")
+        if not value:
+            return today
+        try:
+            day = parse_date(value)
+        except ValueError:
+            day = None
+        if day is None:
+            raise Http404("Invalid date.")
+        if not -self.max_days_past <= (day - today).days <= self.max_days_ahead:
+            raise Http404("Date out of range.")
+        return day
+
+    def get_page_cache_namespaces(self) -> list[str]:
+        return [SCHEDULES_NAMESPACE, schedule_namespace(self.get_day())]
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        day = self.get_day()
+        context.update({
+            "day": day,
+            "previous_day": day - timedelta(days=1),
+            "next_day": day + timedelta(days=1),
+            "now": now(),
+            "schedule": self.get_schedule(day),
+        })
+        return context
+
     @staticmethod
-    def get_reserved_map(showtimes: list[Showtime]) -> dict[int, list[int]]:
-        showtime_ids = [st.id for st in showtimes]
-        reserved_seats = ReservationSeat.objects.filter(
-            reservation__showtime_id__in=showtime_ids,
-            reservation__status__in=["PENDING", "CONFIRMED"]
-        ).select_related("seat", "reservation")
-
-        reserved_map: dict[int, list[int]] = {}
-
-        for rs in reserved_seats:
-            showtime_id = rs.reservation.showtime_id
-            if showtime_id not in reserved_map:
-                reserved_map[showtime_id] = []
-            reserved_map[showtime_id].append(rs.seat.id)
-        return reserved_map
+    def get_schedule(day: date) -> list[dict[str, Any]]:
+        """
+        Group the day's rollup rows as ``[{"movie", "halls": [{"hall", "showtimes"}]}]``.
+        """
+        queryset = (
+            DailyScheduleRollup.objects
+            .filter(date=day)
+            .select_related("movie", "hall")
+            .order_by("movie__title", "hall__name", "start_time")
+        )
+        schedule: list[dict[str, Any]] = []
+        for rollup in queryset:
+            if not schedule or schedule[-1]["movie"].pk != rollup.movie_id:
+                schedule.append({"movie": rollup.movie, "halls": []})
+            halls = schedule[-1]["halls"]
+            if not halls or halls[-1]["hall"].pk != rollup.hall_id:
+                halls.append({"hall": rollup.hall, "showtimes": []})
+            halls[-1]["showtimes"].append(rollup)
+        return schedule
+
+
+class ShowtimeSeatsView(ReplicaReadMixin, View):
+    """
+    Seat state of a single showtime, fetched when its seat modal opens.
+
+    Responses carry an ETag built from the showtime's occupancy version and the hall's
+    timestamp, so unchanged seat maps cost the client a 304 and the server one query.
+    """
+    cache_timeout = 60 * 60
+
+    def get(self, request: HttpRequest, showtime_id: int) -> HttpResponse:
+        showtime = get_object_or_404(Showtime.objects.select_related("hall"), pk=showtime_id)
+        etag = self.get_etag(showtime)
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            cache_key = self.get_cache_key(etag)
+            payload = cache.get(cache_key)
+            if payload is None:
+                payload = self.get_payload(showtime)
+                cache.set(cache_key, payload, self.cache_timeout)
+            response = JsonResponse(payload)
+        response["ETag"] = etag
+        patch_cache_control(response, no_cache=True)
+        return response
 
     @staticmethod
-    def get_seats_map(hall: CinemaHall) -> dict[int, list[dict[str, Any]]]:
-        """Returns a dict mapping hall IDs to list of seat info."""
-        seat_map = {}
-        seats = Seat.objects.filter(hall=hall).order_by("row", "seat_number")
-        seat_map[hall.id] = [
-            {
-                "id": seat.id,
-                "label": seat.label,
-                "row": seat.row,
-                "seat_number": seat.seat_number,
-            }
-            for seat in seats
-        ]
-        return seat_map
+    def get_etag(showtime: Showtime) -> str:
+        return quote_etag(f"{showtime.pk}-{showtime.occupancy_version}-{showtime.hall.updated_at.timestamp()}")
 
+    @staticmethod
+    def get_cache_key(etag: str) -> str:
+        return f"cinema:showtime-seats:{etag}"
 
-class ReservationService:
     @staticmethod
-    def create_reservation(user: User, showtime: Showtime, seat_ids: list[int]) -> Reservation:
-        with transaction.atomic():
-            reservation = Reservation.objects.create(user=user, showtime=showtime)
-            for seat_id in seat_ids:
-                seat = get_object_or_404(Seat, pk=seat_id, hall=showtime.hall)
-                ReservationSeat.objects.create(reservation=reservation, seat=seat)
-        return reservation
+    def get_payload(showtime: Showtime) -> dict[str, Any]:
+        seats = Seat.objects.filter(hall_id=showtime.hall_id).values_list("id", "row", "seat_number")
+        reserved = ReservationSeat.objects.filter(
+            reservation__showtime=showtime,
+            reservation__status__in=ACTIVE_RESERVATION_STATUSES
+        ).values_list("seat_id", flat=True)
+        layout = showtime.hall.layout
+        return encode_seat_map(
+            showtime.hall.rows,
+            showtime.hall.seats_per_row,
+            list(seats),
+            list(reserved),
+            layout=None if layout is None else bytes(layout)
+        )
+
+
+class MovieAutocompleteView(ReplicaReadMixin, View):
+    """
+    Movies whose title words start with the typed words, with their next showtimes.
+
+    Served from the in-memory movie index, so keystrokes do not reach the database.
+    """
+    max_results = 8
+    showtimes_per_movie = 5
+    max_query_length = 100
+
+    async def get(self, request: HttpRequest) -> JsonResponse:
+        query = request.GET.get("q", "")[:self.max_query_length]
+        index = await get_movie_index()
+        current_time = now()
+        results = [
+            {
+                "id": movie.id,
+                "title": movie.title,
+                "showtimes": [
+                    {
+                        "id": showtime.id,
+                        "start_time": showtime.start_time.isoformat(),
+                        "hall": showtime.hall_name,
+                        "url": reverse("cinema:hall_showtimes", args=[showtime.hall_id]),
+                    }
+                    for showtime in movie.upcoming(current_time, self.showtimes_per_movie)
+                ],
+            }
+            for movie in index.search(query, limit=self.max_results)
+        ]
+        return JsonResponse({"results": results})
 
 
 class ReserveSeatsView(LoginRequiredMixin, View):
@@ -111,3 +230,19 @@ class ReserveSeatsView(LoginRequiredMixin, View):
 
         messages.success(request, "Your reservation was successful")
         return redirect("cinema:hall_showtimes", hall_id=showtime.hall.id)
+
+
+class OccupancyReportView(LoginRequiredMixin, UserPassesTestMixin, ReplicaReadMixin, View):
+    """
+    Staff-only CSV of showtime fill rates, e.g. ``?by=weekday&start=2026-01-01&end=2026-12-31``.
+    """
+    def test_func(self) -> bool:
+        return self.request.user.is_staff
+
+    def get(self, request: HttpRequest) -> HttpResponse | StreamingHttpResponse:
+        form = OccupancyReportForm(request.GET)
+        if not form.is_valid():
+            return JsonResponse({"errors": form.errors}, status=400)
+        breakdown, start, end = form.cleaned_data["by"], form.cleaned_data["start"], form.cleaned_data["end"]
+        header, rows = occupancy_report(breakdown, start, end)
+        return streaming_csv_response(f"occupancy-by-{breakdown}-{start}-{end}.csv", header, rows)
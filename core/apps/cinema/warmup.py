@@ -0,0 +1,108 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+
+from apps.cinema.encoding import encode_seat_map
+from apps.cinema.models import ACTIVE_RESERVATION_STATUSES, ReservationSeat, Seat, Showtime
+from apps.cinema.search import get_movie_index
+from apps.cinema.views import ShowtimeSeatsView
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.core.handlers.base import BaseHandler
+from django.template import engines
+from django.test import RequestFactory
+from django.urls import get_resolver, reverse
+from django.utils import timezone
+
+
+@dataclass
+class WarmUpResult:
+    templates: int = 0
+    seat_maps: int = 0
+    pages: int = 0
+    failed_pages: int = 0
+
+
+def warm_process() -> WarmUpResult:
+    """
+    Load what each process keeps in memory: the URLconf with every view module, the
+    compiled project templates and the movie search index.
+
+    Run in a preloading gunicorn master, forked workers share it all copy-on-write.
+    """
+    result = WarmUpResult()
+    # Populating the reverse lookup imports every view module.
+    get_resolver().reverse_dict
+    for engine in engines.all():
+        for directory in getattr(engine, "dirs", []):
+            for path in sorted(Path(directory).rglob("*.html")):
+                engine.get_template(str(path.relative_to(directory)))
+                result.templates += 1
+    async_to_sync(get_movie_index)()
+    return result
+
+
+def warm_seat_maps(showtimes: list[Showtime]) -> int:
+    """
+    Cache the seat map payloads of these showtimes with one query per hall plus one for all
+    their reserved seats, instead of two queries per showtime on first view.
+    """
+    reserved = defaultdict(list)
+    for showtime_id, seat_id in ReservationSeat.objects.filter(
+        reservation__showtime__in=showtimes,
+        reservation__status__in=ACTIVE_RESERVATION_STATUSES
+    ).values_list("reservation__showtime_id", "seat_id"):
+        reserved[showtime_id].append(seat_id)
+
+    hall_seats: dict[int, list[tuple[int, int, int]]] = {}
+    payloads = {}
+    for showtime in showtimes:
+        hall = showtime.hall
+        if hall.pk not in hall_seats:
+            hall_seats[hall.pk] = list(Seat.objects.filter(hall=hall).values_list("id", "row", "seat_number"))
+        layout = None if hall.layout is None else bytes(hall.layout)
+        payloads[ShowtimeSeatsView.get_cache_key(ShowtimeSeatsView.get_etag(showtime))] = encode_seat_map(
+            hall.rows, hall.seats_per_row, hall_seats[hall.pk], reserved[showtime.pk], layout=layout
+        )
+    cache.set_many(payloads, ShowtimeSeatsView.cache_timeout)
+    return len(payloads)
+
+
+def warm_pages(showtimes: list[Showtime], days: int, host: str, secure: bool) -> tuple[int, int]:
+    """
+    Request the anonymous home, schedule and hall pages the upcoming showtimes appear on, so
+    the page cache holds them before visitors arrive. Returns the warmed and failed counts.
+    """
+    handler = BaseHandler()
+    handler.load_middleware()
+    factory = RequestFactory(headers={"host": host})
+    today = timezone.localdate()
+    urls = [reverse("cinema:home"), reverse("cinema:schedule")]
+    urls += [
+        f"{reverse('cinema:schedule')}?date={today + timedelta(days=offset)}" for offset in range(days)
+    ]
+    urls += [
+        reverse("cinema:hall_showtimes", args=[hall_id])
+        for hall_id in sorted({showtime.hall_id for showtime in showtimes})
+    ]
+    warmed = sum(handler.get_response(factory.get(url, secure=secure)).status_code == 200 for url in urls)
+    return warmed, len(urls) - warmed
+
+
+def warm_up(days: int = 2, host: str | None = None, secure: bool = True, pages: bool = True) -> WarmUpResult:
+    """
+    Warm this process and the shared caches for the showtimes of the next ``days`` days.
+    """
+    result = warm_process()
+    now = timezone.now()
+    showtimes = list(
+        Showtime.objects
+        .filter(start_time__gte=now, start_time__lt=now + timedelta(days=days))
+        .select_related("hall")
+        .order_by("hall_id", "start_time")
+    )
+    result.seat_maps = warm_seat_maps(showtimes)
+    if pages and host:
+        result.pages, result.failed_pages = warm_pages(showtimes, days, host, secure)
+    return result
@@ -0,0 +1,26 @@
+from apps.jobs.models import Job, JobStatus
+from django.contrib import admin
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("id", "task", "status", "priority", "run_at", "attempts", "duration", "finished_at")
+    list_filter = ("status", "task")
+    search_fields = ("task",)
+    readonly_fields = (
+        "status", "attempts", "locked_until", "started_at", "finished_at", "duration", "last_error", "created_at",
+        "updated_at"
+    )
+    ordering = ("-created_at",)
+    actions = ("retry_jobs",)
+
+    @admin.action(description=_("Retry selected jobs"))
+    def retry_jobs(self, request, queryset):
+        updated = queryset.filter(status=JobStatus.FAILED).update(
+            status=JobStatus.QUEUED,
+            attempts=0,
+            run_at=timezone.now()
+        )
+        self.message_user(request, _("%d job(s) queued for retry.") % updated)
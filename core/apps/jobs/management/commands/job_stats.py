@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+from apps.jobs.models import Job
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = "Show job queue depth and per-task run times."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--hours", type=int, default=24, help="Run time window in hours.")
+
+    def handle(self, *args, **options):
+        stats = Job.objects.stats(window=timedelta(hours=options["hours"]))
+
+        for status, count in sorted(stats.counts.items()):
+            self.stdout.write(f"{status}: {count}")
+        lag = f", oldest waiting {timezone.now() - stats.oldest_due_at}" if stats.oldest_due_at else ""
+        self.stdout.write(f"Due now: {stats.due}{lag}")
+
+        for runtime in stats.runtimes:
+            self.stdout.write(
+                f"{runtime.task}: {runtime.runs} run(s), avg {runtime.average}, max {runtime.longest}"
+            )
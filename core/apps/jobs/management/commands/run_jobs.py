@@ -0,0 +1,33 @@
+from datetime import timedelta
+
+from apps.jobs.worker import JobWorker
+from django.core.management.base import BaseCommand
+from utils.queues import run_until_signalled
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Run one batch of due jobs and exit.")
+        parser.add_argument("--concurrency", type=int, default=4, help="Jobs run at the same time.")
+        parser.add_argument("--processes", action="store_true", help="Use a process pool instead of threads.")
+        parser.add_argument("--lease", type=float, default=600, help="Seconds before a stuck job is picked up again.")
+        parser.add_argument("--poll-interval", type=float, default=1, help="Seconds to wait when idle.")
+
+    def handle(self, *args, **options):
+        worker = JobWorker(
+            concurrency=options["concurrency"],
+            processes=options["processes"],
+            lease=timedelta(seconds=options["lease"]),
+        )
+        if options["once"]:
+            try:
+                count = worker.run_once()
+            finally:
+                worker.shutdown()
+            self.stdout.write(self.style.SUCCESS(f"Ran {count} job(s)."))
+            return
+
+        self.stdout.write("Running jobs...")
+        run_until_signalled(worker, options["poll_interval"])
@@ -0,0 +1,100 @@
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from django.db import models
+from django.db.models import Avg, Count, Max, Min, Q
+from django.utils import timezone
+from utils.queues import claim_rows
+
+if TYPE_CHECKING:
+    from apps.jobs.models import Job  # noqa: F401
+    from apps.jobs.registry import Task
+
+
+class TaskRuntime(NamedTuple):
+    task: str
+    runs: int
+    average: timedelta | None
+    longest: timedelta | None
+
+
+class QueueStats(NamedTuple):
+    counts: dict[str, int]
+    due: int
+    oldest_due_at: datetime | None
+    runtimes: list[TaskRuntime]
+
+
+class JobQuerySet(models.QuerySet["Job"]):
+    def enqueue(
+        self,
+        task: str,
+        kwargs: dict[str, Any] | None = None,
+        *,
+        priority: int = 0,
+        run_at: datetime | None = None,
+        max_attempts: int = 3,
+    ) -> "Job":
+        return self.create(
+            task=task,
+            kwargs=kwargs or {},
+            priority=priority,
+            run_at=run_at or timezone.now(),
+            max_attempts=max_attempts
+        )
+
+    def schedule_recurring(self, tasks: Iterable["Task"]) -> None:
+        """
+        Make sure every recurring task has a queued or running job; the partial unique
+        constraint turns concurrent attempts by several workers into no-ops.
+        """
+        self.bulk_create(
+            [
+                self.model(task=task.name, repeat_interval=task.repeat, max_attempts=task.max_attempts)
+                for task in tasks
+                if task.repeat
+            ],
+            ignore_conflicts=True
+        )
+
+    def claimable(self) -> "JobQuerySet":
+        now = timezone.now()
+        # A running job whose lock expired belongs to a worker that died.
+        return self.filter(Q(status="QUEUED", run_at__lte=now) | Q(status="RUNNING", locked_until__lt=now))
+
+    def claim(self, batch_size: int, lease: timedelta) -> list["Job"]:
+        """
+        Lock the most urgent due jobs, skipping rows other workers hold, and mark them running.
+        """
+        now = timezone.now()
+        return claim_rows(
+            self.claimable().order_by("-priority", "run_at"),
+            batch_size,
+            status="RUNNING",
+            started_at=now,
+            locked_until=now + lease
+        )
+
+    def stats(self, window: timedelta = timedelta(hours=24)) -> QueueStats:
+        """
+        Summarize queue depth by status and per-task run times over the last ``window``.
+        """
+        now = timezone.now()
+        counts = dict(self.order_by().values_list("status").annotate(Count("id")))
+        due = self.filter(status="QUEUED", run_at__lte=now).aggregate(count=Count("id"), oldest=Min("run_at"))
+        runtimes = (
+            self.filter(status="SUCCEEDED", finished_at__gte=now - window)
+            .order_by("task")
+            .values_list("task")
+            .annotate(Count("id"), Avg("duration"), Max("duration"))
+        )
+        return QueueStats(
+            counts=counts,
+            due=due["count"],
+            oldest_due_at=due["oldest"],
+            runtimes=[TaskRuntime(*row) for row in runtimes]
+        )
+
+
+JobManager = models.Manager.from_queryset(JobQuerySet)
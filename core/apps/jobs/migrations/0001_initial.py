@@ -0,0 +1,42 @@
+# Generated by Django 5.1 on 2026-10-19 13:21
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('task', models.CharField(max_length=150, verbose_name='task')),
+                ('kwargs', models.JSONField(blank=True, default=dict, verbose_name='arguments')),
+                ('priority', models.SmallIntegerField(default=0, help_text='Higher runs first.', verbose_name='priority')),
+                ('status', models.CharField(choices=[('QUEUED', 'Queued'), ('RUNNING', 'Running'), ('SUCCEEDED', 'Succeeded'), ('FAILED', 'Failed')], default='QUEUED', max_length=10, verbose_name='status')),
+                ('run_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='run at')),
+                ('repeat_interval', models.DurationField(blank=True, null=True, verbose_name='repeat interval')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='attempts')),
+                ('max_attempts', models.PositiveSmallIntegerField(default=3, verbose_name='max attempts')),
+                ('locked_until', models.DateTimeField(blank=True, null=True, verbose_name='locked until')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='started at')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='finished at')),
+                ('duration', models.DurationField(blank=True, null=True, verbose_name='duration')),
+                ('last_error', models.TextField(blank=True, verbose_name='last error')),
+            ],
+            options={
+                'verbose_name': 'Job',
+                'verbose_name_plural': 'Jobs',
+                'indexes': [models.Index(condition=models.Q(('status', 'QUEUED')), fields=['-priority', 'run_at'], name='jobs_job_queued_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('repeat_interval__isnull', False), ('status__in', ['QUEUED', 'RUNNING'])), fields=('task',), name='jobs_job_single_active_recurring')],
+            },
+        ),
+    ]
@@ -0,0 +1,63 @@
+from apps.jobs.managers import JobManager
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from utils.mixins.models import Timestampable
+
+
+class JobStatus(models.TextChoices):
+    QUEUED = "QUEUED", _("Queued")
+    RUNNING = "RUNNING", _("Running")
+    SUCCEEDED = "SUCCEEDED", _("Succeeded")
+    FAILED = "FAILED", _("Failed")
+
+
+class Job(Timestampable, models.Model):
+    """
+    A run of a registered task, executed by the ``run_jobs`` worker.
+
+    Recurring jobs schedule their next run when they finish, so every run stays in the
+    table with its own duration and outcome.
+    """
+    task = models.CharField(max_length=150, verbose_name=_("task"))
+    kwargs = models.JSONField(default=dict, blank=True, verbose_name=_("arguments"))
+    priority = models.SmallIntegerField(default=0, verbose_name=_("priority"), help_text=_("Higher runs first."))
+    status = models.CharField(
+        max_length=10,
+        choices=JobStatus.choices,
+        default=JobStatus.QUEUED,
+        verbose_name=_("status")
+    )
+    run_at = models.DateTimeField(default=timezone.now, verbose_name=_("run at"))
+    repeat_interval = models.DurationField(null=True, blank=True, verbose_name=_("repeat interval"))
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name=_("attempts"))
+    max_attempts = models.PositiveSmallIntegerField(default=3, verbose_name=_("max attempts"))
+    locked_until = models.DateTimeField(null=True, blank=True, verbose_name=_("locked until"))
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name=_("started at"))
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name=_("finished at"))
+    duration = models.DurationField(null=True, blank=True, verbose_name=_("duration"))
+    last_error = models.TextField(blank=True, verbose_name=_("last error"))
+
+    objects = JobManager()
+
+    class Meta:
+        verbose_name = _("Job")
+        verbose_name_plural = _("Jobs")
+        indexes = [
+            models.Index(
+                fields=["-priority", "run_at"],
+                condition=Q(status="QUEUED"),
+                name="jobs_job_queued_idx"
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["task"],
+                condition=Q(status__in=["QUEUED", "RUNNING"], repeat_interval__isnull=False),
+                name="jobs_job_single_active_recurring"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.task} #{self.pk} ({self.status})"
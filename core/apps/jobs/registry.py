@@ -0,0 +1,46 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from apps.jobs.models import Job
+
+
+@dataclass(frozen=True)
+class Task:
+    name: str
+    func: Callable[..., Any]
+    repeat: timedelta | None = None
+    max_attempts: int = 3
+
+    def __call__(self, **kwargs: Any) -> Any:
+        return self.func(**kwargs)
+
+    def defer(self, *, priority: int = 0, run_at: datetime | None = None, **kwargs: Any) -> "Job":
+        """
+        Queue a run of this task with JSON-serializable keyword arguments.
+        """
+        from apps.jobs.models import Job
+
+        return Job.objects.enqueue(
+            self.name, kwargs, priority=priority, run_at=run_at, max_attempts=self.max_attempts
+        )
+
+
+tasks: dict[str, Task] = {}
+
+
+def task(
+    name: str | None = None, *, repeat: timedelta | None = None, max_attempts: int = 3
+) -> Callable[[Callable[..., Any]], Task]:
+    """
+    Register the decorated function as a job task; ``repeat`` makes the worker keep one run
+    of it scheduled at that interval.
+    """
+    def decorator(func: Callable[..., Any]) -> Task:
+        registered = Task(name or f"{func.__module__}.{func.__name__}", func, repeat, max_attempts)
+        tasks[registered.name] = registered
+        return registered
+
+    return decorator
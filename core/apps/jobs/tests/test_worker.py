@@ -0,0 +1,131 @@
+import threading
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from apps.jobs.models import Job, JobStatus
+from apps.jobs.registry import Task, tasks
+from apps.jobs.worker import JobWorker
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+
+class JobWorkerTest(TestCase):
+    def setUp(self):
+        self.func = mock.Mock()
+        self.task = Task("tests.task", self.func, max_attempts=2)
+        self.recurring = Task("tests.recurring", self.func, repeat=timedelta(minutes=5))
+        patcher = mock.patch.dict(tasks, {task.name: task for task in (self.task, self.recurring)})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.worker = JobWorker(concurrency=2)
+        self.addCleanup(self.worker.shutdown)
+
+    def test_deferred_job_runs_with_its_arguments(self):
+        job = self.task.defer(hall_id=7)
+
+        self.assertEqual(self.worker.run_once(), 1)
+
+        self.func.assert_called_once_with(hall_id=7)
+        job.refresh_from_db()
+        self.assertEqual(job.status, JobStatus.SUCCEEDED)
+        self.assertIsNotNone(job.duration)
+
+    def test_higher_priority_runs_first_and_future_jobs_wait(self):
+        low = self.task.defer(name="low")
+        high = self.task.defer(name="high", priority=5)
+        urgent = self.task.defer(name="urgent", priority=9)
+        later = self.task.defer(name="later", priority=10, run_at=timezone.now() + timedelta(hours=1))
+
+        self.worker.run_once()
+
+        self.assertEqual([c.kwargs["name"] for c in self.func.call_args_list], ["urgent", "high"])
+        low.refresh_from_db()
+        later.refresh_from_db()
+        self.assertEqual((low.status, later.status), (JobStatus.QUEUED, JobStatus.QUEUED))
+        self.assertTrue(Job.objects.filter(pk__in=[high.pk, urgent.pk], status=JobStatus.SUCCEEDED).count() == 2)
+
+    def test_failed_job_is_retried_then_marked_failed(self):
+        self.func.side_effect = ValueError("boom")
+        job = self.task.defer()
+
+        with self.assertLogs("apps.jobs.worker", "ERROR"):
+            self.worker.run_once()
+        job.refresh_from_db()
+        self.assertEqual(job.status, JobStatus.QUEUED)
+        self.assertGreater(job.run_at, timezone.now())
+
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        with self.assertLogs("apps.jobs.worker", "ERROR"):
+            self.worker.run_once()
+        job.refresh_from_db()
+        self.assertEqual(job.status, JobStatus.FAILED)
+        self.assertIn("boom", job.last_error)
+
+    def test_expired_lock_is_reclaimed(self):
+        job = self.task.defer()
+        Job.objects.filter(pk=job.pk).update(
+            status=JobStatus.RUNNING, locked_until=timezone.now() - timedelta(seconds=1)
+        )
+
+        self.assertEqual(self.worker.run_once(), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, JobStatus.SUCCEEDED)
+
+    @mock.patch("utils.queues.close_old_connections")
+    def test_free_slots_are_claimed_while_a_job_runs(self, close_old_connections):
+        stop = threading.Event()
+        refilled = threading.Event()
+        released = []
+
+        def run(name):
+            if name == "slow":
+                # Only returns once the job claimed after "fast" finished has run too.
+                released.append(refilled.wait(5))
+                stop.set()
+            elif name == "next":
+                refilled.set()
+
+        self.func.side_effect = run
+        for name, priority in (("slow", 9), ("fast", 5), ("next", 0)):
+            self.task.defer(name=name, priority=priority)
+
+        self.worker.run_forever(poll_interval=0.01, stop=stop)
+
+        self.assertEqual(released, [True])
+        self.assertEqual(Job.objects.filter(task="tests.task", status=JobStatus.SUCCEEDED).count(), 3)
+
+    def test_recurring_job_is_scheduled_once_and_rescheduled_after_running(self):
+        Job.objects.schedule_recurring(tasks.values())
+        Job.objects.schedule_recurring(tasks.values())
+        self.assertEqual(Job.objects.filter(task="tests.recurring").count(), 1)
+
+        self.worker.run_once()
+
+        next_run = Job.objects.get(task="tests.recurring", status=JobStatus.QUEUED)
+        self.assertGreater(next_run.run_at, timezone.now() + timedelta(minutes=4))
+
+    def test_stats(self):
+        self.task.defer()
+        self.task.defer(run_at=timezone.now() + timedelta(hours=1))
+        self.task.defer()
+        self.worker.concurrency = 1
+        self.worker.run_once()
+
+        stats = Job.objects.stats()
+
+        self.assertEqual(stats.counts, {JobStatus.QUEUED: 2, JobStatus.SUCCEEDED: 1})
+        self.assertEqual(stats.due, 1)
+        self.assertEqual([(r.task, r.runs) for r in stats.runtimes], [("tests.task", 1)])
+
+    def test_commands(self):
+        self.task.defer()
+        out = StringIO()
+
+        call_command("run_jobs", "--once", stdout=out)
+        call_command("job_stats", stdout=out)
+
+        self.assertIn("Ran 1 job(s).", out.getvalue())
+        self.assertIn("SUCCEEDED: 1", out.getvalue())
+        self.assertIn("tests.task: 1 run(s)", out.getvalue())
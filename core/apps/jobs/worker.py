@@ -0,0 +1,104 @@
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from datetime import timedelta
+
+import django
+from apps.jobs.models import Job, JobStatus
+from apps.jobs.registry import tasks
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+from utils.queues import QueueWorker, backoff
+
+logger = logging.getLogger(__name__)
+
+
+def execute(task_name: str, kwargs: dict) -> tuple[str | None, float]:
+    """
+    Run one task and return its error (if any) and how long it took in seconds.
+
+    Module level so process pools can pickle it; results are recorded by the parent.
+    """
+    started = time.monotonic()
+    try:
+        task = tasks.get(task_name)
+        if task is None:
+            return f"No task registered as {task_name!r}.", 0.0
+        task(**kwargs)
+    except Exception as error:
+        logger.exception("Job task %s failed", task_name)
+        return f"{type(error).__name__}: {error}", time.monotonic() - started
+    finally:
+        close_old_connections()
+    return None, time.monotonic() - started
+
+
+class JobWorker(QueueWorker[Job]):
+    """
+    Claim due jobs by priority and run them on a thread or process pool.
+
+    Processes are started with "spawn" so none of them inherits the parent's database
+    connections; use them for CPU-bound tasks and threads for I/O-bound ones.
+    """
+    thread_name_prefix = "jobs"
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        processes: bool = False,
+        lease: timedelta = timedelta(minutes=10),
+        retry_delay: timedelta = timedelta(seconds=30),
+    ):
+        super().__init__(concurrency, lease, retry_delay)
+        self.processes = processes
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None and self.processes:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.concurrency,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=django.setup
+            )
+        return super().executor
+
+    def claim(self, limit: int) -> list[Job]:
+        return Job.objects.claim(limit, self.lease)
+
+    def submit(self, job: Job) -> Future:
+        return self.executor.submit(execute, job.task, job.kwargs)
+
+    def run_forever(self, poll_interval: float = 1.0, stop: threading.Event | None = None) -> None:
+        Job.objects.schedule_recurring(tasks.values())
+        super().run_forever(poll_interval, stop)
+
+    @transaction.atomic
+    def finish(self, job: Job, result: tuple[str | None, float]) -> None:
+        error, seconds = result
+        now = timezone.now()
+        job.duration = timedelta(seconds=seconds)
+        job.finished_at = now
+        job.locked_until = None
+        job.last_error = error or ""
+        if error is None:
+            job.status = JobStatus.SUCCEEDED
+        elif job.attempts < job.max_attempts:
+            job.status = JobStatus.QUEUED
+            job.run_at = now + backoff(self.retry_delay, job.attempts)
+        else:
+            job.status = JobStatus.FAILED
+        job.save(update_fields=[
+            "status", "run_at", "duration", "finished_at", "locked_until", "last_error", "updated_at"
+        ])
+
+        if job.repeat_interval and job.status != JobStatus.QUEUED:
+            Job.objects.create(
+                task=job.task,
+                kwargs=job.kwargs,
+                priority=job.priority,
+                run_at=max(job.run_at + job.repeat_interval, now),
+                repeat_interval=job.repeat_interval,
+                max_attempts=job.max_attempts
+            )
@@ -0,0 +1,29 @@
+from apps.outbox.models import OutboxMessage, OutboxStatus
+from django.contrib import admin
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = ("id", "topic", "status", "attempts", "available_at", "processed_at", "created_at")
+    list_filter = ("status", "topic")
+    search_fields = ("topic",)
+    readonly_fields = (
+        "topic", "payload", "status", "attempts", "available_at", "processed_at", "last_error", "created_at",
+        "updated_at"
+    )
+    ordering = ("-created_at",)
+    actions = ("retry_messages",)
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description=_("Retry selected messages"))
+    def retry_messages(self, request, queryset):
+        updated = queryset.exclude(status=OutboxStatus.SENT).update(
+            status=OutboxStatus.PENDING,
+            attempts=0,
+            available_at=timezone.now()
+        )
+        self.message_user(request, _("%d message(s) queued for retry.") % updated)
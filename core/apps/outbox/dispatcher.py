@@ -0,0 +1,85 @@
+import logging
+from concurrent.futures import Future
+from datetime import timedelta
+
+from apps.outbox.models import OutboxMessage, OutboxStatus
+from apps.outbox.registry import handlers
+from django.db import close_old_connections
+from django.utils import timezone
+from utils.queues import QueueWorker, backoff
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxDispatcher(QueueWorker[OutboxMessage]):
+    """
+    Claim due outbox messages in batches and run their handlers on a bounded thread pool.
+
+    Delivery is at least once: a message whose handler raised is retried with exponential
+    backoff until ``max_attempts``, and one claimed by a dispatcher that died becomes due
+    again once its lease runs out.
+    """
+    thread_name_prefix = "outbox"
+
+    def __init__(
+        self,
+        batch_size: int = 50,
+        concurrency: int = 4,
+        max_attempts: int = 5,
+        retry_delay: timedelta = timedelta(seconds=30),
+        lease: timedelta = timedelta(minutes=5),
+    ):
+        super().__init__(concurrency, lease, retry_delay)
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+
+    @property
+    def capacity(self) -> int:
+        return self.batch_size
+
+    def claim(self, limit: int) -> list[OutboxMessage]:
+        return OutboxMessage.objects.claim(limit, self.lease)
+
+    def submit(self, message: OutboxMessage) -> Future:
+        return self.executor.submit(self.handle, message)
+
+    def finish(self, message: OutboxMessage, error: str | None) -> None:
+        if error is None:
+            self.mark_sent(message)
+        else:
+            self.mark_failed(message, error)
+
+    @staticmethod
+    def handle(message: OutboxMessage) -> str | None:
+        handler = handlers.get(message.topic)
+        if handler is None:
+            return f"No handler registered for topic {message.topic!r}."
+        try:
+            handler(message.payload)
+        except Exception as error:
+            logger.exception("Outbox message %s (%s) failed", message.pk, message.topic)
+            return f"{type(error).__name__}: {error}"
+        finally:
+            close_old_connections()
+        return None
+
+    @staticmethod
+    def mark_sent(message: OutboxMessage) -> None:
+        OutboxMessage.objects.filter(pk=message.pk).update(
+            status=OutboxStatus.SENT,
+            processed_at=timezone.now(),
+            last_error=""
+        )
+
+    def mark_failed(self, message: OutboxMessage, error: str) -> None:
+        if message.attempts >= self.max_attempts:
+            OutboxMessage.objects.filter(pk=message.pk).update(
+                status=OutboxStatus.FAILED,
+                processed_at=timezone.now(),
+                last_error=error
+            )
+            return
+        OutboxMessage.objects.filter(pk=message.pk).update(
+            available_at=timezone.now() + backoff(self.retry_delay, message.attempts),
+            last_error=error
+        )
@@ -0,0 +1,35 @@
+from datetime import timedelta
+
+from apps.outbox.dispatcher import OutboxDispatcher
+from django.core.management.base import BaseCommand
+from utils.queues import run_until_signalled
+
+
+class Command(BaseCommand):
+    help = "Deliver pending outbox messages (emails and other reservation side effects)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Dispatch a single batch and exit.")
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument("--concurrency", type=int, default=4, help="Messages handled at the same time.")
+        parser.add_argument("--max-attempts", type=int, default=5)
+        parser.add_argument("--retry-delay", type=float, default=30, help="Seconds before the first retry.")
+        parser.add_argument("--poll-interval", type=float, default=1, help="Seconds to wait when idle.")
+
+    def handle(self, *args, **options):
+        dispatcher = OutboxDispatcher(
+            batch_size=options["batch_size"],
+            concurrency=options["concurrency"],
+            max_attempts=options["max_attempts"],
+            retry_delay=timedelta(seconds=options["retry_delay"]),
+        )
+        if options["once"]:
+            try:
+                count = dispatcher.run_once()
+            finally:
+                dispatcher.shutdown()
+            self.stdout.write(self.style.SUCCESS(f"Dispatched {count} message(s)."))
+            return
+
+        self.stdout.write("Dispatching outbox messages...")
+        run_until_signalled(dispatcher, options["poll_interval"])
@@ -0,0 +1,30 @@
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from django.db import models
+from django.utils import timezone
+from utils.queues import claim_rows
+
+if TYPE_CHECKING:
+    from apps.outbox.models import OutboxMessage  # noqa: F401
+
+
+class OutboxMessageQuerySet(models.QuerySet["OutboxMessage"]):
+    def enqueue(self, topic: str, payload: dict[str, Any]) -> "OutboxMessage":
+        """
+        Record a side effect; call it inside the transaction that makes the change.
+        """
+        return self.create(topic=topic, payload=payload)
+
+    def due(self) -> "OutboxMessageQuerySet":
+        return self.filter(status="PENDING", available_at__lte=timezone.now())
+
+    def claim(self, batch_size: int, lease: timedelta) -> list["OutboxMessage"]:
+        """
+        Lock up to ``batch_size`` due messages, skipping rows other dispatchers hold, and
+        hide them for ``lease`` so a crashed dispatcher's messages are picked up again later.
+        """
+        return claim_rows(self.due().order_by("available_at"), batch_size, available_at=timezone.now() + lease)
+
+
+OutboxMessageManager = models.Manager.from_queryset(OutboxMessageQuerySet)
@@ -0,0 +1,47 @@
+from apps.outbox.managers import OutboxMessageManager
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from utils.mixins.models import Timestampable
+
+
+class OutboxStatus(models.TextChoices):
+    PENDING = "PENDING", _("Pending")
+    SENT = "SENT", _("Sent")
+    FAILED = "FAILED", _("Failed")
+
+
+class OutboxMessage(Timestampable, models.Model):
+    """
+    A side effect recorded in the same transaction as the change that caused it and
+    carried out later by the ``dispatch_outbox`` worker.
+    """
+    topic = models.CharField(max_length=100, verbose_name=_("topic"))
+    payload = models.JSONField(default=dict, verbose_name=_("payload"))
+    status = models.CharField(
+        max_length=10,
+        choices=OutboxStatus.choices,
+        default=OutboxStatus.PENDING,
+        verbose_name=_("status")
+    )
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name=_("attempts"))
+    available_at = models.DateTimeField(default=timezone.now, verbose_name=_("available at"))
+    processed_at = models.DateTimeField(null=True, blank=True, verbose_name=_("processed at"))
+    last_error = models.TextField(blank=True, verbose_name=_("last error"))
+
+    objects = OutboxMessageManager()
+
+    class Meta:
+        verbose_name = _("Outbox Message")
+        verbose_name_plural = _("Outbox Messages")
+        indexes = [
+            models.Index(
+                fields=["available_at"],
+                condition=Q(status="PENDING"),
+                name="outbox_pending_available_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.topic} #{self.pk} ({self.status})"
@@ -0,0 +1,17 @@
+from collections.abc import Callable
+from typing import Any
+
+Handler = Callable[[dict[str, Any]], None]
+
+handlers: dict[str, Handler] = {}
+
+
+def register(topic: str) -> Callable[[Handler], Handler]:
+    """
+    Register the decorated function as the handler for outbox messages of ``topic``.
+    """
+    def decorator(handler: Handler) -> Handler:
+        handlers[topic] = handler
+        return handler
+
+    return decorator
@@ -0,0 +1,82 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from apps.outbox.dispatcher import OutboxDispatcher
+from apps.outbox.models import OutboxMessage, OutboxStatus
+from apps.outbox.registry import handlers
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+
+class OutboxDispatcherTest(TestCase):
+    def setUp(self):
+        self.handler = mock.Mock()
+        patcher = mock.patch.dict(handlers, {"test.topic": self.handler})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.dispatcher = OutboxDispatcher(batch_size=10, concurrency=2, max_attempts=2)
+        self.addCleanup(self.dispatcher.shutdown)
+
+    def test_due_messages_are_sent(self):
+        message = OutboxMessage.objects.enqueue("test.topic", {"value": 1})
+
+        self.assertEqual(self.dispatcher.run_once(), 1)
+
+        self.handler.assert_called_once_with({"value": 1})
+        message.refresh_from_db()
+        self.assertEqual(message.status, OutboxStatus.SENT)
+        self.assertEqual(message.attempts, 1)
+        self.assertIsNotNone(message.processed_at)
+
+    def test_future_and_processed_messages_are_skipped(self):
+        OutboxMessage.objects.create(topic="test.topic", available_at=timezone.now() + timedelta(minutes=1))
+        OutboxMessage.objects.create(topic="test.topic", status=OutboxStatus.SENT)
+
+        self.assertEqual(self.dispatcher.run_once(), 0)
+        self.handler.assert_not_called()
+
+    def test_batch_size_bounds_each_run(self):
+        for _ in range(3):
+            OutboxMessage.objects.enqueue("test.topic", {})
+        self.dispatcher.batch_size = 2
+
+        self.assertEqual(self.dispatcher.run_once(), 2)
+        self.assertEqual(self.dispatcher.run_once(), 1)
+        self.assertEqual(self.dispatcher.run_once(), 0)
+
+    def test_failed_message_is_retried_later_then_given_up(self):
+        self.handler.side_effect = ConnectionError("SMTP down")
+        message = OutboxMessage.objects.enqueue("test.topic", {})
+
+        with self.assertLogs("apps.outbox.dispatcher", "ERROR"):
+            self.dispatcher.run_once()
+        message.refresh_from_db()
+        self.assertEqual(message.status, OutboxStatus.PENDING)
+        self.assertGreater(message.available_at, timezone.now())
+        self.assertIn("SMTP down", message.last_error)
+
+        OutboxMessage.objects.filter(pk=message.pk).update(available_at=timezone.now())
+        with self.assertLogs("apps.outbox.dispatcher", "ERROR"):
+            self.dispatcher.run_once()
+        message.refresh_from_db()
+        self.assertEqual(message.status, OutboxStatus.FAILED)
+        self.assertEqual(message.attempts, 2)
+
+    def test_unknown_topic_is_recorded_as_error(self):
+        message = OutboxMessage.objects.enqueue("missing.topic", {})
+
+        self.dispatcher.run_once()
+
+        message.refresh_from_db()
+        self.assertIn("No handler", message.last_error)
+
+    def test_command_dispatches_once(self):
+        OutboxMessage.objects.enqueue("test.topic", {})
+        out = StringIO()
+
+        call_command("dispatch_outbox", "--once", stdout=out)
+
+        self.assertIn("Dispatched 1 message(s).", out.getvalue())
+        self.handler.assert_called_once()
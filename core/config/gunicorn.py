@@ -0,0 +1,108 @@
+"""
+Gunicorn settings for the production image.
+
+GUNICORN_PROFILE picks the server: "wsgi" runs threaded workers sharing one bounded
+connection pool per process (keep DATABASE_POOL_MAX_SIZE near GUNICORN_THREADS), while
+"asgi" runs uvicorn event-loop workers serving config.asgi, so each process can hold many
+slow client connections; a request only takes a thread while its (sync) view runs.
+
+With GUNICORN_PRELOAD (the default) the master loads the application and warms it up
+(URLconf, templates, movie search index) before forking, so workers start warm and share
+that memory copy-on-write. A failed warm-up or database check is logged and the worker
+starts cold rather than keeping the server from booting.
+"""
+import multiprocessing
+import os
+
+profile = os.environ.get("GUNICORN_PROFILE", "wsgi")
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8002")
+if profile == "asgi":
+    wsgi_app = "config.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+    workers = int(os.environ.get("GUNICORN_WORKERS", multiprocessing.cpu_count() + 1))
+else:
+    wsgi_app = "config.wsgi:application"
+    worker_class = "gthread"
+    workers = int(os.environ.get("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+    threads = int(os.environ.get("GUNICORN_THREADS", 4))
+# Recycle workers now and then so leaks cannot pile up; the jitter keeps them from restarting together.
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 2000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 200))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = timeout
+preload_app = os.environ.get("GUNICORN_PRELOAD", "1") == "1"
+
+# Set in the master once it is warm; forked workers inherit it and skip their own warm-up.
+warmed_up = False
+
+
+def close_connections():
+    """
+    Close the database connections, their pools and the cache clients of this process.
+    """
+    from django.core.cache import caches
+    from django.db import connections
+
+    for connection in connections.all(initialized_only=True):
+        connection.close()
+        close_pool = getattr(connection, "close_pool", None)
+        if close_pool is not None:
+            close_pool()
+    for cache in caches.all(initialized_only=True):
+        cache.close()
+
+
+def when_ready(server):
+    """
+    Warm the preloaded application in the master, then drop the connections it opened so
+    workers do not inherit shared sockets.
+    """
+    global warmed_up
+
+    if not preload_app:
+        return
+    from apps.cinema.warmup import warm_process
+    from utils.db.queries import stop_flusher
+
+    try:
+        result = warm_process()
+    except Exception:
+        server.log.exception("Warming up the master failed, workers will warm up on their own.")
+    else:
+        warmed_up = True
+        server.log.info("Warmed up the master: %d template(s) compiled.", result.templates)
+    finally:
+        # Workers publish their own query stats; the master's would linger in the report.
+        stop_flusher()
+        close_connections()
+
+
+def post_worker_init(worker):
+    """
+    Warm a worker that did not inherit a warm master, and check its database connection
+    before it takes requests; with DATABASE_POOL this also opens the worker's pool.
+    """
+    from django.db import connection
+
+    if not warmed_up:
+        from apps.cinema.warmup import warm_process
+
+        try:
+            warm_process()
+        except Exception:
+            worker.log.exception("Warming up worker %s failed, starting cold.", worker.pid)
+    try:
+        connection.ensure_connection()
+    except Exception:
+        worker.log.exception("Worker %s could not connect to the database.", worker.pid)
+    finally:
+        # Request threads use their own connections; a pooled one goes back to the pool.
+        connection.close()
+
+
+def worker_exit(server, worker):
+    """
+    Close the worker's connection pools so Postgres does not keep its sessions open.
+    """
+    close_connections()
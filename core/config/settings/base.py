@@ -45,9 +45,34 @@ DATABASES = {
         "PORT": env.str("DATABASE_PORT", default="5432"),
     },
 }
-
-
-DATABASES["default"]["ATOMIC_REQUESTS"] = True
+# https://docs.djangoproject.com/en/dev/ref/databases/#connection-pool
+# Every process keeps a bounded psycopg pool per alias; connections are checked on checkout
+# and recycled once they grow old or idle, so dead ones never reach a request.
+if env.bool("DATABASE_POOL", default=False):
+    DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": env.int("DATABASE_POOL_MIN_SIZE", default=1),
+            "max_size": env.int("DATABASE_POOL_MAX_SIZE", default=4),
+            "timeout": env.float("DATABASE_POOL_TIMEOUT", default=10.0),
+            "max_lifetime": env.float("DATABASE_POOL_MAX_LIFETIME", default=1800.0),
+            "max_idle": env.float("DATABASE_POOL_MAX_IDLE", default=300.0),
+        },
+    }
+# Read replicas share the primary's credentials; test runs mirror them onto the primary.
+DATABASE_REPLICAS = []
+for index, host in enumerate(env.list("DATABASE_REPLICA_HOSTS", default=[]), start=1):
+    DATABASES[f"replica_{index}"] = {**DATABASES["default"], "HOST": host, "TEST": {"MIRROR": "default"}}
+    DATABASE_REPLICAS.append(f"replica_{index}")
+# https://docs.djangoproject.com/en/dev/topics/db/multi-db/#using-routers
+DATABASE_ROUTERS = ["utils.db.routers.PrimaryReplicaRouter"]
+# Seconds a client keeps reading from the primary after a write (read-your-writes).
+DATABASE_PRIMARY_STICKY_SECONDS = env.int("DATABASE_PRIMARY_STICKY_SECONDS", default=10)
+# Used by utils.db.transactions.retry_atomic; requests themselves run in autocommit.
+TRANSACTION_ISOLATION_LEVEL = env.str("TRANSACTION_ISOLATION_LEVEL", default="read committed")
+TRANSACTION_RETRY_ATTEMPTS = env.int("TRANSACTION_RETRY_ATTEMPTS", default=5)
+TRANSACTION_RETRY_BASE_DELAY = env.float("TRANSACTION_RETRY_BASE_DELAY", default=0.01)
+TRANSACTION_RETRY_MAX_DELAY = env.float("TRANSACTION_RETRY_MAX_DELAY", default=0.5)
 # https://docs.djangoproject.com/en/stable/ref/settings/#std:setting-DEFAULT_AUTO_FIELD
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -79,7 +104,10 @@ THIRD_PARTY_APPS = [
 
 LOCAL_APPS = [
     "apps.user",
-    "apps.cinema"
+    "apps.cinema",
+    "apps.outbox",
+    "apps.jobs",
+    "utils",
 ]
 # https://docs.djangoproject.com/en/dev/ref/settings/#installed-apps
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -115,11 +143,14 @@ AUTH_PASSWORD_VALIDATORS = [
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#middleware
 MIDDLEWARE = [
+    "utils.log.middleware.RequestLogContextMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
+    "utils.db.middleware.ReplicaRoutingMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "utils.profiling.ProfilingMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
@@ -174,6 +205,9 @@ TEMPLATES = [
     }
 ]
 
+# https://docs.djangoproject.com/en/dev/ref/settings/#form-renderer
+FORM_RENDERER = "django.forms.renderers.TemplatesSetting"
+
 # FIXTURES
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#fixture-dirs
@@ -218,26 +252,49 @@ MANAGERS = ADMINS
 # https://docs.djangoproject.com/en/dev/ref/settings/#logging
 # See https://docs.djangoproject.com/en/dev/topics/logging for
 # more details on how to customize your logging configuration.
+# Records are enqueued by utils.log.handlers.QueueHandler and written by a listener thread,
+# so file I/O and rotation never block a request. Admin emails stay on the logging thread:
+# AdminEmailHandler renders the request attached to the record, which must still be live.
+LOGGING_CONFIG = "utils.log.handlers.configure_logging"
+# "verbose" for plain text lines, "json" for one JSON object per line with request ids.
+LOG_FORMAT = env.str("DJANGO_LOG_FORMAT", default="verbose")
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
     "formatters": {
         "verbose": {
-            "format": "%(levelname)s %(asctime)s %(module)s %(process)d %(thread)d %(message)s",
+            "format": "%(levelname)s %(asctime)s %(module)s %(process)d %(thread)d %(request_id)s %(message)s",
         },
         "simple": {
             "format": "%(levelname)s %(message)s",
         },
+        "json": {
+            "()": "utils.log.formatters.JsonFormatter",
+        },
+    },
+    "filters": {
+        "request_context": {
+            "()": "utils.log.filters.RequestContextFilter",
+        },
+        "require_debug_false": {
+            "()": "django.utils.log.RequireDebugFalse",
+        },
+        # Keeps 1 in 10 records below WARNING of the loggers it is attached to.
+        "sample": {
+            "()": "utils.log.filters.SamplingFilter",
+            "rate": 0.1,
+        },
     },
     "handlers": {
         "console": {
             "level": "DEBUG",
             "class": "logging.StreamHandler",
-            "formatter": "verbose",
+            "formatter": LOG_FORMAT,
         },
         "mail_admins": {
             "level": "ERROR",
             "class": "django.utils.log.AdminEmailHandler",
+            "filters": ["require_debug_false"],
             "include_html": True,
         },
         "rotation_file": {
@@ -245,16 +302,63 @@ LOGGING = {
             "filename": BASE_DIR / "logs/debug.log",
             "maxBytes": 1024 * 1024 * 5,  # 5 MB
             "backupCount": 5,
-            "formatter": "verbose",
+            "formatter": LOG_FORMAT,
+        },
+        "queue": {
+            "()": "utils.log.handlers.QueueHandler",
+            "handlers": ["console", "rotation_file"],
+            "filters": ["request_context"],
         },
     },
-    "root": {"level": "INFO", "handlers": ["console", "rotation_file"]},
-    "loggers": {"django": {"handlers": ["rotation_file"], "level": "INFO"}}
+    "root": {"level": "INFO", "handlers": ["queue", "mail_admins"]},
+    "loggers": {
+        "django": {"level": "INFO"},
+        # Django's defaults stop this logger from propagating, so it needs its own handler.
+        "django.server": {"level": "INFO", "handlers": ["queue"], "filters": ["sample"], "propagate": False},
+    },
 }
 
 
 DOMAIN_NAME = "https://cinemahub.co"
 
+# PAGE CACHE
+# ------------------------------------------------------------------------------
+# Anonymous pages (utils.mixins.views.AnonymousPageCacheMixin): seconds a page is fresh, seconds
+# a stale copy may be served while it is rebuilt, and how long other requests wait for a rebuild.
+# Namespace versions expire after a day without use so crawled URLs do not pile up in the cache.
+PAGE_CACHE_ENABLED = env.bool("PAGE_CACHE_ENABLED", default=True)
+PAGE_CACHE_TIMEOUT = env.int("PAGE_CACHE_TIMEOUT", default=60)
+PAGE_CACHE_STALE_TIMEOUT = env.int("PAGE_CACHE_STALE_TIMEOUT", default=300)
+PAGE_CACHE_LOCK_TIMEOUT = 10
+PAGE_CACHE_LOCK_WAIT = 2
+PAGE_CACHE_VERSION_TIMEOUT = 24 * 60 * 60
+
+# PROFILING
+# ------------------------------------------------------------------------------
+# Staff requests with an "X-Profile: 1" header or "_profile=1" parameter are run under cProfile
+# (utils.profiling.ProfilingMiddleware) and dumped here; see the profile_report command.
+PROFILING_ENABLED = env.bool("PROFILING_ENABLED", default=True)
+PROFILING_DIR = BASE_DIR / "logs/profiles"
+
+# QUERY STATS
+# ------------------------------------------------------------------------------
+# utils.db.queries times every statement by fingerprint and view, keeps the statements slower
+# than DB_SLOW_QUERY_MS with their stack, and publishes each worker's counters to the cache
+# every DB_QUERY_STATS_FLUSH_SECONDS for the query_report command.
+DB_QUERY_STATS = env.bool("DB_QUERY_STATS", default=True)
+DB_SLOW_QUERY_MS = env.int("DB_SLOW_QUERY_MS", default=200)
+DB_QUERY_STATS_FLUSH_SECONDS = env.int("DB_QUERY_STATS_FLUSH_SECONDS", default=30)
+
+# CINEMA
+# ------------------------------------------------------------------------------
+# Halls with more seats than this get them generated by a background job.
+SEAT_GENERATION_SYNC_LIMIT = env.int("SEAT_GENERATION_SYNC_LIMIT", default=2000)
+# Pending reservations are canceled after this many minutes; 0 keeps them indefinitely.
+RESERVATION_HOLD_MINUTES = env.int("RESERVATION_HOLD_MINUTES", default=0)
+# Without a shared cache, seconds a process serves its movie index before rebuilding it, as
+# edits saved by other processes cannot invalidate it.
+MOVIE_INDEX_LOCAL_TIMEOUT = env.int("MOVIE_INDEX_LOCAL_TIMEOUT", default=60)
+
 
 CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap5"
 CRISPY_TEMPLATE_PACK = "bootstrap5"
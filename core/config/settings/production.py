@@ -15,7 +15,27 @@ ENVIRONMENT = "production"
 
 # DATABASES
 # ------------------------------------------------------------------------------
-DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)  # noqa: F405
+for database in DATABASES.values():  # noqa: F405
+    if "pool" in database.get("OPTIONS", {}):
+        # Pooled connections go back to the pool after each request instead of persisting.
+        continue
+    database["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)
+    database["CONN_HEALTH_CHECKS"] = True
+
+
+# CACHES
+# ------------------------------------------------------------------------------
+# Page cache versions and rebuild locks must be shared by all workers to be effective; without
+# Redis each worker has its own memory cache and would keep serving pages another invalidated.
+if env.str("REDIS_URL", default=""):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": env.str("REDIS_URL"),
+        }
+    }
+else:
+    PAGE_CACHE_ENABLED = False
 
 
 DEFAULT_CSRF_TRUSTED_ORIGINS: list[str] = []
@@ -80,28 +100,41 @@ LOGGING = {
     "disable_existing_loggers": True,
     "formatters": {
         "verbose": {
-            "format": "%(levelname)s %(asctime)s %(module)s %(process)d %(thread)d %(message)s",
+            "format": "%(levelname)s %(asctime)s %(module)s %(process)d %(thread)d %(request_id)s %(message)s",
+        },
+        "json": {
+            "()": "utils.log.formatters.JsonFormatter",
+        },
+    },
+    "filters": {
+        "request_context": {
+            "()": "utils.log.filters.RequestContextFilter",
         },
     },
     "handlers": {
         "console": {
             "level": "DEBUG",
             "class": "logging.StreamHandler",
-            "formatter": "verbose",
-        }
+            "formatter": LOG_FORMAT,  # noqa: F405
+        },
+        "queue": {
+            "()": "utils.log.handlers.QueueHandler",
+            "handlers": ["console"],
+            "filters": ["request_context"],
+        },
     },
-    "root": {"level": "INFO", "handlers": ["console"]},
+    "root": {"level": "INFO", "handlers": ["queue"]},
     "loggers": {
         "django.db.backends": {
             "level": "ERROR",
-            "handlers": ["console"],
+            "handlers": ["queue"],
             "propagate": False,
         },
         # Errors logged by the SDK itself
-        "sentry_sdk": {"level": "ERROR", "handlers": ["console"], "propagate": False},
+        "sentry_sdk": {"level": "ERROR", "handlers": ["queue"], "propagate": False},
         "django.security.DisallowedHost": {
             "level": "ERROR",
-            "handlers": ["console"],
+            "handlers": ["queue"],
             "propagate": False,
         },
     },
@@ -4,6 +4,7 @@ from django.contrib import admin
 from django.urls import URLPattern, URLResolver, include, path
 from django.views import defaults as default_views
 from django.views.generic import RedirectView
+from utils.db.views import HealthCheckView
 
 TURLList = list[URLPattern | URLResolver]
 
@@ -13,6 +14,7 @@ urlpatterns: TURLList = [
     path("", RedirectView.as_view(pattern_name="cinema:home", permanent=False)),
     path("auth/", include("apps.user.urls", namespace="auth")),
     path("cinema/", include("apps.cinema.urls", namespace="cinema")),
+    path("health/", HealthCheckView.as_view(), name="health"),
 
 ]
 
@@ -0,0 +1,11 @@
+"use strict";
+(function ($) {
+    $(document).on("change", ".autocomplete-filter select", function () {
+        const container = this.closest(".autocomplete-filter");
+        const params = new URLSearchParams(container.dataset.queryString);
+        if (this.value) {
+            params.set(container.dataset.lookupKwarg, this.value);
+        }
+        window.location.search = params.toString();
+    });
+})(django.jQuery);
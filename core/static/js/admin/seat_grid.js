@@ -0,0 +1,90 @@
+"use strict";
+(function () {
+    const EMPTY = "0";
+    const SEAT = "1";
+    const RESERVED = "2";
+
+    function rowToLabel(row) {
+        let label = "";
+        while (row > 0) {
+            row -= 1;
+            label = String.fromCharCode(65 + (row % 26)) + label;
+            row = Math.floor(row / 26);
+        }
+        return label;
+    }
+
+    function initEditor(editor) {
+        const input = document.getElementById(editor.dataset.inputId);
+        const layout = JSON.parse(document.getElementById(editor.dataset.layoutId).textContent);
+        const grid = editor.querySelector(".seat-grid");
+        const changes = {added: new Set(), removed: new Set()};
+
+        if (input.value) {
+            const pending = JSON.parse(input.value);
+            ["added", "removed"].forEach(key => {
+                (pending[key] || []).forEach(([row, col]) => changes[key].add(`${row}:${col}`));
+            });
+        }
+
+        const fragment = document.createDocumentFragment();
+        layout.forEach((cells, rowIndex) => {
+            const rowDiv = document.createElement("div");
+            rowDiv.className = "seat-grid-row";
+            const label = document.createElement("span");
+            label.className = "seat-grid-row-label";
+            label.textContent = rowToLabel(rowIndex + 1);
+            rowDiv.appendChild(label);
+
+            for (let colIndex = 0; colIndex < cells.length; colIndex++) {
+                const cell = document.createElement("span");
+                cell.className = "seat-cell";
+                cell.dataset.key = `${rowIndex + 1}:${colIndex + 1}`;
+                cell.dataset.state = cells[colIndex];
+                render(cell);
+                rowDiv.appendChild(cell);
+            }
+            fragment.appendChild(rowDiv);
+        });
+        grid.appendChild(fragment);
+
+        grid.addEventListener("click", event => {
+            const cell = event.target.closest(".seat-cell");
+            if (!cell || cell.dataset.state === RESERVED) {
+                return;
+            }
+            const key = cell.dataset.key;
+            const bucket = cell.dataset.state === SEAT ? changes.removed : changes.added;
+            if (bucket.has(key)) {
+                bucket.delete(key);
+            } else {
+                bucket.add(key);
+            }
+            render(cell);
+            input.value = serialize();
+        });
+
+        function render(cell) {
+            const key = cell.dataset.key;
+            const state = cell.dataset.state;
+            const changed = changes.added.has(key) || changes.removed.has(key);
+            const isSeat = (state === SEAT) !== changed;
+            cell.classList.toggle("seat-cell--seat", state !== RESERVED && isSeat);
+            cell.classList.toggle("seat-cell--reserved", state === RESERVED);
+            cell.classList.toggle("seat-cell--changed", changed);
+            cell.title = state === EMPTY && !changed ? "" : `${rowToLabel(Number(key.split(":")[0]))}${key.split(":")[1]}`;
+        }
+
+        function serialize() {
+            if (!changes.added.size && !changes.removed.size) {
+                return "";
+            }
+            const toCells = keys => Array.from(keys, key => key.split(":").map(Number));
+            return JSON.stringify({added: toCells(changes.added), removed: toCells(changes.removed)});
+        }
+    }
+
+    document.addEventListener("DOMContentLoaded", () => {
+        document.querySelectorAll(".seat-grid-editor").forEach(initEditor);
+    });
+})();
@@ -0,0 +1,66 @@
+/*
+ * Decoder for the compact seat map format built by apps/cinema/encoding.py.
+ */
+(function (global) {
+    "use strict";
+
+    function decodeMask(mask, size) {
+        const cells = new Set();
+        if (mask.runs) {
+            let position = 0;
+            mask.runs.forEach((length, index) => {
+                if (index % 2) {
+                    for (let cell = position; cell < position + length; cell++) cells.add(cell);
+                }
+                position += length;
+            });
+            return cells;
+        }
+        const bits = atob(mask.bits);
+        for (let cell = 0; cell < size; cell++) {
+            if (bits.charCodeAt(cell >> 3) & (0x80 >> (cell % 8))) cells.add(cell);
+        }
+        return cells;
+    }
+
+    function decodeIds(encoded) {
+        if (encoded.base === null) return [];
+        const ids = [encoded.base];
+        encoded.runs.forEach(([delta, count]) => {
+            for (let i = 0; i < count; i++) ids.push(ids[ids.length - 1] + delta);
+        });
+        return ids;
+    }
+
+    function rowLabel(row) {
+        let label = "";
+        while (row > 0) {
+            row -= 1;
+            label = String.fromCharCode(65 + (row % 26)) + label;
+            row = Math.floor(row / 26);
+        }
+        return label;
+    }
+
+    // Returns {rows, cols, seats: [{id, row, seatNumber, label, reserved}]} in row-major order;
+    // seatNumber is the grid column, label the row letters and the seat's position in the row.
+    function decodeSeatMap(payload) {
+        const size = payload.rows * payload.cols;
+        const cells = payload.seats
+            ? Array.from(decodeMask(payload.seats, size)).sort((a, b) => a - b)
+            : Array.from({length: size}, (_, cell) => cell);
+        const ids = decodeIds(payload.ids);
+        const reserved = decodeMask(payload.reserved, size);
+        // Seats are numbered by their position in the row, skipping aisles and gaps.
+        const positions = {};
+        const seats = cells.map((cell, index) => {
+            const row = Math.floor(cell / payload.cols) + 1;
+            const seatNumber = (cell % payload.cols) + 1;
+            positions[row] = (positions[row] || 0) + 1;
+            return {id: ids[index], row, seatNumber, label: rowLabel(row) + positions[row], reserved: reserved.has(cell)};
+        });
+        return {rows: payload.rows, cols: payload.cols, seats};
+    }
+
+    global.decodeSeatMap = decodeSeatMap;
+})(window);
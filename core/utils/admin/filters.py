@@ -0,0 +1,66 @@
+from django import forms
+from django.contrib import admin
+from django.contrib.admin.utils import get_model_from_relation
+from django.contrib.admin.views.main import PAGE_VAR
+from django.contrib.admin.widgets import AutocompleteSelect
+from django.utils.safestring import SafeString
+
+
+class AutocompleteFilter(admin.RelatedFieldListFilter):
+    """
+    Related field filter that pages its options through the admin autocomplete endpoint
+    instead of loading every related object into the changelist sidebar.
+
+    The related model admin must define ``search_fields`` and the model admin using the
+    filter should inherit from ``AutocompleteFilterMixin`` to load the select2 assets.
+    """
+    template = "admin/filters/autocomplete.html"
+
+    def __init__(self, field, request, params, model, model_admin, field_path) -> None:
+        self.admin_site = model_admin.admin_site
+        self.target_field_name = field.target_field.name
+        self.query_string = "?"
+        super().__init__(field, request, params, model, model_admin, field_path)
+
+    def field_choices(self, field, request, model_admin):
+        # Options are fetched page by page from the autocomplete view.
+        return []
+
+    def has_output(self) -> bool:
+        return True
+
+    def choices(self, changelist):
+        self.query_string = changelist.get_query_string(
+            remove=[self.lookup_kwarg, self.lookup_kwarg_isnull, PAGE_VAR]
+        )
+        yield {
+            "selected": self.lookup_val is None and not self.lookup_val_isnull,
+            "query_string": self.query_string,
+            "display": "",
+        }
+
+    @property
+    def widget(self) -> SafeString:
+        remote_model = get_model_from_relation(self.field)
+        field = forms.ModelChoiceField(
+            queryset=remote_model._default_manager.all(),
+            to_field_name=self.target_field_name,
+            widget=AutocompleteSelect(self.field, self.admin_site),
+            required=False,
+        )
+        value = self.lookup_val[-1] if self.lookup_val else None
+        return field.widget.render(self.lookup_kwarg, value, attrs={"id": f"id_filter_{self.lookup_kwarg}"})
+
+
+class AutocompleteFilterMixin:
+    """
+    Adds the autocomplete widget assets to changelists that use ``AutocompleteFilter``.
+    """
+    admin_site: admin.AdminSite
+
+    @property
+    def media(self) -> forms.Media:
+        autocomplete_media = AutocompleteSelect(None, self.admin_site).media
+        return super().media + autocomplete_media + forms.Media(  # type: ignore[misc]
+            js=["admin/js/jquery.init.js", "js/admin/autocomplete_filter.js"]
+        )
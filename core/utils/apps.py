@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class UtilsConfig(AppConfig):
+    name = "utils"
+
+    def ready(self):
+        import utils.db.queries  # noqa
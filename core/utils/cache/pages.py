@@ -0,0 +1,101 @@
+import hashlib
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+CSRF_PLACEHOLDER = "__page_cache_csrf_token__"
+
+
+def _version_key(namespace: str) -> str:
+    return f"page-version:{namespace}"
+
+
+def get_versions(namespaces: list[str]) -> list[int]:
+    """
+    Return the current version of every namespace, creating missing ones.
+
+    New versions start at the current time rather than 1 so a namespace evicted from the
+    cache, or expired after ``PAGE_CACHE_VERSION_TIMEOUT``, never comes back with a version
+    whose pages are still stored.
+    """
+    keys = [_version_key(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), settings.PAGE_CACHE_VERSION_TIMEOUT)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+async def aget_versions(namespaces: list[str]) -> list[int]:
+    keys = [_version_key(namespace) for namespace in namespaces]
+    versions = await cache.aget_many(keys)
+    for key in keys:
+        if key not in versions:
+            await cache.aadd(key, time.time_ns(), settings.PAGE_CACHE_VERSION_TIMEOUT)
+            versions[key] = await cache.aget(key)
+    return [versions[key] for key in keys]
+
+
+def bump_versions(*namespaces: str) -> None:
+    """
+    Invalidate every cached page built from these namespaces once the current transaction commits.
+    """
+    def bump():
+        for namespace in namespaces:
+            try:
+                cache.incr(_version_key(namespace))
+            except ValueError:
+                cache.set(_version_key(namespace), time.time_ns(), settings.PAGE_CACHE_VERSION_TIMEOUT)
+
+    transaction.on_commit(bump)
+
+
+@dataclass
+class CachedPage:
+    content: bytes
+    content_type: str
+    status: int
+    expires: float
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires > time.time()
+
+
+class PageCache:
+    """
+    Version-keyed page store with stampede protection: on a miss only the worker holding the
+    rebuild lock renders the page, while the others serve the stale copy or wait for the
+    fresh one for up to ``PAGE_CACHE_LOCK_WAIT`` seconds.
+    """
+    def __init__(self, key_parts: list[str], versions: list[int]):
+        digest = hashlib.md5(":".join([*key_parts, *map(str, versions)]).encode(), usedforsecurity=False)
+        self.key = f"page:{digest.hexdigest()}"
+        self.lock_key = f"{self.key}:lock"
+
+    def get(self) -> CachedPage | None:
+        return cache.get(self.key)
+
+    def acquire(self) -> bool:
+        return cache.add(self.lock_key, 1, timeout=settings.PAGE_CACHE_LOCK_TIMEOUT)
+
+    def wait(self) -> CachedPage | None:
+        deadline = time.monotonic() + settings.PAGE_CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            page = self.get()
+            if page is not None and page.fresh:
+                return page
+        return None
+
+    def set(self, content: bytes, content_type: str, status: int) -> None:
+        page = CachedPage(content, content_type, status, time.time() + settings.PAGE_CACHE_TIMEOUT)
+        # Kept past expiry so the stale copy can be served while one worker rebuilds it.
+        cache.set(self.key, page, settings.PAGE_CACHE_TIMEOUT + settings.PAGE_CACHE_STALE_TIMEOUT)
+
+    def release(self) -> None:
+        cache.delete(self.lock_key)
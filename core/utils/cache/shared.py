@@ -0,0 +1,11 @@
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+
+def is_shared_cache(alias: str = DEFAULT_CACHE_ALIAS) -> bool:
+    """
+    Whether the ``alias`` cache is seen by every process, unlike the per-process local
+    memory cache (or the dummy one, which keeps nothing).
+    """
+    return not isinstance(caches[alias], (LocMemCache, DummyCache))
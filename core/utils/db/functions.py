@@ -0,0 +1,15 @@
+from django.db.models import DurationField, Func
+
+
+class MinutesToInterval(Func):
+    """
+    Convert an integer number of minutes into an interval usable in datetime arithmetic.
+    """
+    output_field = DurationField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, template="make_interval(mins => %(expressions)s)", **extra_context)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        # SQLite stores durations as integer microseconds.
+        return self.as_sql(compiler, connection, template="(%(expressions)s * 60000000)", **extra_context)
@@ -0,0 +1,58 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from utils.db.routers import read_from_replicas, set_replica_reads, track_primary_writes
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Serve safe requests to views flagged with ``read_from_replicas`` from the replicas.
+
+    Clients that wrote to the primary get a short-lived cookie that keeps their reads on
+    the primary, so they always see their own writes despite replication lag.
+    """
+    cookie_name = "db_primary"
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with track_primary_writes() as writes, read_from_replicas(False):
+            response = self.get_response(request)
+        return self.stick_to_primary(response, writes["primary"])
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        with track_primary_writes() as writes, read_from_replicas(False):
+            response = await self.get_response(request)
+        return self.stick_to_primary(response, writes["primary"])
+
+    def stick_to_primary(self, response: HttpResponse, wrote: bool) -> HttpResponse:
+        if wrote and settings.DATABASE_REPLICAS:
+            response.set_cookie(
+                self.cookie_name,
+                "1",
+                max_age=settings.DATABASE_PRIMARY_STICKY_SECONDS,
+                secure=settings.SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    def process_view(self, request: HttpRequest, view_func, view_args, view_kwargs) -> None:
+        view_class = getattr(view_func, "view_class", None)
+        if (
+            request.method in SAFE_METHODS
+            and getattr(view_class, "read_from_replicas", False)
+            and self.cookie_name not in request.COOKIES
+        ):
+            # Lasts until __call__ leaves its read_from_replicas(False) block.
+            set_replica_reads(True)
+        return None
@@ -0,0 +1,27 @@
+from typing import Any
+
+from django.db import connections
+
+
+def pool_stats() -> dict[str, dict[str, Any]]:
+    """
+    Return this process' psycopg pool counters (waits, checkouts, timeouts, sizes) per alias.
+    """
+    stats = {}
+    for alias in connections:
+        connection = connections[alias]
+        pool = getattr(connection, "pool", None)
+        if pool is None:
+            continue
+        counters = pool.get_stats()
+        stats[alias] = {
+            "pool_size": counters.get("pool_size", 0),
+            "pool_available": counters.get("pool_available", 0),
+            "requests_waiting": counters.get("requests_waiting", 0),
+            "checkouts": counters.get("requests_num", 0),
+            "queued": counters.get("requests_queued", 0),
+            "wait_ms": counters.get("requests_wait_ms", 0),
+            "timeouts": counters.get("requests_errors", 0),
+            "connections_lost": counters.get("connections_lost", 0),
+        }
+    return stats
@@ -0,0 +1,247 @@
+import logging
+import os
+import re
+import socket
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from utils.log.filters import get_log_context
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "db-query-stats"
+WORKERS_KEY = f"{CACHE_PREFIX}:workers"
+RESET_KEY = f"{CACHE_PREFIX}:reset"
+# Worker snapshots outlive a few missed flushes, then drop out of the report.
+SNAPSHOT_TIMEOUT = 60 * 60
+# Distinct (view, fingerprint) pairs tracked per process; the rest are folded into one entry.
+MAX_ENTRIES = 2000
+OTHER_FINGERPRINT = "(other queries)"
+STACK_DEPTH = 8
+SLOW_QUERY_SAMPLES = 50
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w\"])-?\d+(?:\.\d+)?\b")
+_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(sql: str) -> str:
+    """
+    Normalize a statement so queries differing only by literals or by the length of an
+    ``IN (...)`` list share a fingerprint.
+    """
+    sql = _STRING.sub("?", sql).replace("%s", "?")
+    sql = _NUMBER.sub("?", sql)
+    sql = _LIST.sub("(...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+@dataclass
+class QueryStat:
+    view: str
+    fingerprint: str
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, count: int, total: float, longest: float) -> None:
+        self.count += count
+        self.total += total
+        self.max = max(self.max, longest)
+
+
+@dataclass
+class SlowQuery:
+    view: str
+    sql: str
+    duration: float
+    stack: list[str] = field(default_factory=list)
+    at: float = 0.0
+
+
+_stats: dict[tuple[str, str], QueryStat] = {}
+_slow_queries: deque[SlowQuery] = deque(maxlen=SLOW_QUERY_SAMPLES)
+_lock = threading.Lock()
+_state: dict[str, float] = {"reset_at": 0.0}
+_flushing = threading.local()
+_flusher_pid = 0
+_stop_flusher = threading.Event()
+
+
+def _reset_after_fork() -> None:
+    """
+    Give a forked child its own lock and empty counters: the parent's lock may have been
+    held by another thread at fork time, and its counters are published by the parent.
+    """
+    global _lock, _flusher_pid, _stop_flusher
+    _lock = threading.Lock()
+    _stats.clear()
+    _slow_queries.clear()
+    _flusher_pid = 0
+    _stop_flusher = threading.Event()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def project_stack() -> list[str]:
+    """
+    The innermost project frames of the current stack, e.g. ``apps/cinema/views.py:160 in get_payload``.
+    """
+    root = str(Path(settings.BASE_DIR)) + os.sep
+    frames = [
+        frame for frame in traceback.extract_stack()[:-2]
+        if frame.filename.startswith(root) and not frame.filename.endswith(os.path.join("db", "queries.py"))
+    ]
+    return [
+        f"{frame.filename.removeprefix(root)}:{frame.lineno} in {frame.name}" for frame in frames[-STACK_DEPTH:]
+    ]
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    ``execute_wrapper`` timing each statement by fingerprint and view, and keeping the
+    statements slower than ``DB_SLOW_QUERY_MS`` with the project frames that issued them.
+    """
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - start
+        view = get_log_context().get("view", "-")
+        key = (view, fingerprint(sql))
+        with _lock:
+            if key not in _stats and len(_stats) >= MAX_ENTRIES:
+                key = (view, OTHER_FINGERPRINT)
+            stat = _stats.get(key)
+            if stat is None:
+                stat = _stats[key] = QueryStat(*key)
+            stat.add(1, duration, duration)
+        if duration * 1000 >= settings.DB_SLOW_QUERY_MS:
+            slow_query = SlowQuery(view, sql[:2000], duration, project_stack(), time.time())
+            with _lock:
+                _slow_queries.append(slow_query)
+
+
+@receiver(connection_created)
+def install_query_stats(sender, connection, **kwargs):
+    if settings.DB_QUERY_STATS and record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+        start_flusher()
+
+
+def start_flusher() -> None:
+    """
+    Start the thread publishing this process' counters every ``DB_QUERY_STATS_FLUSH_SECONDS``,
+    keeping the cache round trips out of the requests; forked workers start their own.
+    """
+    global _flusher_pid
+    with _lock:
+        if _flusher_pid == os.getpid():
+            return
+        _flusher_pid = os.getpid()
+    threading.Thread(target=_flush_periodically, args=(_stop_flusher,), name="query-stats-flusher", daemon=True).start()
+
+
+def stop_flusher() -> None:
+    """
+    Stop publishing from this process and drop its counters, e.g. in a preloading gunicorn
+    master whose only queries are the warm-up ones.
+    """
+    _stop_flusher.set()
+    with _lock:
+        _stats.clear()
+        _slow_queries.clear()
+
+
+def _flush_periodically(stop: threading.Event) -> None:
+    while not stop.wait(settings.DB_QUERY_STATS_FLUSH_SECONDS):
+        try:
+            flush_query_stats()
+        except Exception:
+            logger.exception("Publishing the query stats failed.")
+
+
+def worker_key() -> str:
+    return f"{CACHE_PREFIX}:{socket.gethostname()}:{os.getpid()}"
+
+
+def flush_query_stats() -> None:
+    """
+    Publish this process' counters to the cache, where ``collect_query_stats()`` merges the
+    snapshots of every worker.
+    """
+    if getattr(_flushing, "active", False):
+        # The cache backend may itself run queries.
+        return
+    _flushing.active = True
+    try:
+        reset_at = cache.get(RESET_KEY, 0.0)
+        with _lock:
+            if reset_at != _state["reset_at"]:
+                # Another process ran reset_query_stats() since the last flush.
+                _stats.clear()
+                _slow_queries.clear()
+                _state["reset_at"] = reset_at
+            snapshot = {
+                "stats": [(stat.view, stat.fingerprint, stat.count, stat.total, stat.max) for stat in _stats.values()],
+                "slow": list(_slow_queries),
+            }
+        key = worker_key()
+        cache.set(key, snapshot, SNAPSHOT_TIMEOUT)
+        # Racing workers may drop each other from the list; they add themselves back on their next flush.
+        workers = cache.get(WORKERS_KEY) or []
+        # Drop the workers whose snapshot expired, e.g. the ones recycled after max_requests.
+        live = [worker for worker in cache.get_many(workers) if worker != key]
+        if len(live) + 1 != len(workers) or key not in workers:
+            cache.set(WORKERS_KEY, [*live, key], None)
+    finally:
+        _flushing.active = False
+
+
+@dataclass
+class QueryReport:
+    stats: list[QueryStat]
+    slow_queries: list[SlowQuery]
+    workers: int
+
+
+def collect_query_stats() -> QueryReport:
+    """
+    Merge the published snapshots of all workers, including this process' current counters.
+    """
+    flush_query_stats()
+    workers = cache.get(WORKERS_KEY) or []
+    snapshots: dict[str, Any] = cache.get_many(workers)
+    merged: dict[tuple[str, str], QueryStat] = {}
+    slow_queries = []
+    for snapshot in snapshots.values():
+        for view, query, count, total, longest in snapshot["stats"]:
+            stat = merged.get((view, query))
+            if stat is None:
+                stat = merged[view, query] = QueryStat(view, query)
+            stat.add(count, total, longest)
+        slow_queries.extend(snapshot["slow"])
+    return QueryReport(
+        list(merged.values()), sorted(slow_queries, key=lambda query: query.duration, reverse=True), len(snapshots)
+    )
+
+
+def reset_query_stats() -> None:
+    """
+    Clear every published snapshot; each worker clears its counters on its next flush.
+    """
+    cache.set(RESET_KEY, time.time(), None)
+    cache.delete_many([*(cache.get(WORKERS_KEY) or []), WORKERS_KEY])
@@ -0,0 +1,72 @@
+import random
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from asgiref.local import Local
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+_state = Local()
+
+
+def set_replica_reads(enabled: bool) -> None:
+    """
+    Allow (or forbid) reads outside of ``transaction.atomic`` blocks to go to the replicas.
+    """
+    _state.replicas_enabled = enabled
+
+
+@contextmanager
+def read_from_replicas(enabled: bool = True) -> Iterator[None]:
+    previous = getattr(_state, "replicas_enabled", False)
+    set_replica_reads(enabled)
+    try:
+        yield
+    finally:
+        set_replica_reads(previous)
+
+
+@contextmanager
+def track_primary_writes() -> Iterator[dict[str, bool]]:
+    """
+    Record whether the wrapped code routed a write to the primary.
+    """
+    previous = getattr(_state, "writes", None)
+    _state.writes = writes = {"primary": False}
+    try:
+        yield writes
+    finally:
+        _state.writes = previous
+
+
+class PrimaryReplicaRouter:
+    """
+    Send writes and reads inside atomic blocks to the primary, and reads inside
+    ``read_from_replicas()`` to one of ``settings.DATABASE_REPLICAS``.
+    """
+    def db_for_read(self, model, **hints):
+        replicas = settings.DATABASE_REPLICAS
+        if (
+            not replicas
+            or not getattr(_state, "replicas_enabled", False)
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        writes = getattr(_state, "writes", None)
+        if writes is not None:
+            writes["primary"] = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
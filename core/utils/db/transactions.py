@@ -0,0 +1,93 @@
+import functools
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from typing import ParamSpec, TypeVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, transaction
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+ISOLATION_LEVELS = ("read committed", "repeatable read", "serializable")
+# serialization_failure and deadlock_detected: the transaction can simply be run again.
+RETRYABLE_SQLSTATES = ("40001", "40P01")
+
+_metrics: Counter[str] = Counter()
+_metrics_lock = threading.Lock()
+
+
+def _count(metric: str) -> None:
+    with _metrics_lock:
+        _metrics[metric] += 1
+
+
+def transaction_metrics() -> dict[str, int]:
+    """
+    Return this process' counts of retried transactions, retries and exhausted attempts.
+    """
+    with _metrics_lock:
+        return dict(_metrics)
+
+
+def is_retryable(error: BaseException) -> bool:
+    cause = error.__cause__
+    sqlstate = getattr(cause, "sqlstate", None) or getattr(cause, "pgcode", None)
+    return sqlstate in RETRYABLE_SQLSTATES
+
+
+def retry_atomic(
+    using: str = DEFAULT_DB_ALIAS,
+    isolation: str | None = None,
+    attempts: int | None = None,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Run the decorated function in its own transaction and run it again, after a jittered
+    backoff, when Postgres aborts it with a serialization failure or a deadlock.
+
+    Called inside an existing atomic block the function only gets a savepoint: the outer
+    transaction owns both the isolation level and any retry.
+    """
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            connection = connections[using]
+            if connection.in_atomic_block:
+                with transaction.atomic(using=using):
+                    return func(*args, **kwargs)
+
+            level = isolation or settings.TRANSACTION_ISOLATION_LEVEL
+            if level not in ISOLATION_LEVELS:
+                raise ValueError(f"Unknown isolation level {level!r}.")
+            max_attempts = attempts or settings.TRANSACTION_RETRY_ATTEMPTS
+
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    with transaction.atomic(using=using):
+                        if connection.vendor == "postgresql":
+                            with connection.cursor() as cursor:
+                                cursor.execute(f"SET TRANSACTION ISOLATION LEVEL {level.upper()}")
+                        return func(*args, **kwargs)
+                except OperationalError as error:
+                    if not is_retryable(error):
+                        raise
+                    if attempt == max_attempts:
+                        _count("exhausted")
+                        raise
+                    _count("retries")
+                    if attempt == 1:
+                        _count("retried_transactions")
+                    # Full jitter keeps colliding transactions from retrying in lockstep.
+                    delay = min(
+                        settings.TRANSACTION_RETRY_MAX_DELAY,
+                        settings.TRANSACTION_RETRY_BASE_DELAY * 2 ** attempt,
+                    )
+                    time.sleep(random.uniform(0, delay))
+            raise AssertionError("unreachable")
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,24 @@
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.http import HttpRequest, JsonResponse
+from django.views import View
+from utils.db.pool import pool_stats
+from utils.db.transactions import transaction_metrics
+
+
+class HealthCheckView(View):
+    """
+    Liveness probe for the load balancer; staff also get this worker's pool and transaction retry counters.
+    """
+    def get(self, request: HttpRequest) -> JsonResponse:
+        try:
+            with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+                cursor.execute("SELECT 1")
+        except DatabaseError:
+            return JsonResponse({"status": "unavailable"}, status=503)
+
+        data: dict = {"status": "ok"}
+        if request.user.is_staff:
+            data["pools"] = pool_stats()
+            data["transactions"] = transaction_metrics()
+        return JsonResponse(data)
+
@@ -0,0 +1,60 @@
+import logging
+import random
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from asgiref.local import Local
+
+_state = Local()
+
+
+@contextmanager
+def log_context(request_id: str) -> Iterator[None]:
+    """
+    Tag the records logged by the wrapped code with ``request_id``.
+    """
+    previous = getattr(_state, "context", None)
+    _state.context = {"request_id": request_id}
+    try:
+        yield
+    finally:
+        _state.context = previous
+
+
+def get_log_context() -> dict[str, str]:
+    return getattr(_state, "context", None) or {}
+
+
+def update_log_context(**values: str) -> None:
+    """
+    Add fields, e.g. the ``view`` once it is resolved, to the current ``log_context()``.
+    """
+    context = getattr(_state, "context", None)
+    if context is not None:
+        context.update(values)
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Copy the current request id and view name onto the record, "-" outside of requests.
+
+    Attach it to the queue handler so it runs in the logging thread, not the listener.
+    """
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = get_log_context()
+        record.request_id = context.get("request_id", "-")
+        record.view = context.get("view", "-")
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep a ``rate`` fraction of the records below ``level``; records at or above it always pass.
+    """
+    def __init__(self, rate: float = 0.1, level: str | int = logging.WARNING, name: str = "") -> None:
+        super().__init__(name)
+        self.rate = rate
+        self.level = level if isinstance(level, int) else logging.getLevelName(level)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= self.level or random.random() < self.rate
@@ -0,0 +1,34 @@
+import json
+import logging
+from datetime import UTC, datetime
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+# Attributes every LogRecord has; anything else on a record was passed through ``extra``.
+RECORD_ATTRIBUTES = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime", "request_id", "view"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line, with the request context and ``extra`` fields.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+            "view": getattr(record, "view", "-"),
+            "module": record.module,
+            "process": record.process,
+            "thread": record.thread,
+        }
+        for key, value in record.__dict__.items():
+            if key not in RECORD_ATTRIBUTES and key != "request":
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, cls=DjangoJSONEncoder, default=str)
@@ -0,0 +1,115 @@
+import atexit
+import logging
+import logging.config
+import os
+import queue
+import weakref
+from collections.abc import Mapping
+from logging.handlers import QueueListener
+from typing import Any
+
+_running: "weakref.WeakSet[QueueHandler]" = weakref.WeakSet()
+
+
+class SafeQueueListener(QueueListener):
+    """
+    A ``QueueListener`` whose thread survives a target handler raising: the error is reported
+    through the handler's ``handleError()`` and the remaining targets still get the record.
+    """
+    def handle(self, record: logging.LogRecord) -> None:
+        record = self.prepare(record)
+        for handler in self.handlers:
+            if self.respect_handler_level and record.levelno < handler.level:
+                continue
+            try:
+                handler.handle(record)
+            except Exception:
+                handler.handleError(record)
+
+
+class QueueHandler(logging.handlers.QueueHandler):
+    """
+    Hand records to a background listener thread that formats them and runs ``handlers``.
+
+    The logging thread only merges the message arguments and enqueues the record, so slow
+    disks or log rotation never hold up a request. When the bounded queue is full, records
+    are dropped and counted in ``dropped`` rather than blocking. Configure it with ``"()"``
+    and the names of the target handlers, and load the logging settings with
+    ``configure_logging()`` so the listener gets started.
+
+    Targets run after the request is over, so handlers reading ``record.request`` (such as
+    ``AdminEmailHandler``) belong next to this handler rather than behind it.
+    """
+    def __init__(self, handlers: list[str], maxsize: int = 10000) -> None:
+        super().__init__(queue.Queue(maxsize))
+        self.handler_names = handlers
+        self.maxsize = maxsize
+        self.targets: list[logging.Handler] = []
+        self.listener: SafeQueueListener | None = None
+        self.dropped = 0
+
+    def start(self, handlers: Mapping[str, logging.Handler]) -> None:
+        self.targets = [handlers[name] for name in self.handler_names]
+        self.listener = SafeQueueListener(self.queue, *self.targets, respect_handler_level=True)
+        self.listener.start()
+        _running.add(self)
+
+    def stop(self) -> None:
+        """
+        Stop the listener once it has handled the records already queued.
+        """
+        _running.discard(self)
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unlike the base class, leave formatting (and the traceback) to the listener thread.
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        self.stop()
+        super().close()
+
+    def restart_after_fork(self) -> None:
+        # The listener thread does not survive a fork and the queue's lock may be held.
+        self.queue = queue.Queue(self.maxsize)
+        self.listener = SafeQueueListener(self.queue, *self.targets, respect_handler_level=True)
+        self.listener.start()
+
+
+def configure_logging(config: dict[str, Any]) -> None:
+    """
+    ``LOGGING_CONFIG`` callable: apply ``config`` like ``dictConfig()``, then start the queue
+    handlers' listeners with the handlers they name.
+    """
+    configurator = logging.config.DictConfigurator(config)
+    configurator.configure()
+    handlers = configurator.config.get("handlers", {})  # type: ignore[attr-defined]
+    for handler in handlers.values():
+        if isinstance(handler, QueueHandler):
+            handler.start(handlers)
+
+
+@atexit.register
+def _stop_listeners() -> None:
+    # Runs before logging's own shutdown closes the target handlers.
+    for handler in list(_running):
+        handler.stop()
+
+
+def _restart_listeners() -> None:
+    for handler in list(_running):
+        handler.restart_after_fork()
+
+
+os.register_at_fork(after_in_child=_restart_listeners)
@@ -0,0 +1,52 @@
+import re
+import uuid
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpRequest, HttpResponse
+from utils.log.filters import log_context, update_log_context
+
+REQUEST_ID_HEADER = "X-Request-ID"
+# Ids forwarded by a proxy are only trusted when they look like one.
+REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{8,64}$")
+
+
+class RequestLogContextMiddleware:
+    """
+    Tag the records logged during a request with its id and view name.
+
+    The id comes from the proxy's ``X-Request-ID`` header when present, else is generated,
+    and is echoed on the response so client reports can be matched with the logs.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        request_id = self.get_request_id(request)
+        with log_context(request_id):
+            response = self.get_response(request)
+        response[REQUEST_ID_HEADER] = request_id
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        request_id = self.get_request_id(request)
+        with log_context(request_id):
+            response = await self.get_response(request)
+        response[REQUEST_ID_HEADER] = request_id
+        return response
+
+    @staticmethod
+    def get_request_id(request: HttpRequest) -> str:
+        request_id = request.headers.get(REQUEST_ID_HEADER, "")
+        return request_id if REQUEST_ID_PATTERN.match(request_id) else uuid.uuid4().hex
+
+    def process_view(self, request: HttpRequest, view_func, view_args, view_kwargs) -> None:
+        if request.resolver_match is not None:
+            update_log_context(view=request.resolver_match.view_name)
+        return None
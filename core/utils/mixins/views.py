@@ -0,0 +1,100 @@
+from typing import Any
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.http import HttpRequest, HttpResponse
+from django.middleware.csrf import get_token
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.translation import get_language
+from utils.cache.pages import CSRF_PLACEHOLDER, CachedPage, PageCache, get_versions
+
+
+class ReplicaReadMixin:
+    """
+    Mark a read-only view so its safe requests are served from the read replicas.
+    """
+    read_from_replicas = True
+
+
+class AnonymousPageCacheMixin:
+    """
+    Cache the rendered page of a view for anonymous visitors.
+
+    Pages are keyed by URL, language and the versions of ``get_page_cache_namespaces()``, so
+    ``bump_versions()`` invalidates them. The CSRF token is rendered as a placeholder and
+    filled in for each visitor; pages without one are marked public for shared caches.
+    Turned off by ``PAGE_CACHE_ENABLED`` when the cache is not shared between workers.
+    """
+    page_cache_render = False
+
+    def get_page_cache_namespaces(self) -> list[str]:
+        raise NotImplementedError
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)  # type: ignore[misc]
+        if self.page_cache_render:
+            context["csrf_token"] = CSRF_PLACEHOLDER
+        return context
+
+    def is_page_cacheable(self, request: HttpRequest) -> bool:
+        if not settings.PAGE_CACHE_ENABLED or request.method not in ("GET", "HEAD"):
+            return False
+        if request.user.is_authenticated:
+            return False
+        # Pending flash messages are per visitor.
+        return not len(get_messages(request))
+
+    def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        if not self.is_page_cacheable(request):
+            return super().dispatch(request, *args, **kwargs)  # type: ignore[misc]
+        page_cache, page, state = self.lookup_page(request)
+        if page is None:
+            self.page_cache_render = True
+            try:
+                response = super().dispatch(request, *args, **kwargs)  # type: ignore[misc]
+                page = self.store_page(response, page_cache)
+            finally:
+                if page_cache is not None:
+                    page_cache.release()
+        return self.page_response(request, page, state)
+
+    def lookup_page(self, request: HttpRequest) -> tuple[PageCache | None, CachedPage | None, str]:
+        """
+        Return the page to serve and its ``X-Page-Cache`` state. Without a page the view must
+        render it, and store it in the returned ``PageCache`` whose rebuild lock it now holds.
+        """
+        versions = get_versions(self.get_page_cache_namespaces())
+        page_cache = PageCache([request.get_host(), request.get_full_path(), get_language()], versions)
+        page = page_cache.get()
+        if page is not None and page.fresh:
+            return None, page, "HIT"
+        if page_cache.acquire():
+            return page_cache, None, "MISS"
+        if page is not None:
+            return None, page, "STALE"
+        page = page_cache.wait()
+        return None, page, "HIT" if page is not None else "MISS"
+
+    @staticmethod
+    def store_page(response: HttpResponse, page_cache: PageCache | None) -> CachedPage:
+        if hasattr(response, "render"):
+            response.render()
+        page = CachedPage(response.content, response["Content-Type"], response.status_code, 0)
+        if page_cache is not None and response.status_code == 200:
+            page_cache.set(page.content, page.content_type, page.status)
+        return page
+
+    @staticmethod
+    def page_response(request: HttpRequest, page: CachedPage, state: str) -> HttpResponse:
+        content = page.content
+        uses_csrf = CSRF_PLACEHOLDER.encode() in content
+        if uses_csrf:
+            content = content.replace(CSRF_PLACEHOLDER.encode(), get_token(request).encode())
+        response = HttpResponse(content, content_type=page.content_type, status=page.status)
+        response["X-Page-Cache"] = state
+        patch_vary_headers(response, ("Cookie",))
+        if uses_csrf:
+            patch_cache_control(response, private=True, max_age=0)
+        else:
+            patch_cache_control(response, public=True, max_age=0, s_maxage=settings.PAGE_CACHE_TIMEOUT)
+        return response
@@ -0,0 +1,128 @@
+import cProfile
+import pstats
+import uuid
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_PARAMETER = "_profile"
+TIMESTAMP_FORMAT = "%Y%m%dT%H%M%S"
+
+
+class ProfilingMiddleware:
+    """
+    Run a staff request under ``cProfile`` when it carries an ``X-Profile: 1`` header or a
+    ``_profile=1`` query parameter, and store the pstats dump in ``PROFILING_DIR``.
+
+    Files are named ``<timestamp>-<view name>-<id>.prof`` and the name is sent back in the
+    ``X-Profile`` response header; ``profile_report`` aggregates them. The profiler follows
+    the thread it was started in: under WSGI that covers the sync work async views hand
+    back to the request thread (ORM calls, rendering).
+
+    Under ASGI the profiler runs on the event loop thread, so while the profiled request
+    awaits, the other requests the loop serves are recorded in its profile too, while the
+    sync work it hands to worker threads is not. Profile on an otherwise idle worker, or
+    under WSGI, to get a clean picture of one view.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not (self.is_requested(request) and request.user.is_staff):
+            return self.get_response(request)
+        profiler = cProfile.Profile()
+        response = profiler.runcall(self.get_response, request)
+        return self.save(request, response, profiler)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        if not (self.is_requested(request) and (await request.auser()).is_staff):  # type: ignore[union-attr]
+            return await self.get_response(request)
+        # Records everything the event loop runs until the response is ready, see above.
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            response = await self.get_response(request)
+        finally:
+            profiler.disable()
+        return self.save(request, response, profiler)
+
+    @staticmethod
+    def is_requested(request: HttpRequest) -> bool:
+        return settings.PROFILING_ENABLED and "1" in (
+            request.headers.get(PROFILE_HEADER), request.GET.get(PROFILE_PARAMETER)
+        )
+
+    @staticmethod
+    def save(request: HttpRequest, response: HttpResponse, profiler: cProfile.Profile) -> HttpResponse:
+        view_name = request.resolver_match.view_name if request.resolver_match else "unresolved"
+        directory = Path(settings.PROFILING_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        filename = (
+            f"{timezone.localtime():{TIMESTAMP_FORMAT}}-{view_name.replace(':', '+')}-{uuid.uuid4().hex[:8]}.prof"
+        )
+        profiler.dump_stats(directory / filename)
+        response[PROFILE_HEADER] = filename
+        return response
+
+
+class ProfileFile(NamedTuple):
+    path: Path
+    created_at: datetime
+    view_name: str
+
+
+def profile_files(
+    directory: Path | str, view_name: str | None = None, since: datetime | None = None
+) -> list[ProfileFile]:
+    """
+    The profiles stored by ``ProfilingMiddleware``, optionally of one view or recent ones only.
+    """
+    files = []
+    for path in sorted(Path(directory).glob("*.prof")):
+        timestamp, _, rest = path.stem.partition("-")
+        name = rest.rpartition("-")[0].replace("+", ":")
+        try:
+            created_at = timezone.make_aware(datetime.strptime(timestamp, TIMESTAMP_FORMAT))
+        except ValueError:
+            continue
+        if (view_name is None or name == view_name) and (since is None or created_at >= since):
+            files.append(ProfileFile(path, created_at, name))
+    return files
+
+
+class FunctionStats(NamedTuple):
+    function: str
+    calls: int
+    own_time: float
+    cumulative_time: float
+
+
+def top_functions(paths: Iterable[Path], sort: str = "cumulative", limit: int = 30) -> list[FunctionStats]:
+    """
+    Merge pstats dumps and return the functions with the most ``cumulative`` or ``own`` time.
+    """
+    files = [str(path) for path in paths]
+    if not files:
+        return []
+    stats = pstats.Stats(*files)
+    entries = stats.stats.items()  # type: ignore[attr-defined]
+    rows = [
+        FunctionStats(f"{filename}:{line}({function})", calls, own_time, cumulative_time)
+        for (filename, line, function), (_, calls, own_time, cumulative_time, _) in entries
+    ]
+    key = (lambda row: row.own_time) if sort == "own" else (lambda row: row.cumulative_time)
+    return sorted(rows, key=key, reverse=True)[:limit]
@@ -0,0 +1,128 @@
+"""
+Building blocks of the database-backed queues (``apps.jobs`` and ``apps.outbox``): claiming
+due rows under a lease, retry backoff and the worker loop their commands run.
+"""
+import random
+import signal
+import threading
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from datetime import timedelta
+from typing import Any, Generic, TypeVar
+
+from django.db import close_old_connections, models, transaction
+from django.db.models import F
+
+M = TypeVar("M", bound=models.Model)
+
+
+def claim_rows(queryset: models.QuerySet[M], batch_size: int, **updates: Any) -> list[M]:
+    """
+    Lock up to ``batch_size`` rows of the ordered ``queryset``, skipping rows other workers
+    hold, and count an attempt on each while applying ``updates`` (typically their lease).
+    """
+    with transaction.atomic():
+        rows = list(queryset.select_for_update(skip_locked=True)[:batch_size])
+        if rows:
+            queryset.model._default_manager.filter(pk__in=[row.pk for row in rows]).update(
+                attempts=F("attempts") + 1,
+                **updates
+            )
+    for row in rows:
+        for name, value in updates.items():
+            setattr(row, name, value)
+        row.attempts += 1  # type: ignore[attr-defined]
+    return rows
+
+
+def backoff(retry_delay: timedelta, attempts: int) -> timedelta:
+    """
+    Exponential delay before retrying a row that failed ``attempts`` times; the jitter spreads
+    the retries of rows that failed together, e.g. during an SMTP outage.
+    """
+    return retry_delay * 2 ** (attempts - 1) * random.uniform(0.5, 1)
+
+
+class QueueWorker(Generic[M]):
+    """
+    Run claimed rows on a bounded pool and record their outcome.
+
+    ``run_forever()`` claims again as soon as a row finishes, so one slow row does not hold
+    back the free slots. Subclasses implement ``claim()``, ``submit()`` and ``finish()``.
+    """
+    thread_name_prefix = "queue"
+
+    def __init__(self, concurrency: int, lease: timedelta, retry_delay: timedelta):
+        self.concurrency = concurrency
+        self.lease = lease
+        self.retry_delay = retry_delay
+        self._executor: Executor | None = None
+
+    @property
+    def capacity(self) -> int:
+        """
+        Rows claimed at once; more than ``concurrency`` wait in the pool under their lease.
+        """
+        return self.concurrency
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix=self.thread_name_prefix
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def claim(self, limit: int) -> list[M]:
+        raise NotImplementedError
+
+    def submit(self, row: M) -> Future:
+        raise NotImplementedError
+
+    def finish(self, row: M, result: Any) -> None:
+        raise NotImplementedError
+
+    def run_once(self) -> int:
+        """
+        Run one batch of due rows and wait for all of them.
+        """
+        rows = self.claim(self.capacity)
+        futures = [self.submit(row) for row in rows]
+        for row, future in zip(rows, futures, strict=True):
+            self.finish(row, future.result())
+        return len(rows)
+
+    def run_forever(self, poll_interval: float = 1.0, stop: threading.Event | None = None) -> None:
+        stop = stop or threading.Event()
+        in_flight: dict[Future, M] = {}
+        try:
+            while not stop.is_set():
+                close_old_connections()
+                if len(in_flight) < self.capacity:
+                    for row in self.claim(self.capacity - len(in_flight)):
+                        in_flight[self.submit(row)] = row
+                if not in_flight:
+                    stop.wait(poll_interval)
+                    continue
+                done, _ = wait(in_flight, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self.finish(in_flight.pop(future), future.result())
+            # Record the rows already claimed rather than leaving them to their lease.
+            for future in wait(in_flight).done:
+                self.finish(in_flight.pop(future), future.result())
+        finally:
+            self.shutdown()
+
+
+def run_until_signalled(worker: QueueWorker, poll_interval: float) -> None:
+    """
+    Run ``worker`` until SIGTERM or SIGINT, then let it finish the rows it holds.
+    """
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    worker.run_forever(poll_interval=poll_interval, stop=stop)
@@ -0,0 +1,64 @@
+import csv
+import json
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+
+class Echo:
+    """
+    File-like object whose ``write()`` hands the value back, so ``csv.writer`` can feed a generator.
+    """
+    def write(self, value: str) -> str:
+        return value
+
+
+def csv_chunks(header: Sequence[str], rows: Iterable[Sequence[Any]], rows_per_chunk: int = 500) -> Iterator[str]:
+    """
+    Encode rows as CSV lazily, grouping them so the server does not flush one line at a time.
+    """
+    writer = csv.writer(Echo())
+    chunk = [writer.writerow(header)]
+    for row in rows:
+        chunk.append(writer.writerow(row))
+        if len(chunk) >= rows_per_chunk:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+def ndjson_chunks(rows: Iterable[Mapping[str, Any]], rows_per_chunk: int = 500) -> Iterator[str]:
+    """
+    Encode rows as newline-delimited JSON lazily, grouped like ``csv_chunks()``.
+    """
+    chunk = []
+    for row in rows:
+        chunk.append(json.dumps(row, cls=DjangoJSONEncoder) + "\n")
+        if len(chunk) >= rows_per_chunk:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+def streaming_csv_response(
+    filename: str, header: Sequence[str], rows: Iterable[Sequence[Any]]
+) -> StreamingHttpResponse:
+    """
+    Stream rows as a CSV attachment; pair with ``QuerySet.iterator()`` to keep memory flat.
+    """
+    response = StreamingHttpResponse(csv_chunks(header, rows), content_type="text/csv; charset=utf-8")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+def streaming_ndjson_response(filename: str, rows: Iterable[Mapping[str, Any]]) -> StreamingHttpResponse:
+    """
+    Stream rows as a newline-delimited JSON attachment.
+    """
+    response = StreamingHttpResponse(ndjson_chunks(rows), content_type="application/x-ndjson")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
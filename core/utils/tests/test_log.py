@@ -0,0 +1,140 @@
+import json
+import logging
+import sys
+from unittest import mock
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+from utils.log.filters import RequestContextFilter, SamplingFilter, log_context, update_log_context
+from utils.log.formatters import JsonFormatter
+from utils.log.handlers import QueueHandler
+from utils.log.middleware import RequestLogContextMiddleware
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def make_record(level: int = logging.INFO, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("apps.test", level, __file__, 1, "hello %s", ("world",), None)
+    record.__dict__.update(extra)
+    return record
+
+
+class QueueHandlerTest(SimpleTestCase):
+    def setUp(self):
+        self.target = CollectingHandler()
+        self.errors = CollectingHandler(logging.ERROR)
+        self.handler = QueueHandler(handlers=["target", "errors"])
+        self.addCleanup(self.handler.close)
+
+    def test_listener_runs_the_targets(self):
+        self.handler.start({"target": self.target, "errors": self.errors})
+
+        self.handler.handle(make_record())
+        self.handler.handle(make_record(logging.ERROR))
+        self.handler.stop()
+
+        self.assertEqual([record.getMessage() for record in self.target.records], ["hello world", "hello world"])
+        self.assertEqual([record.levelno for record in self.errors.records], [logging.ERROR])
+
+    def test_listener_survives_a_failing_target(self):
+        failing = CollectingHandler()
+        failing.emit = mock.Mock(side_effect=AttributeError("outbox"))  # type: ignore[method-assign]
+        handler = QueueHandler(handlers=["failing", "target"])
+        self.addCleanup(handler.close)
+        handler.start({"failing": failing, "target": self.target})
+
+        with mock.patch.object(failing, "handleError") as handle_error:
+            handler.handle(make_record())
+            handler.handle(make_record())
+            handler.stop()
+
+        self.assertEqual(handle_error.call_count, 2)
+        self.assertEqual(len(self.target.records), 2)
+
+    def test_records_are_not_formatted_in_the_logging_thread(self):
+        formatter = mock.Mock(wraps=logging.Formatter())
+        self.handler.setFormatter(formatter)
+        record = make_record()
+
+        prepared = self.handler.prepare(record)
+
+        formatter.format.assert_not_called()
+        self.assertEqual((prepared.msg, prepared.args), ("hello world", None))
+        self.assertIsNot(prepared, record)
+
+    def test_full_queue_drops_records(self):
+        handler = QueueHandler(handlers=[], maxsize=1)
+
+        handler.handle(make_record())
+        handler.handle(make_record())
+
+        self.assertEqual(handler.dropped, 1)
+
+
+class RequestContextTest(SimpleTestCase):
+    def test_context_is_added_to_records(self):
+        record = make_record()
+        with log_context("abc123"):
+            update_log_context(view="cinema:index")
+            RequestContextFilter().filter(record)
+        self.assertEqual((record.request_id, record.view), ("abc123", "cinema:index"))
+
+        outside = make_record()
+        RequestContextFilter().filter(outside)
+        self.assertEqual((outside.request_id, outside.view), ("-", "-"))
+
+    def test_middleware_tags_records_and_echoes_the_id(self):
+        seen = {}
+
+        def view(request):
+            record = make_record()
+            RequestContextFilter().filter(record)
+            seen["request_id"] = record.request_id
+            return HttpResponse()
+
+        middleware = RequestLogContextMiddleware(view)
+        response = middleware(RequestFactory().get("/", HTTP_X_REQUEST_ID="proxy-id-1234"))
+        generated = middleware(RequestFactory().get("/", HTTP_X_REQUEST_ID="bad id"))
+
+        self.assertEqual(seen["request_id"], generated["X-Request-ID"])
+        self.assertEqual(response["X-Request-ID"], "proxy-id-1234")
+        self.assertEqual(len(generated["X-Request-ID"]), 32)
+
+    def test_sampled_server_records_reach_the_queue(self):
+        logger = logging.getLogger("django.server")
+        [handler] = [handler for handler in logger.handlers if isinstance(handler, QueueHandler)]
+
+        with mock.patch.object(handler, "enqueue") as enqueue, mock.patch("random.random", side_effect=[0.05, 0.5]):
+            logger.info("GET /cinema/ 200")
+            logger.info("GET /cinema/ 200")
+
+        self.assertEqual(enqueue.call_count, 1)
+
+    def test_sampling_keeps_warnings(self):
+        sampler = SamplingFilter(rate=0, level="WARNING")
+        self.assertFalse(sampler.filter(make_record(logging.INFO)))
+        self.assertTrue(sampler.filter(make_record(logging.WARNING)))
+
+
+class JsonFormatterTest(SimpleTestCase):
+    def test_record_is_one_json_object(self):
+        record = make_record(request_id="abc123", view="cinema:index", showtime_id=4)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record.exc_info = sys.exc_info()
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(entry["message"], "hello world")
+        self.assertEqual(entry["request_id"], "abc123")
+        self.assertEqual(entry["view"], "cinema:index")
+        self.assertEqual(entry["showtime_id"], 4)
+        self.assertIn("ValueError: boom", entry["exception"])
@@ -0,0 +1,80 @@
+from unittest import mock
+
+from apps.cinema.services import ReservationService
+from apps.cinema.tests.factories import CinemaHallFactory, ShowtimeFactory
+from apps.user.tests.factories import UserFactory
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from utils.cache.pages import CSRF_PLACEHOLDER, PageCache
+
+
+class AnonymousPageCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.hall = CinemaHallFactory(rows=2, seats_per_row=2)
+        self.showtime = ShowtimeFactory(hall=self.hall)
+        self.url = reverse("cinema:hall_showtimes", args=[self.hall.id])
+
+    def test_repeat_visit_is_served_from_cache(self):
+        self.assertEqual(self.client.get(self.url)["X-Page-Cache"], "MISS")
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response["X-Page-Cache"], "HIT")
+        self.assertContains(response, self.showtime.movie.title)
+
+    def test_csrf_token_is_filled_in_per_visitor(self):
+        self.client.get(self.url)
+        response = self.client.get(self.url)
+
+        self.assertNotContains(response, CSRF_PLACEHOLDER)
+        self.assertContains(response, 'name="csrfmiddlewaretoken" value="')
+        self.assertIn("csrftoken", response.cookies)
+        self.assertIn("private", response["Cache-Control"])
+        self.assertIn("Cookie", response["Vary"])
+
+    def test_pages_without_csrf_token_are_public(self):
+        response = self.client.get(reverse("cinema:home"))
+        self.assertIn("public", response["Cache-Control"])
+        self.assertIn("s-maxage=60", response["Cache-Control"])
+
+    def test_authenticated_users_are_not_cached(self):
+        self.client.force_login(UserFactory())
+        response = self.client.get(self.url)
+        self.assertNotIn("X-Page-Cache", response)
+
+    def test_reservation_invalidates_the_hall_page(self):
+        self.client.get(self.url)
+        seat = self.hall.seats.first()
+        with self.captureOnCommitCallbacks(execute=True):
+            ReservationService.create_reservation(UserFactory(), self.showtime, [seat.id])
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response["X-Page-Cache"], "MISS")
+        self.assertEqual(response.context["showtimes"][0].remaining_capacity, 3)
+
+    @override_settings(PAGE_CACHE_ENABLED=False)
+    def test_disabled_page_cache_renders_every_visit(self):
+        self.client.get(self.url)
+        response = self.client.get(self.url)
+
+        self.assertNotIn("X-Page-Cache", response)
+        self.assertContains(response, self.showtime.movie.title)
+
+    @override_settings(PAGE_CACHE_VERSION_TIMEOUT=3600)
+    def test_namespace_versions_expire(self):
+        with mock.patch.object(cache, "add", wraps=cache.add) as add:
+            self.client.get(self.url)
+
+        timeouts = {call.args[2] for call in add.call_args_list if call.args[0].startswith("page-version:")}
+        self.assertEqual(timeouts, {3600})
+
+    @override_settings(PAGE_CACHE_TIMEOUT=0, PAGE_CACHE_LOCK_WAIT=0)
+    def test_stale_copy_is_served_while_another_worker_rebuilds(self):
+        self.client.get(self.url)
+        with mock.patch.object(PageCache, "acquire", return_value=False):
+            self.assertEqual(self.client.get(self.url)["X-Page-Cache"], "STALE")
+
+            cache.clear()
+            self.assertEqual(self.client.get(self.url)["X-Page-Cache"], "MISS")
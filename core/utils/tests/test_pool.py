@@ -0,0 +1,41 @@
+from unittest import mock
+
+from apps.user.models import User
+from django.db import DatabaseError
+from django.test import TestCase
+from django.urls import reverse
+from utils.db.pool import pool_stats
+
+
+class PoolStatsTest(TestCase):
+    def test_aliases_without_pool_are_skipped(self):
+        self.assertEqual(pool_stats(), {})
+
+    def test_pool_counters_are_reported(self):
+        pool = mock.Mock()
+        pool.get_stats.return_value = {"pool_size": 4, "requests_num": 10, "requests_errors": 1}
+        with mock.patch("django.db.backends.sqlite3.base.DatabaseWrapper.pool", pool, create=True):
+            stats = pool_stats()
+        self.assertEqual(stats["default"]["pool_size"], 4)
+        self.assertEqual(stats["default"]["checkouts"], 10)
+        self.assertEqual(stats["default"]["timeouts"], 1)
+
+
+class HealthCheckViewTest(TestCase):
+    def test_anonymous_gets_status_only(self):
+        response = self.client.get(reverse("health"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"status": "ok"})
+
+    def test_staff_gets_pool_stats(self):
+        admin = User.objects.create_superuser(email="admin@example.com", password="password123")  # noqa: S106
+        self.client.force_login(admin)
+        response = self.client.get(reverse("health"))
+        self.assertIn("pools", response.json())
+        self.assertIn("transactions", response.json())
+
+    def test_database_failure_returns_503(self):
+        with mock.patch("django.db.backends.utils.CursorWrapper.execute", side_effect=DatabaseError):
+            response = self.client.get(reverse("health"))
+        self.assertEqual(response.status_code, 503)
+
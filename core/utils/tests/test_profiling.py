@@ -0,0 +1,37 @@
+import tempfile
+from datetime import timedelta
+
+from apps.user.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from utils.profiling import profile_files, top_functions
+
+
+class ProfilingMiddlewareTest(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.enterContext(override_settings(PROFILING_DIR=self.directory))
+
+    def test_staff_requests_are_profiled(self):
+        admin = User.objects.create_superuser(email="admin@example.com", password="password123")  # noqa: S106
+        self.client.force_login(admin)
+
+        response = self.client.get(reverse("cinema:home"), headers={"X-Profile": "1"})
+        self.client.get(reverse("cinema:schedule"), {"_profile": "1"})
+
+        files = profile_files(self.directory)
+        self.assertEqual([file.path.name for file in files if file.view_name == "cinema:home"], [response["X-Profile"]])
+        self.assertEqual(sorted(file.view_name for file in files), ["cinema:home", "cinema:schedule"])
+        self.assertEqual(profile_files(self.directory, since=timezone.now() + timedelta(minutes=1)), [])
+        rows = top_functions([file.path for file in files], limit=5)
+        self.assertEqual(len(rows), 5)
+        self.assertGreaterEqual(rows[0].cumulative_time, rows[-1].cumulative_time)
+
+    def test_other_requests_are_not_profiled(self):
+        response = self.client.get(reverse("cinema:home"), headers={"X-Profile": "1"})
+
+        self.assertNotIn("X-Profile", response)
+        self.assertEqual(profile_files(self.directory), [])
@@ -0,0 +1,103 @@
+import os
+import threading
+from io import StringIO
+from unittest import mock
+
+from apps.cinema.models import Movie
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from utils.db import queries
+from utils.db.queries import WORKERS_KEY, collect_query_stats, fingerprint, flush_query_stats, reset_query_stats
+from utils.log.filters import log_context, update_log_context
+
+
+class FingerprintTest(TestCase):
+    def test_literals_and_in_lists_are_normalized(self):
+        self.assertEqual(
+            fingerprint("SELECT * FROM t WHERE a = 'x''y' AND b IN (%s, %s,  %s) AND c > 10.5"),
+            fingerprint("SELECT  * FROM t\nWHERE a = 'z' AND b IN (%s) AND c > 3")
+        )
+        self.assertEqual(fingerprint('SELECT "t1"."id" FROM t1 LIMIT 21'), 'SELECT "t1"."id" FROM t1 LIMIT ?')
+
+
+class QueryStatsTest(TestCase):
+    def setUp(self):
+        reset_query_stats()
+        flush_query_stats()
+        self.addCleanup(cache.clear)
+
+    def test_queries_are_counted_per_view_and_fingerprint(self):
+        with log_context("abc123"):
+            update_log_context(view="cinema:home")
+            list(Movie.objects.filter(pk__in=[1, 2]))
+            list(Movie.objects.filter(pk__in=[3]))
+
+        report = collect_query_stats()
+
+        stats = [stat for stat in report.stats if stat.view == "cinema:home"]
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(stats[0].count, 2)
+        self.assertIn("IN (...)", stats[0].fingerprint)
+        self.assertGreaterEqual(stats[0].total, stats[0].max)
+
+    @override_settings(DB_SLOW_QUERY_MS=0)
+    def test_slow_queries_keep_their_stack(self):
+        list(Movie.objects.all())
+
+        slow_query = collect_query_stats().slow_queries[0]
+
+        self.assertTrue(any("test_queries.py" in frame for frame in slow_query.stack))
+
+    @override_settings(DB_QUERY_STATS_FLUSH_SECONDS=0)
+    def test_queries_do_not_publish_the_stats(self):
+        with mock.patch("utils.db.queries.flush_query_stats") as flush_query_stats:
+            list(Movie.objects.all())
+
+        flush_query_stats.assert_not_called()
+
+    def test_workers_are_merged_and_reset(self):
+        list(Movie.objects.all())
+        cache.set("db-query-stats:other:1", {"stats": [("-", "SELECT ?", 3, 0.5, 0.3)], "slow": []})
+        cache.set(WORKERS_KEY, [*cache.get(WORKERS_KEY), "db-query-stats:other:1"])
+
+        report = collect_query_stats()
+
+        self.assertEqual(report.workers, 2)
+        self.assertIn(("-", "SELECT ?", 3), [(stat.view, stat.fingerprint, stat.count) for stat in report.stats])
+
+        reset_query_stats()
+        self.assertEqual(collect_query_stats().workers, 1)
+
+    def test_expired_workers_are_pruned(self):
+        cache.set(WORKERS_KEY, [*cache.get(WORKERS_KEY), "db-query-stats:recycled:1"])
+
+        flush_query_stats()
+
+        self.assertEqual(cache.get(WORKERS_KEY), [queries.worker_key()])
+
+    def test_forked_child_gets_a_fresh_lock_and_counters(self):
+        list(Movie.objects.all())
+        held = threading.Lock()
+        held.acquire()
+
+        # patch.multiple puts the parent's lock and flusher back afterwards.
+        with mock.patch.multiple(queries, _lock=held, _flusher_pid=os.getpid(), _stop_flusher=threading.Event()):
+            queries._reset_after_fork()
+
+            self.assertFalse(queries._lock.locked())
+            self.assertEqual(queries._stats, {})
+            self.assertEqual(queries._flusher_pid, 0)
+
+    def test_report_command(self):
+        with log_context("abc123"):
+            update_log_context(view="cinema:home")
+            list(Movie.objects.all())
+
+        output = StringIO()
+        call_command("query_report", view="cinema:home", reset=True, stdout=output)
+
+        self.assertIn("cinema:home", output.getvalue())
+        self.assertIn('FROM "cinema_movie"', output.getvalue())
+        self.assertIn("Query stats cleared.", output.getvalue())
+        self.assertIn("local to this process", output.getvalue())
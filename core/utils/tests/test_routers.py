@@ -0,0 +1,87 @@
+from unittest import mock
+
+from apps.cinema.models import Showtime
+from apps.cinema.tests.factories import CinemaHallFactory, ShowtimeFactory, UserFactory
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from utils.db import routers
+from utils.db.middleware import ReplicaRoutingMiddleware
+from utils.db.routers import PrimaryReplicaRouter, read_from_replicas, track_primary_writes
+
+
+@override_settings(DATABASE_REPLICAS=["replica_1"])
+class PrimaryReplicaRouterTest(TestCase):
+    def setUp(self):
+        self.router = PrimaryReplicaRouter()
+
+    def test_reads_use_primary_by_default(self):
+        self.assertEqual(self.router.db_for_read(Showtime), DEFAULT_DB_ALIAS)
+
+    def test_reads_use_replica_when_enabled(self):
+        # TestCase wraps every test in an atomic block, so step outside it for this check.
+        connection = transaction.get_connection()
+        in_atomic_block, connection.in_atomic_block = connection.in_atomic_block, False
+        try:
+            with read_from_replicas():
+                self.assertEqual(self.router.db_for_read(Showtime), "replica_1")
+        finally:
+            connection.in_atomic_block = in_atomic_block
+
+    def test_reads_inside_atomic_block_use_primary(self):
+        with read_from_replicas():
+            self.assertEqual(self.router.db_for_read(Showtime), DEFAULT_DB_ALIAS)
+
+    def test_writes_use_primary_and_are_tracked(self):
+        with track_primary_writes() as writes, read_from_replicas():
+            self.assertEqual(self.router.db_for_write(Showtime), DEFAULT_DB_ALIAS)
+        self.assertTrue(writes["primary"])
+
+    def test_replicas_are_never_migrated(self):
+        self.assertFalse(self.router.allow_migrate("replica_1", "cinema"))
+        self.assertIsNone(self.router.allow_migrate(DEFAULT_DB_ALIAS, "cinema"))
+
+
+@override_settings(DATABASE_REPLICAS=["replica_1"])
+class ReplicaRoutingMiddlewareTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.hall = CinemaHallFactory()
+        self.showtime = ShowtimeFactory(hall=self.hall)
+        self.user = UserFactory()
+        self.seen: list[bool] = []
+        original = PrimaryReplicaRouter.db_for_read
+
+        def db_for_read(router, model, **hints):
+            self.seen.append(getattr(routers._state, "replicas_enabled", False))
+            return original(router, model, **hints)
+
+        patcher = mock.patch.object(PrimaryReplicaRouter, "db_for_read", db_for_read)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_read_only_view_enables_replica_reads(self):
+        self.client.get(reverse("cinema:hall_showtimes", kwargs={"hall_id": self.hall.id}))
+        self.assertTrue(self.seen)
+        self.assertTrue(all(self.seen))
+        self.assertFalse(getattr(routers._state, "replicas_enabled", False))
+
+    async def test_async_request_enables_replica_reads(self):
+        await self.async_client.get(reverse("cinema:hall_showtimes", kwargs={"hall_id": self.hall.id}))
+        self.assertTrue(self.seen)
+        self.assertTrue(all(self.seen))
+
+    def test_write_sets_sticky_cookie_and_following_reads_use_primary(self):
+        self.client.force_login(self.user)
+        seat = self.hall.seats.first()
+        response = self.client.post(
+            reverse("cinema:reserve_seats", kwargs={"showtime_id": self.showtime.id}),
+            {"seat_ids": str(seat.id)},
+        )
+        self.assertIn(ReplicaRoutingMiddleware.cookie_name, response.cookies)
+
+        self.seen.clear()
+        self.client.get(reverse("cinema:hall_showtimes", kwargs={"hall_id": self.hall.id}))
+        self.assertTrue(self.seen)
+        self.assertFalse(any(self.seen))
@@ -0,0 +1,84 @@
+from unittest import mock
+
+from django.db import OperationalError, connection, transaction
+from django.test import TransactionTestCase, override_settings
+from utils.db import transactions
+from utils.db.transactions import retry_atomic, transaction_metrics
+
+
+class DriverError(Exception):
+    def __init__(self, sqlstate):
+        super().__init__(sqlstate)
+        self.sqlstate = sqlstate
+
+
+def db_error(sqlstate):
+    error = OperationalError("could not serialize access")
+    error.__cause__ = DriverError(sqlstate)
+    return error
+
+
+@override_settings(TRANSACTION_RETRY_BASE_DELAY=0, TRANSACTION_RETRY_MAX_DELAY=0)
+class RetryAtomicTest(TransactionTestCase):
+    def setUp(self):
+        transactions._metrics.clear()
+
+    def test_runs_in_its_own_transaction(self):
+        @retry_atomic()
+        def work():
+            return connection.in_atomic_block
+
+        self.assertTrue(work())
+
+    def test_retries_serialization_failures(self):
+        calls = mock.Mock(side_effect=[db_error("40001"), db_error("40P01"), "done"])
+
+        @retry_atomic()
+        def work():
+            return calls()
+
+        self.assertEqual(work(), "done")
+        self.assertEqual(calls.call_count, 3)
+        self.assertEqual(transaction_metrics(), {"retries": 2, "retried_transactions": 1})
+
+    def test_gives_up_after_configured_attempts(self):
+        calls = mock.Mock(side_effect=db_error("40001"))
+
+        @retry_atomic(attempts=2)
+        def work():
+            return calls()
+
+        with self.assertRaises(OperationalError):
+            work()
+        self.assertEqual(calls.call_count, 2)
+        self.assertEqual(transaction_metrics()["exhausted"], 1)
+
+    def test_other_errors_are_not_retried(self):
+        calls = mock.Mock(side_effect=db_error("23505"))
+
+        @retry_atomic()
+        def work():
+            return calls()
+
+        with self.assertRaises(OperationalError):
+            work()
+        self.assertEqual(calls.call_count, 1)
+
+    def test_nested_call_is_not_retried(self):
+        calls = mock.Mock(side_effect=db_error("40001"))
+
+        @retry_atomic()
+        def work():
+            return calls()
+
+        with self.assertRaises(OperationalError), transaction.atomic():
+            work()
+        self.assertEqual(calls.call_count, 1)
+
+    def test_unknown_isolation_level_is_rejected(self):
+        @retry_atomic(isolation="read uncommitted; drop table")
+        def work():
+            return None
+
+        with self.assertRaises(ValueError):
+            work()